@@ -0,0 +1,164 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Shared setup and synthetic Gitea API responses for the benchmark scripts."""
+from typing import Any, Callable, Dict, List
+import argparse
+import json
+import os
+import statistics
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_args(description: str, **defaults: int) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--root", default=ROOT,
+                        help="checkout to benchmark, e.g. a git worktree of an older commit")
+    for name, default in defaults.items():
+        parser.add_argument(f"--{name}", type=int, default=default)
+    return parser.parse_args()
+
+
+def import_giteapy(root: str = ROOT) -> Any:
+    """
+    Import giteapy as a top-level package, so the plugin package and maubot
+    are not needed. giteapy itself needs six, certifi and aiohttp.
+    """
+    sys.path.insert(0, os.path.join(root, "gitea_matrix"))
+    import giteapy
+    return giteapy
+
+
+class Response:
+    """The part of rest.RESTResponse that ApiClient.deserialize() reads."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+
+def timestamp(i: int) -> str:
+    # Gitea sends RFC 3339 timestamps in the server's time zone.
+    return f"2023-{i % 12 + 1:02d}-{i % 28 + 1:02d}T{i % 24:02d}:{i % 60:02d}:{i * 7 % 60:02d}+02:00"
+
+
+def user(i: int) -> Dict[str, Any]:
+    return {
+        "id": i,
+        "login": f"user{i}",
+        "full_name": f"User {i}",
+        "email": f"user{i}@example.com",
+        "avatar_url": f"https://gitea.example.com/avatars/{i:032x}",
+        "language": "en-US",
+        "is_admin": False,
+        "last_login": timestamp(i),
+        "created": timestamp(i + 1),
+        "username": f"user{i}",
+    }
+
+
+def repository(i: int) -> Dict[str, Any]:
+    name = f"project-{i}"
+    owner = user(i % 50)
+    url = f"https://gitea.example.com/{owner['login']}/{name}"
+    return {
+        "id": i,
+        "owner": owner,
+        "name": name,
+        "full_name": f"{owner['login']}/{name}",
+        "description": f"Repository number {i} of the benchmark",
+        "empty": False,
+        "private": i % 3 == 0,
+        "fork": False,
+        "template": False,
+        "parent": None,
+        "mirror": False,
+        "size": 1024 + i,
+        "html_url": url,
+        "ssh_url": f"git@gitea.example.com:{owner['login']}/{name}.git",
+        "clone_url": f"{url}.git",
+        "original_url": "",
+        "website": "",
+        "stars_count": i % 40,
+        "forks_count": i % 7,
+        "watchers_count": i % 11,
+        "open_issues_count": i % 23,
+        "open_pr_counter": i % 5,
+        "release_counter": i % 3,
+        "default_branch": "main",
+        "archived": False,
+        "created_at": timestamp(i),
+        "updated_at": timestamp(i + 2),
+        "permissions": {"admin": True, "push": True, "pull": True},
+        "has_issues": True,
+        "internal_tracker": {"enable_time_tracker": True,
+                             "allow_only_contributors_to_track_time": True,
+                             "enable_issue_dependencies": True},
+        "has_wiki": True,
+        "has_pull_requests": True,
+        "ignore_whitespace_conflicts": False,
+        "allow_merge_commits": True,
+        "allow_rebase": True,
+        "allow_rebase_explicit": True,
+        "allow_squash_merge": True,
+        "avatar_url": "",
+    }
+
+
+def issue(i: int) -> Dict[str, Any]:
+    assignee = user(i % 10)
+    return {
+        "id": 1000 + i,
+        "url": f"https://gitea.example.com/api/v1/repos/owner/project/issues/{i}",
+        "html_url": f"https://gitea.example.com/owner/project/issues/{i}",
+        "number": i,
+        "user": user(i % 50),
+        "original_author": "",
+        "original_author_id": 0,
+        "title": f"Issue {i}: something does not work as expected",
+        "body": "Steps to reproduce:\n\n1. Open the page\n2. Click the button\n\n" * 3,
+        "labels": [{"id": n, "name": f"label-{n}", "color": "e11d21",
+                    "description": "", "url": ""} for n in range(i % 3)],
+        "milestone": None if i % 2 else {
+            "id": 7, "title": "v1.0", "description": "", "state": "open",
+            "open_issues": 12, "closed_issues": 30, "closed_at": None,
+            "due_on": timestamp(100)},
+        "assignee": assignee,
+        "assignees": [assignee],
+        "state": "open" if i % 4 else "closed",
+        "comments": i % 9,
+        "created_at": timestamp(i),
+        "updated_at": timestamp(i + 3),
+        "closed_at": None if i % 4 else timestamp(i + 5),
+        "due_date": None,
+        "pull_request": None,
+        "repository": {"id": 1, "name": "project", "owner": "owner", "full_name": "owner/project"},
+    }
+
+
+def listing(item: Callable[[int], Dict[str, Any]], count: int) -> bytes:
+    return json.dumps([item(i) for i in range(count)]).encode("utf-8")
+
+
+def measure(func: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """Median seconds per call."""
+    return statistics.median(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(rows: List[List[str]]) -> None:
+    widths = [max(len(row[col]) for row in rows) for col in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
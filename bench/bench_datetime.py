@@ -0,0 +1,59 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Time of parsing the timestamps Gitea sends with the datetime.fromisoformat
+path of ApiClient, compared with dateutil which it replaced. Needs
+python-dateutil for the comparison.
+
+    python bench/bench_datetime.py --count 10000
+"""
+from _common import import_giteapy, measure, parse_args, report, timestamp
+
+FORMATS = (
+    ("offset", timestamp),
+    ("utc", lambda i: timestamp(i)[:-6] + "Z"),
+    ("fraction", lambda i: f"{timestamp(i)[:-6]}.{i * 7919 % 1000000:06d}+01:00"),
+)
+
+
+def main() -> None:
+    args = parse_args(__doc__, count=10000, number=5)
+    giteapy = import_giteapy(args.root)
+    parse = getattr(giteapy.ApiClient, "_ApiClient__deserialize_datatime")
+    try:
+        from dateutil.parser import isoparse, parse as dateutil_parse
+    except ImportError:
+        dateutil_parse = isoparse = None
+        print("python-dateutil is not installed, only timing ApiClient.\n")
+
+    rows = [["format", "parser", "µs/timestamp", "speedup"]]
+    for name, make in FORMATS:
+        values = [make(i) for i in range(args.count)]
+        parsers = [("dateutil.parse", dateutil_parse), ("dateutil.isoparse", isoparse),
+                   ("ApiClient", parse)]
+        parsers = [(label, func) for label, func in parsers if func]
+        if dateutil_parse:
+            assert [parse(value) for value in values] == [dateutil_parse(value) for value in values]
+        baseline = None
+        for label, func in parsers:
+            seconds = measure(lambda: [func(value) for value in values], args.number)
+            baseline = baseline or seconds
+            rows.append([name, label, f"{seconds / args.count * 1e6:.2f}",
+                         f"{baseline / seconds:.1f}x"])
+    report(rows)
+
+
+if __name__ == "__main__":
+    main()
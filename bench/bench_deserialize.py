@@ -0,0 +1,118 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Time and memory of decoding large list[Issue] and list[Repository] responses,
+comparing the compiled deserializers of ApiClient with the generated
+per-value lookups they replaced, and with the raw JSONView mode.
+
+    python bench/bench_deserialize.py --items 500
+"""
+import datetime
+import inspect
+import json
+import re
+import tracemalloc
+
+from _common import Response, import_giteapy, issue, listing, measure, parse_args, report, repository
+
+
+class LegacyDeserializer:
+    """
+    The swagger-codegen deserializer: the type string is parsed and the model
+    looked up again for every value. Dates are parsed like ApiClient does, so
+    only the deserializer differs.
+    """
+
+    def __init__(self, giteapy) -> None:
+        self.models = giteapy.models
+        self.client = giteapy.ApiClient
+        self.parse_datetime = getattr(giteapy.ApiClient, "_ApiClient__deserialize_datatime")
+
+    def deserialize(self, response, klass):
+        return self.__deserialize(json.loads(response.data), klass)
+
+    def __deserialize(self, data, klass):
+        if data is None:
+            return None
+        if type(klass) == str:
+            if klass.startswith('list['):
+                sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
+                return [self.__deserialize(sub_data, sub_kls) for sub_data in data]
+            if klass.startswith('dict('):
+                sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
+                return {k: self.__deserialize(v, sub_kls) for k, v in data.items()}
+            if klass in self.client.NATIVE_TYPES_MAPPING:
+                klass = self.client.NATIVE_TYPES_MAPPING[klass]
+            else:
+                klass = getattr(self.models, klass)
+        if klass in self.client.PRIMITIVE_TYPES:
+            try:
+                return klass(data)
+            except TypeError:
+                return data
+        elif klass == object:
+            return data
+        elif klass == datetime.datetime:
+            return self.parse_datetime(data)
+        return self.__deserialize_model(data, klass)
+
+    def __deserialize_model(self, data, klass):
+        if not klass.swagger_types and not hasattr(klass, 'get_real_child_model'):
+            return data
+        kwargs = {}
+        for attr, attr_type in klass.swagger_types.items():
+            if klass.attribute_map[attr] in data and isinstance(data, (list, dict)):
+                kwargs[attr] = self.__deserialize(data[klass.attribute_map[attr]], attr_type)
+        return klass(**kwargs)
+
+
+def retained(func):
+    """Bytes still allocated by the result, and the peak while building it."""
+    tracemalloc.start()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def main() -> None:
+    args = parse_args(__doc__, items=500, number=5)
+    giteapy = import_giteapy(args.root)
+    # No requests are made, so the client does not need a REST client.
+    client = giteapy.ApiClient(rest_client=object())
+    legacy = LegacyDeserializer(giteapy)
+    modes = [("legacy", lambda resp, kind: legacy.deserialize(resp, kind)),
+             ("compiled", client.deserialize)]
+    if "raw" in inspect.signature(client.deserialize).parameters:
+        modes.append(("raw", lambda resp, kind: client.deserialize(resp, kind, raw=True)))
+
+    rows = [["type", "mode", "ms/call", "speedup", "retained KiB", "peak KiB"]]
+    for kind, item in (("list[Issue]", issue), ("list[Repository]", repository)):
+        resp = Response(listing(item, args.items))
+        baseline = None
+        for name, func in modes:
+            func(resp, kind)  # Fill the deserializer cache.
+            seconds = measure(lambda: func(resp, kind), args.number)
+            baseline = baseline or seconds
+            current, peak = retained(lambda: func(resp, kind))
+            rows.append([kind, name, f"{seconds * 1000:.2f}", f"{baseline / seconds:.1f}x",
+                         f"{current / 1024:.0f}", f"{peak / 1024:.0f}"])
+    print(f"{args.items} items per response")
+    report(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Import time of giteapy in fresh interpreters: lazy, as the plugin imports it,
+with the apis the bot uses, and eager, importing every api and model module
+like the generated __init__ did. The dependencies row is the time spent in
+aiohttp, certifi and six, which is included in the others.
+
+    python bench/bench_import.py --runs 20
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+from _common import parse_args, report
+
+SCRIPT = """
+import importlib, sys, time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+import aiohttp, certifi, six
+names = {names!r}
+if names is not None:
+    import giteapy
+for name in names or ():
+    getattr(giteapy, name)
+if {eager!r}:
+    for module in set(getattr(giteapy, "_MODULES", {{}}).values()):
+        importlib.import_module(module, "giteapy")
+print(time.perf_counter() - start, len(sys.modules))
+"""
+
+# names is None to import only the dependencies, which every mode pays for.
+MODES = (
+    ("dependencies", None, False),
+    ("lazy", (), False),
+    ("lazy + bot apis", ("IssueApi", "MiscellaneousApi", "UserApi"), False),
+    ("eager", (), True),
+)
+
+
+def run(path: str, names, eager: bool):
+    code = SCRIPT.format(path=path, names=names, eager=eager)
+    out = subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.PIPE,
+                         universal_newlines=True).stdout
+    seconds, modules = out.split()
+    return float(seconds), int(modules)
+
+
+def main() -> None:
+    args = parse_args(__doc__, runs=20)
+    path = os.path.join(args.root, "gitea_matrix")
+    # Load the files into the OS cache first.
+    run(path, (), True)
+    rows = [["mode", "ms", "modules"]]
+    for name, names, eager in MODES:
+        results = [run(path, names, eager) for _ in range(args.runs)]
+        seconds = statistics.median(seconds for seconds, _ in results)
+        rows.append([name, f"{seconds * 1000:.1f}", str(results[0][1])])
+    report(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Memory held by a decoded listing of many repositories: the decoded JSON, the
+models with __slots__, copies of the models without them, and raw JSONViews.
+
+    python bench/bench_models_memory.py --repositories 10000
+"""
+from contextlib import contextmanager
+import gc
+import inspect
+import json
+import re
+import time
+import tracemalloc
+
+from _common import Response, import_giteapy, listing, parse_args, report, repository
+
+
+@contextmanager
+def unslotted_models(giteapy, root: str):
+    """Replace the root model and the models it contains by copies without __slots__."""
+    models = giteapy.models
+    originals = {}
+    pending = [root]
+    while pending:
+        name = pending.pop()
+        if name in originals:
+            continue
+        cls = originals[name] = getattr(models, name)
+        hidden = set(getattr(cls, "__slots__", ())) | {"__slots__", "__dict__", "__weakref__"}
+        namespace = {key: value for key, value in vars(cls).items() if key not in hidden}
+        setattr(models, name, type(cls.__name__, cls.__bases__, namespace))
+        pending.extend(sub for kind in cls.swagger_types.values()
+                       for sub in re.findall(r"\w+", kind) if sub in models._MODULES)
+    saved = dict(giteapy.ApiClient._deserializers)
+    giteapy.ApiClient._deserializers.clear()
+    try:
+        yield
+    finally:
+        for name, cls in originals.items():
+            setattr(models, name, cls)
+        giteapy.ApiClient._deserializers.clear()
+        giteapy.ApiClient._deserializers.update(saved)
+
+
+def retained(func):
+    """Seconds to build the result and the bytes still allocated by it."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return seconds, current
+
+
+def main() -> None:
+    args = parse_args(__doc__, repositories=10000)
+    giteapy = import_giteapy(args.root)
+    # No requests are made, so the client does not need a REST client.
+    client = giteapy.ApiClient(rest_client=object())
+    resp = Response(listing(repository, args.repositories))
+
+    def models():
+        return client.deserialize(resp, "list[Repository]")
+
+    rows = [["result", "ms", "MiB", "bytes/repository"]]
+
+    def add(name, func):
+        func()  # Fill the deserializer cache.
+        seconds, size = retained(func)
+        rows.append([name, f"{seconds * 1000:.0f}", f"{size / 2 ** 20:.1f}",
+                     f"{size / args.repositories:.0f}"])
+
+    add("decoded JSON", lambda: json.loads(resp.data))
+    add("models", models)
+    with unslotted_models(giteapy, "Repository"):
+        add("models without __slots__", models)
+    if "raw" in inspect.signature(client.deserialize).parameters:
+        add("raw", lambda: client.deserialize(resp, "list[Repository]", raw=True))
+    print(f"{args.repositories} repositories, {len(resp.data) / 2 ** 20:.1f} MiB of JSON")
+    report(rows)
+
+
+if __name__ == "__main__":
+    main()
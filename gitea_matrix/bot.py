@@ -12,44 +12,104 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from typing import List, Set, Type
+from typing import Awaitable, Dict, List, Optional, Set, Type
 from functools import partial
+import asyncio
+import time
 
+from aiohttp import ClientError
 from aiohttp.web import Response, Request
-import asyncio
-from asyncio import Task
 
 from yarl import URL
 
 from . import giteapy as giteapy
-from .giteapy import Configuration as Gtc
+from .giteapy import ApiClient
+from .giteapy.rest import ApiException
 
 from maubot import Plugin, MessageEvent
 from maubot.handlers import command, event, web
-from mautrix.types import EventType, Membership, MessageType, RoomID, StateEvent
+from mautrix.types import (EventID, EventType, Format, Membership, MessageType, RoomID, StateEvent,
+                           TextMessageEventContent)
 from mautrix.util.config import BaseProxyConfig
 
-from .db import Database
+from .db import AuthInfo, Database, HookInfo
 from .config import Config
-from .util import ReposOrAliasArgument, sigil_int, quote_parser, UrlOrAliasArgument, with_gitea_session
+from .crypto import TokenCipher
+from .clients import ClientPool
+from .usercache import UserCache
+from .hookqueue import DeliveryCache, HookQueue
+from .formatters import (HookFormatter, HookMessage, ItemRef, Message, create_formatters,
+                         hook_context)
+from .coalesce import HookCoalescer
+from .sender import RoomSender
+from .filters import FILTER_FIELDS, FILTER_KINDS, FilterCache
+from .payload import get_loads
+from .util import (ReposOrAliasArgument, sigil_int, quote_parser, read_body, UrlOrAliasArgument,
+                   render_markdown, thread_content, verify_signature, with_gitea_session)
 
 from pprint import pprint
 
+# Raised by verify_login() for unreachable servers, invalid URLs (InvalidURL is a
+# ClientError) and timeouts.
+CONNECTION_ERRORS = (ClientError, asyncio.TimeoutError)
+
 
 class GiteaBot(Plugin):
-    task_list: List[Task]
     joined_rooms: Set[RoomID]
+    clients: ClientPool
+    hooks: HookQueue
+    seen_deliveries: DeliveryCache
+    coalescer: HookCoalescer
+    sender: RoomSender
+    filters: FilterCache
+    users: UserCache
+    formatters: Dict[str, HookFormatter]
+    store_tasks: Set[asyncio.Task]
 
     async def start(self) -> None:
         await super().start()
         self.config.load_and_update()
-        self.db = Database(self.database)
+        self.db = Database(self.database, self.loop, TokenCipher(self.config["token_key"]))
+        encrypted = await self.db.encrypt_tokens()
+        if encrypted:
+            self.log.info(f"Encrypted {encrypted} stored access tokens")
         self.joined_rooms = set(await self.client.get_joined_rooms())
-        self.task_list = []
+        self.filters = FilterCache(self.db)
+        self.store_tasks = set()
+        self.users = UserCache(self.db, maxsize=self.config["cache.users"])
+        self.json_loads = get_loads(self.config["webhook.json_backend"])
+        self.formatters = create_formatters(max_commits=self.config["webhook.push_commits"])
+        self.clients = ClientPool(self.loop,
+                                  maxsize=self.config["client.pool_size"],
+                                  max_servers=self.config["client.max_servers"],
+                                  idle_timeout=self.config["client.idle_timeout"])
+        self.clients.start()
+        self.sender = RoomSender(self.loop, self.log,
+                                 rate=self.config["sender.rate"],
+                                 burst=self.config["sender.burst"],
+                                 max_retries=self.config["sender.max_retries"],
+                                 queue_size=self.config["sender.queue_size"])
+        self.coalescer = HookCoalescer(self.loop, self.send_hook_message, self.log,
+                                       window=self.config["webhook.coalesce_window"])
+        self.hooks = HookQueue(self.loop, self.process_hook_01, self.log,
+                               maxsize=self.config["webhook.queue_size"],
+                               worker_count=self.config["webhook.workers"],
+                               db=self.db if self.config["webhook.persist"] else None)
+        await self.hooks.start()
+        self.seen_deliveries = DeliveryCache(
+            maxsize=self.config["webhook.dedup_size"],
+            ttl=self.config["webhook.dedup_ttl"],
+            db=self.db if self.config["webhook.dedup_persist"] else None)
 
     async def stop(self) -> None:
-        if self.task_list:
-            await asyncio.wait(self.task_list, timeout=1)
+        await self.hooks.stop()
+        await self.coalescer.flush_all()
+        await self.sender.stop()
+        await self.hooks.close()
+        if self.store_tasks:
+            await asyncio.wait(list(self.store_tasks))
+        await self.clients.close()
+        self.db.close()
 
     @classmethod
     def get_config_class(cls) -> Type[BaseProxyConfig]:
@@ -74,6 +134,26 @@ class GiteaBot(Plugin):
 
     @web.post("/webhook/r0")
     async def post_handler(self, request: Request) -> Response:
+        if "room" not in request.query:
+            return Response(text="400: Bad request\n"
+                                 "No room specified. Did you forget the '?room=' query parameter?\n",
+                            status=400)
+
+        if request.query["room"] not in self.joined_rooms:
+            return Response(text="403: Forbidden\nThe bot is not in the room. "
+                                 f"Please invite the bot to the room.\n", status=403)
+
+        return await self.accept_hook(request, RoomID(request.query["room"]))
+
+    @web.post("/webhook/r1")
+    async def subscription_post_handler(self, request: Request) -> Response:
+        """
+        Receives deliveries for all rooms subscribed to the repository
+        or its owner, see !gitea subscription.
+        """
+        return await self.accept_hook(request, None)
+
+    async def accept_hook(self, request: Request, room_id: Optional[RoomID]) -> Response:
         if "X-Gitea-Event" not in request.headers:
             return Response(text="400: Bad request\n"
                                  "Event type not specified\n", status=400)
@@ -84,14 +164,8 @@ class GiteaBot(Plugin):
             return Response(text="400: Ba request\n"
                                  "Missing signature header\n", status=401)
 
-        if "room" not in request.query:
-            return Response(text="400: Bad request\n"
-                                 "No room specified. Did you forget the '?room=' query parameter?\n",
-                            status=400)
-
-        if request.query["room"] not in self.joined_rooms:
-            return Response(text="403: Forbidden\nThe bot is not in the room. "
-                                 f"Please invite the bot to the room.\n", status=403)
+        if request.headers["X-Gitea-Event"] not in self.formatters:
+            return Response(status=200, text="200: OK\nEvent type ignored.\n")
 
         if request.headers.getone("Content-Type", "") != "application/json":
             return Response(status=406, text="406: Not Acceptable\n",
@@ -101,57 +175,145 @@ class GiteaBot(Plugin):
             return Response(status=400, text="400: Bad request\n"
                                              "Missing request body\n")
 
-        task = self.loop.create_task(self.process_hook_01(request))
-        self.task_list += [task]
+        body = await read_body(request, self.config["webhook.max_body_size"])
+        if body is None:
+            return Response(status=413, text="413: Payload Too Large\n")
+        if not verify_signature(body, request.headers["X-Gitea-Signature"],
+                                self.webhook_secrets()):
+            return Response(status=401, text="401: Unauthorized\n"
+                                             "Signature mismatch\n")
+        if room_id and not (await self.filters.get(room_id)).accepts_event(
+                request.headers["X-Gitea-Event"]):
+            return Response(status=200, text="200: OK\nEvent type filtered.\n")
+
+        delivery = request.headers["X-Gitea-Delivery"]
+        if not await self.seen_deliveries.claim(delivery):
+            return Response(status=200, text="200: OK\nDelivery already received.\n")
+
+        info = HookInfo(delivery=delivery,
+                        event=request.headers["X-Gitea-Event"],
+                        room_id=room_id,
+                        body=body)
+        try:
+            submitted = await self.hooks.submit(info)
+        except Exception:
+            self.seen_deliveries.release(delivery)
+            raise
+        if not submitted:
+            self.seen_deliveries.release(delivery)
+            retry_after = str(self.config["webhook.retry_after"])
+            return Response(status=503, text="503: Service Unavailable\n"
+                                             "Too many webhooks queued.\n",
+                            headers={"Retry-After": retry_after})
+        await self.seen_deliveries.store(delivery)
         return Response(status=202, text="202: Accepted\nWebhook processing started.\n")
 
-    async def process_hook_01(self, req: Request) -> None:
-        if self.config["send_as_notice"]:
-            msgtype = MessageType.NOTICE
-        else:
-            msgtype = MessageType.TEXT
+    def webhook_secrets(self) -> List[bytes]:
+        secrets = self.config["webhook-secret"]
+        if isinstance(secrets, str):
+            secrets = [secrets]
+        return [secret.encode("utf-8") for secret in secrets]
 
+    async def process_hook_01(self, hook: HookInfo) -> Optional[asyncio.Future]:
         try:
-            msg = None
-            body = await req.json()
-
-            if body["secret"] != self.config["webhook-secret"]:
-                self.log.error("Failed to handle Gitea event: secret doesnt match.")
+            formatter = self.formatters.get(hook.event)
+            if formatter is None:
+                return None
+            try:
+                payload = self.json_loads(hook.body)
+            except ValueError:
+                payload = None
+            if not isinstance(payload, dict):
+                # Only checked here, so duplicates and filtered events are never decoded.
+                self.log.warning(f"Ignoring Gitea delivery {hook.delivery}, "
+                                 "the body is not a JSON object")
+                return None
+            body = formatter.select(payload, FILTER_FIELDS)
+            ctx = hook_context(body)
+            if hook.room_id:
+                rooms = [hook.room_id]
             else:
-                event = req.headers["X-Gitea-Event"]
-                if event == 'push':
-                    commits = body["commits"]
-                    commit_count = len(commits)
-                    if commit_count > 0:
-                        msg = (f"user '{body['sender']['login']}' pushed "
-                               f"{commit_count} commit(s) to "
-                               f"'{body['repository']['full_name']}' at '{URL(body['repository']['html_url']).host}'.")
-                elif event == 'create':
-                    msg = (f"user '{body['sender']['login']}' created a tag or branch in "
-                           f"'{body['repository']['full_name']}' at '{URL(body['repository']['html_url']).host}'.")
-                elif event == 'delete':
-                    msg = (f"user '{body['sender']['login']}' deleted a tag or branch in "
-                           f"'{body['repository']['full_name']}' at '{URL(body['repository']['html_url']).host}'.")
-                elif event == 'issues':
-                    msg = (f"user '{body['sender']['login']}' {body['action']} issue #{body['number']} in "
-                           f"'{body['repository']['full_name']}' at '{URL(body['repository']['html_url']).host}'.")
-                elif event == 'issue_comment':
-                    msg = (f"user '{body['sender']['login']}' {body['action']} a comment on issue #{body['issue']['id']} in "
-                           f"'{body['repository']['full_name']}' at '{URL(body['repository']['html_url']).host}'.")
-                else:
-                    self.log.error(f"unhandled hook: {event}")
-                    self.log.error(await req.text())
-
-                room_id = RoomID(req.query["room"])
-                if msg:
-                    event_id = await self.client.send_markdown(room_id, msg, allow_html=True, msgtype=msgtype)
-
+                rooms = [room_id for room_id in await self.db.get_subscribed_rooms(ctx.host, ctx.repo)
+                         if room_id in self.joined_rooms]
+            rooms = [room_id for room_id in rooms
+                     if (await self.filters.get(room_id)).accepts(hook.event, ctx, body)]
+            return await self.coalescer.add(rooms, hook.event, formatter, ctx, body)
         except Exception:
             self.log.error("Failed to handle Gitea event", exc_info=True)
+            return None
 
-        task = asyncio.current_task()
-        if task:
-            self.task_list.remove(task)
+    async def message_content(self, msg: Message) -> TextMessageEventContent:
+        if self.config["send_as_notice"]:
+            msgtype = MessageType.NOTICE
+        else:
+            msgtype = MessageType.TEXT
+        if isinstance(msg, HookMessage):
+            text, html = msg.text, msg.html
+        else:
+            text, html = await render_markdown(msg, allow_html=True)
+        return TextMessageEventContent(msgtype=msgtype, body=text, format=Format.HTML,
+                                       formatted_body=html)
+
+    async def send_hook_message(self, room_id: RoomID, msg: Message, item: Optional[ItemRef] = None
+                                ) -> 'asyncio.Future[Optional[EventID]]':
+        content = await self.message_content(msg)
+        data = content
+
+        edited = False
+        edit_window = self.config["webhook.edit_window"]
+        if item and item.state and edit_window > 0:
+            previous = await self.db.get_item_message(room_id, item.key)
+            if previous and time.time() - previous.sent_at < edit_window:
+                content.set_edit(previous.event_id)
+                edited = True
+
+        root = None
+        threads = item and self.config["threads"] and not edited
+        if threads:
+            root = await self.db.get_thread_root(room_id, item.key)
+            if root:
+                data = thread_content(content, root)
+
+        send = partial(self.client.send_message_event, room_id, EventType.ROOM_MESSAGE, data)
+        future = self.sender.send(room_id, send)
+
+        if item and item.state and edit_window > 0 and not edited:
+            # Remember the new message, edits always have to replace the original.
+            sent_at = time.time()
+            self._store_task(self._store_item_message(room_id, item.key, sent_at, future))
+        if threads and not root:
+            self._store_task(self._store_thread_root(room_id, item.key, future))
+        return future
+
+    def _store_task(self, coro: Awaitable[None]) -> None:
+        task = self.loop.create_task(coro)
+        self.store_tasks.add(task)
+        task.add_done_callback(self.store_tasks.discard)
+
+    async def _store_item_message(self, room_id: RoomID, item: str, sent_at: float,
+                                  future: 'asyncio.Future[Optional[EventID]]') -> None:
+        event_id = await future
+        if event_id:
+            await self.db.set_item_message(room_id, item, event_id, sent_at)
+
+    async def _store_thread_root(self, room_id: RoomID, item: str,
+                                 future: 'asyncio.Future[Optional[EventID]]') -> None:
+        event_id = await future
+        if event_id:
+            await self.db.set_thread_root(room_id, item, event_id)
+
+    async def reply_item(self, evt: MessageEvent, repo: str, id: int, msg: str) -> None:
+        """Reply in the thread of the issue if there is one in the room."""
+        root = (await self.db.get_thread_root(evt.room_id, f"{repo}#{id}")
+                if self.config["threads"] else None)
+        if not root:
+            await evt.reply(msg)
+            return
+        text, html = await render_markdown(msg, allow_html=False)
+        content = TextMessageEventContent(msgtype=MessageType.NOTICE, body=text,
+                                          format=Format.HTML, formatted_body=html)
+        await self.client.send_message_event(evt.room_id, EventType.ROOM_MESSAGE,
+                                             thread_content(content, root))
 
     # endregion
 
@@ -168,12 +330,36 @@ class GiteaBot(Plugin):
 
     @gitea.subcommand("whoami", help="Check who you're logged in as.")
     @UrlOrAliasArgument("url", "server URL or alias")
-    @with_gitea_session
-    async def whoami(self, evt: MessageEvent, gtc: Gtc) -> None:
-        api_instance = giteapy.UserApi(giteapy.ApiClient(gtc))
-        api_response = api_instance.user_get_current()
-        await evt.reply(f"You're logged into {URL(gtc.host).host} as "
-                        f"{api_response.login}")
+    async def whoami(self, evt: MessageEvent, url: str) -> None:
+        url = await self.users.resolve_server_alias(evt.sender, url)
+        info = await self.users.get_login(evt.sender, url)
+        if info is None:
+            await evt.reply(f"You are not logged in to {url}.")
+            return
+        if info.login is None:
+            # Tokens added before logins were verified.
+            try:
+                info = await self.verify_login(url, info.api_token)
+            except ApiException as e:
+                await evt.reply("Api Error.\n\n{0}".format(e))
+                return
+            except CONNECTION_ERRORS as e:
+                await evt.reply(f"Could not connect to {url}.\n\n{e}")
+                return
+            await self.users.add_login(evt.sender, info)
+        await evt.reply(f"You're logged into {URL(url).host} as {info.login} "
+                        f"(Gitea {info.version})")
+
+    async def verify_login(self, url: str, token: str) -> AuthInfo:
+        """
+        Fetch the token's user and the server version. Raises ApiException if the
+        token is invalid, or one of CONNECTION_ERRORS if the server is unreachable.
+        """
+        async with self.clients.client(url, token) as api_client:
+            user, version = await asyncio.gather(
+                giteapy.UserApi(api_client).user_get_current(),
+                giteapy.MiscellaneousApi(api_client).get_version())
+        return AuthInfo(server=url, api_token=token, login=user.login, version=version.version)
 
     # endregion
 
@@ -188,15 +374,14 @@ class GiteaBot(Plugin):
     @command.argument("alias", "server alias")
     @command.argument("url", "server URL")
     async def alias_add(self, evt: MessageEvent, url: str, alias: str) -> None:
-        if self.db.has_server_alias(evt.sender, alias):
+        if not await self.users.add_server_alias(evt.sender, url, alias):
             await evt.reply("Server alias already in use.")
             return
-        self.db.add_server_alias(evt.sender, url, alias)
         await evt.reply(f"Added alias {alias} to server {url}")
 
     @alias.subcommand("list", aliases=("l", "ls"), help="Show your Gitea server aliases.")
     async def alias_list(self, evt: MessageEvent) -> None:
-        aliases = self.db.get_server_aliases(evt.sender)
+        aliases = await self.users.get_server_aliases(evt.sender)
         if not aliases:
             await evt.reply("You don't have any server aliases.")
             return
@@ -208,7 +393,7 @@ class GiteaBot(Plugin):
                       help="Remove a alias to a Gitea server.")
     @command.argument("alias", "server alias")
     async def alias_rm(self, evt: MessageEvent, alias: str) -> None:
-        self.db.rm_server_alias(evt.sender, alias)
+        await self.users.rm_server_alias(evt.sender, alias)
         await evt.reply(f"Removed alias {alias}.")
 
     # endregion
@@ -221,7 +406,7 @@ class GiteaBot(Plugin):
 
     @server.subcommand("list", aliases=("ls",), help="Show your Gitea servers.")
     async def server_list(self, evt: MessageEvent) -> None:
-        servers = self.db.get_servers(evt.sender)
+        servers = await self.users.get_servers(evt.sender)
         if not servers:
             await evt.reply("You are not logged in to any server.")
             return
@@ -233,19 +418,140 @@ class GiteaBot(Plugin):
     @UrlOrAliasArgument("url", "server URL or alias")
     @command.argument("token", "access token", pass_raw=True)
     async def server_login(self, evt: MessageEvent, url: str, token: str) -> None:
-        # TODO verify the token
-        self.db.add_login(evt.sender, url, token)
-        await evt.reply(f"Added token for {url}.")
+        url = await self.users.resolve_server_alias(evt.sender, url)
+        try:
+            info = await self.verify_login(url, token)
+        except ApiException as e:
+            await evt.reply(f"The token was not accepted by {url}.\n\n{e}")
+            return
+        except CONNECTION_ERRORS as e:
+            await evt.reply(f"Could not connect to {url}.\n\n{e}")
+            return
+        await self.users.add_login(evt.sender, info)
+        await evt.reply(f"Added token for {url}, logged in as {info.login} "
+                        f"(Gitea {info.version}).")
 
     @server.subcommand("logout", aliases=("rm",),
                        help="Remove the access token from the bot's database.")
     @UrlOrAliasArgument("url", "server URL or alias")
     async def server_logout(self, evt: MessageEvent, url: str) -> None:
-        self.db.rm_login(evt.sender, url)
+        url = await self.users.resolve_server_alias(evt.sender, url)
+        await self.users.rm_login(evt.sender, url)
         await evt.reply(f"Removed {url} from the database.")
 
     # endregion
 
+    # region !gitea subscription
+
+    async def can_manage_room(self, evt: MessageEvent) -> bool:
+        """
+        Whether the sender may change the room's webhook settings, which needs
+        the power level to send state events. Replies if not.
+        """
+        try:
+            levels = await self.client.get_state_event(evt.room_id, EventType.ROOM_POWER_LEVELS)
+            allowed = levels.get_user_level(evt.sender) >= levels.state_default
+        except Exception:
+            self.log.warning(f"Failed to get the power levels of {evt.room_id}", exc_info=True)
+            allowed = False
+        if not allowed:
+            await evt.reply("You need the power level to change the room's settings for that.")
+        return allowed
+
+    @gitea.subcommand("subscription", aliases=("sub",),
+                      help="Manage the repositories whose webhook events are sent to this room.")
+    async def subscription(self) -> None:
+        pass
+
+    @subscription.subcommand("add", aliases=("a",),
+                             help="Send webhook events of a repository or organization to this room.")
+    @UrlOrAliasArgument("url", "server URL or alias")
+    @command.argument("target", "repository (owner/name) or organization")
+    @with_gitea_session
+    async def subscription_add(self, evt: MessageEvent, target: str, api_client: ApiClient) -> None:
+        if not await self.can_manage_room(evt):
+            return
+        # The events are sent to everyone in the room, so the sender's Gitea
+        # account has to be able to read them.
+        owner, _, name = target.partition("/")
+        try:
+            if name:
+                await giteapy.RepositoryApi(api_client).repo_get(owner, name, _raw=True)
+            else:
+                user = await giteapy.UserApi(api_client).user_get_current(_raw=True)
+                if user.login != owner:
+                    await giteapy.OrganizationApi(api_client).org_is_member(owner, user.login)
+        except ApiException as e:
+            if e.status not in (403, 404):
+                raise
+            await evt.reply(f"Your Gitea account can't access {target}.")
+            return
+        host = URL(api_client.configuration.host).host
+        await self.db.add_subscription(evt.room_id, f"{host}/{target}")
+        await evt.reply(f"Subscribed this room to {target} on {host}")
+
+    @subscription.subcommand("list", aliases=("l", "ls"), help="Show the subscriptions of this room.")
+    async def subscription_list(self, evt: MessageEvent) -> None:
+        targets = await self.db.get_subscriptions(evt.room_id)
+        if not targets:
+            await evt.reply("This room has no subscriptions.")
+            return
+        await evt.reply("This room is subscribed to:\n\n"
+                        + "\n".join(f"* {target}" for target in targets))
+
+    @subscription.subcommand("remove", aliases=("r", "rm", "d", "del", "delete"),
+                             help="Stop sending webhook events of a repository or organization to this room.")
+    @command.argument("target", "subscription as shown by list (host/owner[/name])")
+    async def subscription_rm(self, evt: MessageEvent, target: str) -> None:
+        if not await self.can_manage_room(evt):
+            return
+        await self.db.rm_subscription(evt.room_id, target)
+        await evt.reply(f"Unsubscribed this room from {target}")
+
+    # endregion
+
+    # region !gitea filter
+
+    @gitea.subcommand("filter", aliases=("f",), help="Manage the webhook event filters of this room.")
+    async def filter(self) -> None:
+        pass
+
+    @filter.subcommand("set", help="Set a filter of this room: events <event types>, "
+                                   "branches <globs>, labels <label names> or senders <ignored users>.")
+    @command.argument("kind", "events, branches, labels or senders")
+    @command.argument("patterns", "space separated values", pass_raw=True)
+    async def filter_set(self, evt: MessageEvent, kind: str, patterns: str) -> None:
+        if not await self.can_manage_room(evt):
+            return
+        if kind not in FILTER_KINDS:
+            await evt.reply(f"Unknown filter {kind}, use one of {', '.join(FILTER_KINDS)}.")
+            return
+        await self.db.set_filter(evt.room_id, kind, patterns.split())
+        self.filters.invalidate(evt.room_id)
+        await evt.reply(f"Set {kind} filter to {patterns}")
+
+    @filter.subcommand("show", aliases=("l", "ls", "list"), help="Show the filters of this room.")
+    async def filter_show(self, evt: MessageEvent) -> None:
+        filters = await self.db.get_filters(evt.room_id)
+        if not filters:
+            await evt.reply("This room has no filters.")
+            return
+        await evt.reply("This room has the following filters:\n\n"
+                        + "\n".join(f"* {kind}: {' '.join(patterns)}"
+                                     for kind, patterns in filters.items()))
+
+    @filter.subcommand("clear", aliases=("r", "rm", "d", "del", "delete"),
+                       help="Remove a filter, or all filters, of this room.")
+    @command.argument("kind", "events, branches, labels or senders", required=False)
+    async def filter_clear(self, evt: MessageEvent, kind: str) -> None:
+        if not await self.can_manage_room(evt):
+            return
+        await self.db.rm_filter(evt.room_id, kind or None)
+        self.filters.invalidate(evt.room_id)
+        await evt.reply(f"Removed {kind + ' filter' if kind else 'all filters'}.")
+
+    # endregion
+
     # region !gitea repository alias
 
     @gitea.subcommand("ralias", aliases=("r",),
@@ -257,15 +563,14 @@ class GiteaBot(Plugin):
     @command.argument("alias", "repository alias")
     @command.argument("repos", "repository")
     async def ralias_add(self, evt: MessageEvent, repos: str, alias: str) -> None:
-        if self.db.has_repos_alias(evt.sender, alias):
+        if not await self.users.add_repos_alias(evt.sender, repos, alias):
             await evt.reply("Repository alias already in use.")
             return
-        self.db.add_repos_alias(evt.sender, repos, alias)
         await evt.reply(f"Added alias {alias} to repository {repos}")
 
     @ralias.subcommand("list", aliases=("l", "ls"), help="Show your Gitea repository aliases.")
     async def ralias_list(self, evt: MessageEvent) -> None:
-        aliases = self.db.get_repos_aliases(evt.sender)
+        aliases = await self.users.get_repos_aliases(evt.sender)
         if not aliases:
             await evt.reply("You don't have any repository aliases.")
             return
@@ -277,7 +582,7 @@ class GiteaBot(Plugin):
                       help="Remove a alias to a Gitea repository.")
     @command.argument("alias", "repository alias")
     async def ralias_rm(self, evt: MessageEvent, alias: str) -> None:
-        self.db.rm_repos_alias(evt.sender, alias)
+        await self.users.rm_repos_alias(evt.sender, alias)
         await evt.reply(f"Removed alias {alias}.")
 
     # endregion
@@ -293,10 +598,10 @@ class GiteaBot(Plugin):
     @ReposOrAliasArgument("repo", "repository or alias")
     @command.argument("id", "issue ID", parser=sigil_int)
     @with_gitea_session
-    async def issue_read(self, evt: MessageEvent, repo: str, id: int, gtc: Gtc) -> None:
-        api_instance = giteapy.IssueApi(giteapy.ApiClient(gtc))
+    async def issue_read(self, evt: MessageEvent, repo: str, id: int, api_client: ApiClient) -> None:
+        api_instance = giteapy.IssueApi(api_client)
         rep = repo.split("/", 1)
-        issue = api_instance.issue_get_issue(rep[0], rep[1], id)
+        issue = await api_instance.issue_get_issue(rep[0], rep[1], id, _raw=True)
 
         msg = f"Issue #{issue.id} by {issue.user.login}: [{issue.title}]({issue.html_url})  \n"
         if issue.assignees:
@@ -307,7 +612,7 @@ class GiteaBot(Plugin):
                 msg += f"Assigned to {names[0]}.  \n"
         msg += "\n".join(f"> {line}" for line in issue.body.strip().split("\n"))
 
-        await evt.reply(msg)
+        await self.reply_item(evt, repo, id, msg)
 
     @issue.subcommand("create", help="Create an Issue. The issue body can be placed on a new line.")
     @UrlOrAliasArgument("url", "server URL or alias")
@@ -317,12 +622,12 @@ class GiteaBot(Plugin):
                       parser=partial(quote_parser, return_all=True))
     @with_gitea_session
     async def issue_create(self, evt: MessageEvent, repo: str, title: str,
-                           desc: str, gtc: Gtc) -> None:
-        api_instance = giteapy.IssueApi(giteapy.ApiClient(gtc))
+                           desc: str, api_client: ApiClient) -> None:
+        api_instance = giteapy.IssueApi(api_client)
         rep = repo.split("/", 1)
 
         body = giteapy.CreateIssueOption(title=title, body=desc)
-        issue = api_instance.issue_create_issue(rep[0], rep[1], body=body)
+        issue = await api_instance.issue_create_issue(rep[0], rep[1], body=body, _raw=True)
 
         await evt.reply(f"Created issue [#{issue.id}]({issue.html_url}): {issue.title}")
 
@@ -331,28 +636,28 @@ class GiteaBot(Plugin):
     @ReposOrAliasArgument("repo", "repository or alias")
     @command.argument("id", "issue ID", parser=sigil_int)
     @with_gitea_session
-    async def issue_close(self, evt: MessageEvent, repo: str, id: str, gtc: Gtc) -> None:
-        api_instance = giteapy.IssueApi(giteapy.ApiClient(gtc))
+    async def issue_close(self, evt: MessageEvent, repo: str, id: str, api_client: ApiClient) -> None:
+        api_instance = giteapy.IssueApi(api_client)
         rep = repo.split("/", 1)
 
         body = giteapy.EditIssueOption(state='closed')
-        issue = api_instance.issue_edit_issue(rep[0], rep[1], id, body=body)
+        issue = await api_instance.issue_edit_issue(rep[0], rep[1], id, body=body, _raw=True)
 
-        await evt.reply(f"Closed issue [#{issue.id}]({issue.html_url}): {issue.title}")
+        await self.reply_item(evt, repo, id, f"Closed issue [#{issue.id}]({issue.html_url}): {issue.title}")
 
     @issue.subcommand("reopen", help="Reopen an issue.")
     @UrlOrAliasArgument("url", "server URL or alias")
     @ReposOrAliasArgument("repo", "repository or alias")
     @command.argument("id", "issue ID", parser=sigil_int)
     @with_gitea_session
-    async def issue_reopen(self, evt: MessageEvent, repo: str, id: int, gtc: Gtc) -> None:
-        api_instance = giteapy.IssueApi(giteapy.ApiClient(gtc))
+    async def issue_reopen(self, evt: MessageEvent, repo: str, id: int, api_client: ApiClient) -> None:
+        api_instance = giteapy.IssueApi(api_client)
         rep = repo.split("/", 1)
 
         body = giteapy.EditIssueOption(state='open')
-        issue = api_instance.issue_edit_issue(rep[0], rep[1], id, body=body)
+        issue = await api_instance.issue_edit_issue(rep[0], rep[1], id, body=body, _raw=True)
 
-        await evt.reply(f"Reopened issue [#{issue.id}]({issue.html_url}): {issue.title}")
+        await self.reply_item(evt, repo, id, f"Reopened issue [#{issue.id}]({issue.html_url}): {issue.title}")
 
     @issue.subcommand("comment", help="Write a commant on an issue.")
     @UrlOrAliasArgument("url", "server URL or alias")
@@ -360,14 +665,14 @@ class GiteaBot(Plugin):
     @command.argument("id", "issue ID", parser=sigil_int)
     @command.argument("comment", "comment text", pass_raw=True)
     @with_gitea_session
-    async def issue_comment(self, evt: MessageEvent, repo: str, id: int, comment: str, gtc: Gtc) -> None:
-        api_instance = giteapy.IssueApi(giteapy.ApiClient(gtc))
+    async def issue_comment(self, evt: MessageEvent, repo: str, id: int, comment: str, api_client: ApiClient) -> None:
+        api_instance = giteapy.IssueApi(api_client)
         rep = repo.split("/", 1)
 
         body = giteapy.CreateIssueCommentOption(body=comment)
-        issue = api_instance.issue_create_comment(rep[0], rep[1], id, body=body)
+        issue = await api_instance.issue_create_comment(rep[0], rep[1], id, body=body, _raw=True)
 
-        await evt.reply(f"Commented on issue [#{issue.id}]({issue.html_url})")
+        await self.reply_item(evt, repo, id, f"Commented on issue [#{issue.id}]({issue.html_url})")
 
     @issue.subcommand("comments", aliases=("read-comments",),
                       help="Read comments on an issue.")
@@ -375,11 +680,11 @@ class GiteaBot(Plugin):
     @ReposOrAliasArgument("repo", "repository or alias")
     @command.argument("id", "issue ID", parser=sigil_int)
     @with_gitea_session
-    async def issue_comments_read(self, evt: MessageEvent, repo: str, id: int, gtc: Gtc) -> None:
-        api_instance = giteapy.IssueApi(giteapy.ApiClient(gtc))
+    async def issue_comments_read(self, evt: MessageEvent, repo: str, id: int, api_client: ApiClient) -> None:
+        api_instance = giteapy.IssueApi(api_client)
         rep = repo.split("/", 1)
 
-        issues = api_instance.issue_get_comments(rep[0], rep[1], id)
+        issues = await api_instance.issue_get_comments(rep[0], rep[1], id)
 
         def format_note(note) -> str:
             body = "\n".join(f"> {line}" for line in note.body.split("\n"))
@@ -387,6 +692,6 @@ class GiteaBot(Plugin):
             author = note.user.login
             return f"{author} at {date}:\n{body}"
 
-        await evt.reply("\n\n".join(format_note(note) for note in issues))
+        await self.reply_item(evt, repo, id, "\n\n".join(format_note(note) for note in issues))
 
     # endregion
@@ -0,0 +1,135 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from typing import Dict, Optional
+from collections import OrderedDict
+import asyncio
+import copy
+
+from .giteapy import ApiClient, Configuration
+from .giteapy.rest import RESTClientObject
+
+
+class ServerClient:
+    """The pooled connections to one Gitea server, shared by all users."""
+    configuration: Configuration
+    rest_client: RESTClientObject
+    last_used: float
+    leases: int
+
+    def __init__(self, server: str, maxsize: int, now: float) -> None:
+        self.configuration = Configuration()
+        self.configuration.host = server
+        self.rest_client = RESTClientObject(self.configuration, maxsize=maxsize)
+        self.last_used = now
+        self.leases = 0
+
+    def api_client(self, token: str) -> ApiClient:
+        # The Configuration is copied so the token only applies to this client,
+        # the REST client and its connections stay shared.
+        gtc = copy.copy(self.configuration)
+        gtc.api_key = {'access_token': token}
+        return ApiClient(gtc, rest_client=self.rest_client)
+
+
+class ClientLease:
+    """Async context manager lending a pooled ApiClient for one command."""
+
+    def __init__(self, pool: 'ClientPool', server: str, token: str) -> None:
+        self.pool = pool
+        self.server = server
+        self.token = token
+        self.entry: Optional[ServerClient] = None
+
+    async def __aenter__(self) -> ApiClient:
+        self.entry = self.pool.acquire(self.server)
+        return self.entry.api_client(self.token)
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.pool.release(self.entry)
+
+
+class ClientPool:
+    """
+    Registry of long-lived REST clients, one per Gitea server.
+
+    At most max_servers servers are kept open, the least recently used one is
+    closed to make room for a new one. Servers without requests for
+    idle_timeout seconds are closed by the eviction task.
+    """
+    servers: Dict[str, ServerClient]
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int = 4,
+                 max_servers: int = 16, idle_timeout: float = 300) -> None:
+        self.loop = loop
+        self.maxsize = maxsize
+        self.max_servers = max_servers
+        self.idle_timeout = idle_timeout
+        self.servers = OrderedDict()
+        self._evict_task = None
+
+    def start(self) -> None:
+        self._evict_task = self.loop.create_task(self._evict_loop())
+
+    async def close(self) -> None:
+        if self._evict_task:
+            self._evict_task.cancel()
+            self._evict_task = None
+        servers = list(self.servers.values())
+        self.servers.clear()
+        for entry in servers:
+            await entry.rest_client.close()
+
+    def client(self, server: str, token: str) -> ClientLease:
+        return ClientLease(self, server, token)
+
+    def acquire(self, server: str) -> ServerClient:
+        now = self.loop.time()
+        entry = self.servers.get(server)
+        if entry is None:
+            entry = ServerClient(server, self.maxsize, now)
+            self.servers[server] = entry
+            self._evict_overflow()
+        else:
+            self.servers.move_to_end(server)
+        entry.leases += 1
+        entry.last_used = now
+        return entry
+
+    def release(self, entry: ServerClient) -> None:
+        entry.leases -= 1
+        entry.last_used = self.loop.time()
+
+    def _evict_overflow(self) -> None:
+        for server in list(self.servers):
+            if len(self.servers) <= self.max_servers:
+                break
+            entry = self.servers[server]
+            if entry.leases == 0:
+                self._evict(server)
+
+    def evict_idle(self) -> None:
+        deadline = self.loop.time() - self.idle_timeout
+        for server, entry in list(self.servers.items()):
+            if entry.leases == 0 and entry.last_used < deadline:
+                self._evict(server)
+
+    def _evict(self, server: str) -> None:
+        entry = self.servers.pop(server)
+        self.loop.create_task(entry.rest_client.close())
+
+    async def _evict_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            self.evict_idle()
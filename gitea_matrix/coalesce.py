@@ -0,0 +1,130 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from functools import partial
+import asyncio
+import logging
+
+from mautrix.types import EventID, RoomID
+
+from .formatters import HookContext, HookFormatter, HookItem, ItemRef, Message
+
+# Queues the message and returns a future for its event ID.
+MessageSender = Callable[[RoomID, Message, Optional[ItemRef]],
+                         Awaitable['asyncio.Future[Optional[EventID]]']]
+GroupKey = Tuple[Tuple[RoomID, ...], str, str]
+
+
+def _chain(source: asyncio.Future, target: asyncio.Future) -> None:
+    """Copy the outcome of source to target once it is done."""
+    if target.done():
+        return
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(None)
+
+
+class HookGroup:
+    formatter: HookFormatter
+    items: List[HookItem]
+    timer: asyncio.TimerHandle
+    sent: asyncio.Future
+
+    def __init__(self, formatter: HookFormatter, sent: asyncio.Future) -> None:
+        self.formatter = formatter
+        self.items = []
+        self.timer = None
+        self.sent = sent
+
+
+class HookCoalescer:
+    """
+    Collects the events for the same rooms, repository and event type that
+    arrive within window seconds of the first one, and sends them as a single
+    summarized message. A window of 0 sends every event right away.
+
+    Each message is formatted once and then sent to all of its rooms. If all
+    events of a message are about the same issue or pull request, the item is
+    passed on to the sender, and for state changes only the latest one is sent.
+
+    add() returns a future that completes once the event's message was sent to
+    all rooms, or None if there is nothing to send.
+    """
+    groups: Dict[GroupKey, HookGroup]
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, send: MessageSender,
+                 log: logging.Logger, window: float = 0) -> None:
+        self.loop = loop
+        self.send = send
+        self.log = log
+        self.window = window
+        self.groups = {}
+
+    async def add(self, room_ids: Iterable[RoomID], event: str, formatter: HookFormatter,
+                  ctx: HookContext, body: Dict[str, Any]) -> Optional[asyncio.Future]:
+        rooms = tuple(sorted(room_ids))
+        if not rooms:
+            return None
+        if self.window <= 0:
+            msg = formatter.format(ctx, body)
+            if not msg:
+                return None
+            return await self._send_all(rooms, msg, formatter.item(ctx, body))
+
+        key = (rooms, ctx.repo, event)
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = HookGroup(formatter, self.loop.create_future())
+            group.timer = self.loop.call_later(self.window, self._flush_later, key)
+        group.items.append((ctx, body))
+        return group.sent
+
+    def _flush_later(self, key: GroupKey) -> None:
+        self.loop.create_task(self.flush(key))
+
+    async def flush(self, key: GroupKey) -> None:
+        group = self.groups.pop(key, None)
+        if group is None:
+            return
+        group.timer.cancel()
+        try:
+            formatter = group.formatter
+            items = {formatter.item(ctx, body) for ctx, body in group.items}
+            item = items.pop() if len(items) == 1 else None
+            if item and item.state:
+                msg = formatter.format(*group.items[-1])
+            else:
+                msg = formatter.summarize(group.items)
+            if msg:
+                sent = await self._send_all(key[0], msg, item)
+                sent.add_done_callback(partial(_chain, target=group.sent))
+            else:
+                group.sent.set_result(None)
+        except Exception as e:
+            self.log.error("Failed to send coalesced Gitea events", exc_info=True)
+            if not group.sent.done():
+                group.sent.set_exception(e)
+
+    async def _send_all(self, rooms: Tuple[RoomID, ...], msg: Message,
+                        item: Optional[ItemRef] = None) -> asyncio.Future:
+        futures = [await self.send(room_id, msg, item) for room_id in rooms]
+        return asyncio.gather(*futures)
+
+    async def flush_all(self) -> None:
+        for key in list(self.groups):
+            await self.flush(key)
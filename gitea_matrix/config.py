@@ -17,4 +17,28 @@ from mautrix.util.config import BaseProxyConfig, ConfigUpdateHelper
 
 class Config(BaseProxyConfig):
     def do_update(self, helper: ConfigUpdateHelper) -> None:
-        pass
+        helper.copy("webhook-secret")
+        helper.copy("send_as_notice")
+        helper.copy("threads")
+        helper.copy("time_format")
+        helper.copy("token_key")
+        helper.copy("client.pool_size")
+        helper.copy("client.max_servers")
+        helper.copy("client.idle_timeout")
+        helper.copy("cache.users")
+        helper.copy("webhook.queue_size")
+        helper.copy("webhook.workers")
+        helper.copy("webhook.retry_after")
+        helper.copy("webhook.persist")
+        helper.copy("webhook.max_body_size")
+        helper.copy("webhook.dedup_size")
+        helper.copy("webhook.dedup_ttl")
+        helper.copy("webhook.dedup_persist")
+        helper.copy("webhook.coalesce_window")
+        helper.copy("webhook.json_backend")
+        helper.copy("webhook.push_commits")
+        helper.copy("webhook.edit_window")
+        helper.copy("sender.rate")
+        helper.copy("sender.burst")
+        helper.copy("sender.max_retries")
+        helper.copy("sender.queue_size")
@@ -0,0 +1,56 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from typing import Optional
+import base64
+import hashlib
+
+try:
+    from cryptography.fernet import Fernet
+except ImportError:
+    Fernet = None
+
+
+class TokenCipher:
+    """
+    Encrypts the stored access tokens with a key derived from the token_key
+    option. Without a key, tokens are stored as they are.
+
+    Encrypted tokens carry a prefix, so tokens that were stored in plain text
+    before the key was set can still be read and encrypted afterwards.
+    """
+    prefix = "fernet:"
+
+    def __init__(self, key: Optional[str] = None) -> None:
+        if not key:
+            self.fernet = None
+            return
+        if Fernet is None:
+            raise RuntimeError("token_key is set, but the cryptography package is not installed")
+        self.fernet = Fernet(base64.urlsafe_b64encode(hashlib.sha256(key.encode("utf-8")).digest()))
+
+    def is_encrypted(self, stored: str) -> bool:
+        return stored.startswith(self.prefix)
+
+    def encrypt(self, token: str) -> str:
+        if self.fernet is None:
+            return token
+        return self.prefix + self.fernet.encrypt(token.encode("utf-8")).decode("ascii")
+
+    def decrypt(self, stored: str) -> str:
+        if not self.is_encrypted(stored):
+            return stored
+        if self.fernet is None:
+            raise ValueError("The token is encrypted, but token_key is not set")
+        return self.fernet.decrypt(stored[len(self.prefix):].encode("ascii")).decode("utf-8")
@@ -12,23 +12,41 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from typing import List, NamedTuple
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+import asyncio
 
-from sqlalchemy import Column, ForeignKey, ForeignKeyConstraint, String, Text, or_
-from sqlalchemy.engine.base import Engine
+from sqlalchemy import (Column, Float, ForeignKey, ForeignKeyConstraint, Index, Integer, LargeBinary,
+                        String, Text, and_, inspect, or_, select)
+from sqlalchemy.engine.base import Connection, Engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session, relationship
+from sqlalchemy.orm import scoped_session, sessionmaker, relationship
 
-from mautrix.types import UserID
+from mautrix.types import EventID, RoomID, UserID
 
-AuthInfo = NamedTuple('AuthInfo', server=str, api_token=str)
+from .crypto import TokenCipher
+
+# login and version are those of the token's user and server when it was added.
+AuthInfo = NamedTuple('AuthInfo', server=str, api_token=str, login=Optional[str],
+                      version=Optional[str])
 AliasInfo = NamedTuple('AliasInfo', server=str, alias=str)
+ItemMessageInfo = NamedTuple('ItemMessageInfo', event_id=EventID, sent_at=float)
+HookInfo = NamedTuple('HookInfo', delivery=str, event=str, room_id=Optional[RoomID], body=bytes)
 Base = declarative_base()
+T = TypeVar('T')
 
 from pprint import pprint
 
+class Version(Base):
+    __tablename__ = "version"
+
+    version = Column(Integer, primary_key=True)
+
 class ServerAlias(Base):
     __tablename__ = "serveralias"
+    __table_args__ = (Index("serveralias_user_alias_idx", "user_id", "alias", unique=True),)
 
     user_id: UserID = Column(String(255), primary_key=True)
     alias = Column(Text, primary_key=True, nullable=False)
@@ -40,44 +58,177 @@ class ServerToken(Base):
     user_id: UserID = Column(String(255), primary_key=True, nullable=False)
     gitea_server = Column(Text, primary_key=True, nullable=False)
     api_token = Column(Text, nullable=False)
+    login = Column(Text, nullable=True)
+    version = Column(Text, nullable=True)
 
 class RepositoryAlias(Base):
     __tablename__ = "repositoryalias"
+    __table_args__ = (Index("repositoryalias_user_alias_idx", "user_id", "alias", unique=True),)
 
     user_id: UserID = Column(String(255), primary_key=True)
     alias = Column(Text, primary_key=True, nullable=False)
     gitea_repository = Column(Text, primary_key=True)
 
+class HookDelivery(Base):
+    __tablename__ = "hookdelivery"
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    delivery = Column(Text, nullable=False)
+    event = Column(Text, nullable=False)
+    room_id: RoomID = Column(String(255), nullable=True)
+    body = Column(LargeBinary, nullable=False)
+
+class Subscription(Base):
+    __tablename__ = "subscription"
+
+    room_id: RoomID = Column(String(255), primary_key=True)
+    target = Column(String(255), primary_key=True, index=True)
+
+class EventFilter(Base):
+    __tablename__ = "eventfilter"
+
+    room_id: RoomID = Column(String(255), primary_key=True)
+    kind = Column(String(31), primary_key=True)
+    patterns = Column(Text, nullable=False)
+
+class ItemMessage(Base):
+    __tablename__ = "itemmessage"
+
+    room_id: RoomID = Column(String(255), primary_key=True)
+    item = Column(String(255), primary_key=True)
+    event_id: EventID = Column(String(255), nullable=False)
+    sent_at = Column(Float, nullable=False)
+
+class ThreadRoot(Base):
+    __tablename__ = "threadroot"
+
+    room_id: RoomID = Column(String(255), primary_key=True)
+    item = Column(String(255), primary_key=True)
+    event_id: EventID = Column(String(255), nullable=False, index=True)
+
+class SeenDelivery(Base):
+    __tablename__ = "seendelivery"
+
+    delivery = Column(String(255), primary_key=True)
+    seen_at = Column(Float, nullable=False, index=True)
+
+Upgrade = Callable[[Connection], None]
+# Schema upgrades, the database is at version n after upgrades[n - 1] ran.
+upgrades: List[Upgrade] = []
+
+def upgrade(func: Upgrade) -> Upgrade:
+    upgrades.append(func)
+    return func
+
+@upgrade
+def upgrade_v1(conn: Connection) -> None:
+    """The alias and token tables."""
+    for model in (ServerAlias, ServerToken, RepositoryAlias):
+        model.__table__.create(conn, checkfirst=True)
+
+@upgrade
+def upgrade_v2(conn: Connection) -> None:
+    """Webhook tables, previously created by create_all()."""
+    for model in (HookDelivery, Subscription, EventFilter, ItemMessage, ThreadRoot, SeenDelivery):
+        model.__table__.create(conn, checkfirst=True)
+
+@upgrade
+def upgrade_v3(conn: Connection) -> None:
+    """Unique (user_id, alias) indexes, keeping one target of duplicate aliases."""
+    for table, target in ((ServerAlias.__table__, "gitea_server"),
+                          (RepositoryAlias.__table__, "gitea_repository")):
+        index, = table.indexes
+        if index.name in (existing["name"] for existing in inspect(conn).get_indexes(table.name)):
+            continue
+        seen = set()
+        for user_id, alias, value in conn.execute(select([table.c.user_id, table.c.alias,
+                                                          table.c[target]])).fetchall():
+            if (user_id, alias) in seen:
+                conn.execute(table.delete().where(and_(table.c.user_id == user_id,
+                                                       table.c.alias == alias,
+                                                       table.c[target] == value)))
+            seen.add((user_id, alias))
+        index.create(conn)
+
+@upgrade
+def upgrade_v4(conn: Connection) -> None:
+    """Login name and server version of the tokens."""
+    columns = {column["name"] for column in inspect(conn).get_columns("servertoken")}
+    for name in ("login", "version"):
+        if name not in columns:
+            conn.execute(f"ALTER TABLE servertoken ADD COLUMN {name} TEXT")
+
+def in_executor(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    Run a Database method in the database thread, so queries never block the
+    event loop. The method's session is closed when it returns.
+    """
+    @wraps(func)
+    async def wrapper(self: 'Database', *args: Any, **kwargs: Any) -> T:
+        return await self.loop.run_in_executor(self.executor,
+                                               partial(self.run, func, self, *args, **kwargs))
+
+    return wrapper
+
 class Database:
     db: Engine
+    loop: asyncio.AbstractEventLoop
+    executor: ThreadPoolExecutor
 
-    def __init__(self, db: Engine) -> None:
+    def __init__(self, db: Engine, loop: asyncio.AbstractEventLoop,
+                 cipher: Optional[TokenCipher] = None) -> None:
         self.db = db
-        Base.metadata.create_all(db)
-        self.Session = sessionmaker(bind=self.db)
+        self.loop = loop
+        self.cipher = cipher or TokenCipher()
+        # A single thread keeps the queries in order and suits SQLite.
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="maugitea-db")
+        self.upgrade()
+        self.Session = scoped_session(sessionmaker(bind=self.db))
+
+    def upgrade(self) -> None:
+        """Bring the schema up to date. New tables and indexes need a new upgrade function."""
+        with self.db.begin() as conn:
+            table = Version.__table__
+            table.create(conn, checkfirst=True)
+            version = conn.execute(select([table.c.version])).scalar() or 0
+            if version >= len(upgrades):
+                return
+            for func in upgrades[version:]:
+                func(conn)
+            conn.execute(table.delete())
+            conn.execute(table.insert().values(version=len(upgrades)))
+
+    def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            self.Session.rollback()
+            raise
+        finally:
+            self.Session.remove()
 
-    def add_server_alias(self, mxid: UserID, url: str, alias: str) -> None:
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+
+    @in_executor
+    def add_server_alias(self, mxid: UserID, url: str, alias: str) -> bool:
+        """Add the alias, returns False if the user already has an alias with that name."""
         s = self.Session()
-        salias = ServerAlias(user_id=mxid, gitea_server=url, alias=alias)
-        s.add(salias)
-        s.commit()
+        s.add(ServerAlias(user_id=mxid, gitea_server=url, alias=alias))
+        try:
+            s.commit()
+        except IntegrityError:
+            s.rollback()
+            return False
+        return True
 
+    @in_executor
     def get_server_aliases(self, user_id: UserID) -> List[AliasInfo]:
         s = self.Session()
         rows = s.query(ServerAlias).filter(ServerAlias.user_id == user_id)
         return [AliasInfo(row.gitea_server, row.alias) for row in rows]
 
-    def get_server_alias(self, user_id: UserID, alias: str) -> str:
-        s = self.Session()
-        row = s.query(ServerAlias).filter(ServerAlias.user_id == user_id, ServerAlias.alias == alias).scalar()
-        if row:
-            return row.gitea_server
-        return None
-
-    def has_server_alias(self, user_id: UserID, alias: str) -> bool:
-        s: Session = self.Session()
-        return s.query(ServerAlias).filter(ServerAlias.user_id == user_id, ServerAlias.alias == alias).count() > 0
-
+    @in_executor
     def rm_server_alias(self, mxid: UserID, alias: str) -> None:
         s = self.Session()
         alias = s.query(ServerAlias).filter(ServerAlias.user_id == mxid,
@@ -85,52 +236,187 @@ class Database:
         s.delete(alias)
         s.commit()
 
-    def get_servers(self, mxid: UserID) -> List[str]:
-        s = self.Session()
-        rows = s.query(ServerToken).filter(ServerToken.user_id == mxid)
-        return [row.gitea_server for row in rows]
-
-    def add_login(self, mxid: UserID, url: str, token: str) -> None:
+    @in_executor
+    def add_login(self, mxid: UserID, info: AuthInfo) -> None:
+        """Add the token, or replace the user's previous token for the server."""
         s = self.Session()
-        s.add(ServerToken(user_id=mxid, gitea_server=url, api_token=token))
+        s.merge(ServerToken(user_id=mxid, gitea_server=info.server,
+                            api_token=self.cipher.encrypt(info.api_token),
+                            login=info.login, version=info.version))
         s.commit()
 
+    @in_executor
     def rm_login(self, mxid: UserID, url: str) -> None:
         s = self.Session()
         token = s.query(ServerToken).get((mxid, url))
         s.delete(token)
         s.commit()
 
-    def get_login(self, mxid: UserID, url: str) -> AuthInfo:
+    @in_executor
+    def get_logins(self, mxid: UserID) -> List[AuthInfo]:
         s = self.Session()
-        row = s.query(ServerToken).filter(ServerToken.user_id == mxid, ServerToken.gitea_server == url).one()
-        return AuthInfo(server=row.gitea_server, api_token=row.api_token)
+        rows = s.query(ServerToken).filter(ServerToken.user_id == mxid)
+        return [self._auth_info(row) for row in rows]
 
-    def add_repos_alias(self, mxid: UserID, repos: str, alias: str) -> None:
+    def _auth_info(self, row: ServerToken) -> AuthInfo:
+        return AuthInfo(server=row.gitea_server, api_token=self.cipher.decrypt(row.api_token),
+                        login=row.login, version=row.version)
+
+    @in_executor
+    def encrypt_tokens(self) -> int:
+        """Encrypt the tokens stored before token_key was set, returns their number."""
+        if self.cipher.fernet is None:
+            return 0
         s = self.Session()
-        ralias = RepositoryAlias(user_id=mxid, gitea_repository=repos, alias=alias)
-        s.add(ralias)
+        rows = [row for row in s.query(ServerToken) if not self.cipher.is_encrypted(row.api_token)]
+        for row in rows:
+            row.api_token = self.cipher.encrypt(row.api_token)
         s.commit()
+        return len(rows)
+
+    @in_executor
+    def add_repos_alias(self, mxid: UserID, repos: str, alias: str) -> bool:
+        """Add the alias, returns False if the user already has an alias with that name."""
+        s = self.Session()
+        s.add(RepositoryAlias(user_id=mxid, gitea_repository=repos, alias=alias))
+        try:
+            s.commit()
+        except IntegrityError:
+            s.rollback()
+            return False
+        return True
 
+    @in_executor
     def get_repos_aliases(self, user_id: UserID) -> List[AliasInfo]:
         s = self.Session()
         rows = s.query(RepositoryAlias).filter(RepositoryAlias.user_id == user_id)
         return [AliasInfo(row.gitea_repository, row.alias) for row in rows]
 
-    def get_repos_alias(self, user_id: UserID, alias: str) -> str:
+    @in_executor
+    def rm_repos_alias(self, mxid: UserID, alias: str) -> None:
+        s = self.Session()
+        ralias = s.query(RepositoryAlias).filter(RepositoryAlias.user_id == mxid,
+                                                RepositoryAlias.alias == alias).one()
+        s.delete(ralias)
+        s.commit()
+
+    @in_executor
+    def add_delivery(self, info: HookInfo) -> int:
+        s = self.Session()
+        row = HookDelivery(delivery=info.delivery, event=info.event, room_id=info.room_id,
+                           body=info.body)
+        s.add(row)
+        s.commit()
+        return row.seq
+
+    @in_executor
+    def rm_delivery(self, seq: int) -> None:
+        s = self.Session()
+        s.query(HookDelivery).filter(HookDelivery.seq == seq).delete()
+        s.commit()
+
+    @in_executor
+    def get_deliveries(self) -> List[Tuple[int, HookInfo]]:
+        s = self.Session()
+        rows = s.query(HookDelivery).order_by(HookDelivery.seq)
+        return [(row.seq, HookInfo(row.delivery, row.event,
+                                   RoomID(row.room_id) if row.room_id else None, row.body))
+                for row in rows]
+
+    @in_executor
+    def has_seen_delivery(self, delivery: str, since: float) -> bool:
+        s = self.Session()
+        return s.query(SeenDelivery).filter(SeenDelivery.delivery == delivery,
+                                            SeenDelivery.seen_at >= since).count() > 0
+
+    @in_executor
+    def add_seen_delivery(self, delivery: str, seen_at: float) -> None:
+        s = self.Session()
+        s.merge(SeenDelivery(delivery=delivery, seen_at=seen_at))
+        s.commit()
+
+    @in_executor
+    def prune_seen_deliveries(self, before: float) -> None:
+        s = self.Session()
+        s.query(SeenDelivery).filter(SeenDelivery.seen_at < before).delete()
+        s.commit()
+
+    @in_executor
+    def add_subscription(self, room_id: RoomID, target: str) -> None:
+        s = self.Session()
+        s.merge(Subscription(room_id=room_id, target=target))
+        s.commit()
+
+    @in_executor
+    def rm_subscription(self, room_id: RoomID, target: str) -> None:
+        s = self.Session()
+        s.query(Subscription).filter(Subscription.room_id == room_id,
+                                     Subscription.target == target).delete()
+        s.commit()
+
+    @in_executor
+    def get_subscriptions(self, room_id: RoomID) -> List[str]:
+        s = self.Session()
+        rows = s.query(Subscription).filter(Subscription.room_id == room_id)
+        return [row.target for row in rows]
+
+    @in_executor
+    def get_subscribed_rooms(self, host: str, repository: str) -> List[RoomID]:
+        """
+        Rooms subscribed to the repository (owner/name) or to its owner on the
+        server, targets are stored as host/owner[/name].
+        """
+        s = self.Session()
+        owner = repository.split("/", 1)[0]
+        rows = s.query(Subscription.room_id).filter(or_(Subscription.target == f"{host}/{repository}",
+                                                        Subscription.target == f"{host}/{owner}")
+                                                    ).distinct()
+        return [RoomID(row.room_id) for row in rows]
+
+    @in_executor
+    def set_filter(self, room_id: RoomID, kind: str, patterns: List[str]) -> None:
+        s = self.Session()
+        s.merge(EventFilter(room_id=room_id, kind=kind, patterns=" ".join(patterns)))
+        s.commit()
+
+    @in_executor
+    def rm_filter(self, room_id: RoomID, kind: Optional[str] = None) -> None:
+        s = self.Session()
+        query = s.query(EventFilter).filter(EventFilter.room_id == room_id)
+        if kind:
+            query = query.filter(EventFilter.kind == kind)
+        query.delete()
+        s.commit()
+
+    @in_executor
+    def get_filters(self, room_id: RoomID) -> Dict[str, List[str]]:
+        s = self.Session()
+        rows = s.query(EventFilter).filter(EventFilter.room_id == room_id)
+        return {row.kind: row.patterns.split() for row in rows}
+
+    @in_executor
+    def get_item_message(self, room_id: RoomID, item: str) -> Optional[ItemMessageInfo]:
         s = self.Session()
-        row = s.query(RepositoryAlias).filter(RepositoryAlias.user_id == user_id, RepositoryAlias.alias == alias).scalar()
+        row = s.query(ItemMessage).get((room_id, item))
         if row:
-            return row.gitea_repository
+            return ItemMessageInfo(EventID(row.event_id), row.sent_at)
         return None
 
-    def has_repos_alias(self, user_id: UserID, alias: str) -> bool:
-        s: Session = self.Session()
-        return s.query(RepositoryAlias).filter(RepositoryAlias.user_id == user_id, RepositoryAlias.alias == alias).count() > 0
+    @in_executor
+    def set_item_message(self, room_id: RoomID, item: str, event_id: EventID,
+                         sent_at: float) -> None:
+        s = self.Session()
+        s.merge(ItemMessage(room_id=room_id, item=item, event_id=event_id, sent_at=sent_at))
+        s.commit()
 
-    def rm_repos_alias(self, mxid: UserID, alias: str) -> None:
+    @in_executor
+    def get_thread_root(self, room_id: RoomID, item: str) -> Optional[EventID]:
         s = self.Session()
-        ralias = s.query(RepositoryAlias).filter(RepositoryAlias.user_id == mxid,
-                                                RepositoryAlias.alias == alias).one()
-        s.delete(ralias)
+        row = s.query(ThreadRoot).get((room_id, item))
+        return EventID(row.event_id) if row else None
+
+    @in_executor
+    def set_thread_root(self, room_id: RoomID, item: str, event_id: EventID) -> None:
+        s = self.Session()
+        s.merge(ThreadRoot(room_id=room_id, item=item, event_id=event_id))
         s.commit()
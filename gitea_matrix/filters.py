@@ -0,0 +1,105 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern
+from fnmatch import translate
+import re
+
+from mautrix.types import RoomID
+
+from .db import Database
+from .formatters import HookContext
+
+FILTER_KINDS = ("events", "branches", "labels", "senders")
+# Payload fields read by RoomFilter.accepts().
+FILTER_FIELDS = ("ref", "ref_type", "pull_request", "issue")
+
+
+def _branch(event: str, body: Dict[str, Any]) -> Optional[str]:
+    """The branch an event applies to, or None if it is not about a branch."""
+    if event == "push":
+        ref = body.get("ref", "")
+        return ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else None
+    if event in ("create", "delete"):
+        return body.get("ref") if body.get("ref_type") == "branch" else None
+    if event.startswith("pull_request"):
+        return ((body.get("pull_request") or {}).get("base") or {}).get("ref")
+    return None
+
+
+def _labels(body: Dict[str, Any]) -> Optional[List[str]]:
+    """The label names of the issue or pull request, or None if there is none."""
+    item = body.get("pull_request") or body.get("issue")
+    if not item:
+        return None
+    return [label["name"] for label in item.get("labels") or ()]
+
+
+class RoomFilter:
+    """
+    The compiled filters of one room. Each kind of filter that is not set lets
+    every event through:
+
+    * events: the X-Gitea-Event values to send.
+    * branches: glob patterns, events about other branches are dropped.
+    * labels: issues and pull requests need at least one of these labels.
+    * senders: users whose events are dropped.
+    """
+    events: Optional[FrozenSet[str]]
+    branches: Optional[Pattern]
+    labels: Optional[FrozenSet[str]]
+    senders: FrozenSet[str]
+
+    def __init__(self, filters: Dict[str, List[str]]) -> None:
+        self.events = frozenset(filters["events"]) if filters.get("events") else None
+        self.branches = (re.compile("|".join(translate(glob) for glob in filters["branches"]))
+                         if filters.get("branches") else None)
+        self.labels = frozenset(filters["labels"]) if filters.get("labels") else None
+        self.senders = frozenset(filters.get("senders", ()))
+
+    def accepts_event(self, event: str) -> bool:
+        """Check the event type, before the payload is parsed."""
+        return self.events is None or event in self.events
+
+    def accepts(self, event: str, ctx: HookContext, body: Dict[str, Any]) -> bool:
+        if not self.accepts_event(event) or ctx.sender in self.senders:
+            return False
+        if self.branches is not None:
+            branch = _branch(event, body)
+            if branch is not None and not self.branches.match(branch):
+                return False
+        if self.labels is not None:
+            labels = _labels(body)
+            if labels is not None and self.labels.isdisjoint(labels):
+                return False
+        return True
+
+
+class FilterCache:
+    """Compiled RoomFilters, loaded from the database on first use."""
+    filters: Dict[RoomID, RoomFilter]
+
+    def __init__(self, db: Database) -> None:
+        self.db = db
+        self.filters = {}
+
+    async def get(self, room_id: RoomID) -> RoomFilter:
+        try:
+            return self.filters[room_id]
+        except KeyError:
+            room_filter = self.filters[room_id] = RoomFilter(await self.db.get_filters(room_id))
+            return room_filter
+
+    def invalidate(self, room_id: RoomID) -> None:
+        self.filters.pop(room_id, None)
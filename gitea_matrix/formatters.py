@@ -0,0 +1,300 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+from copy import copy
+from html import escape
+from itertools import islice
+
+from yarl import URL
+
+HookContext = NamedTuple('HookContext', sender=str, repo=str, host=str)
+HookItem = Tuple[HookContext, Dict[str, Any]]
+# A message with separate plain text and HTML bodies, plain strings are sent as markdown.
+# Formatters always return HookMessages, the payload values they insert are not trusted.
+HookMessage = NamedTuple('HookMessage', text=str, html=str)
+Message = Union[str, HookMessage]
+# The issue or pull request a message is about. Messages about its state may
+# replace each other, other messages (comments, reviews) are only grouped with them.
+ItemRef = NamedTuple('ItemRef', key=str, state=bool)
+
+# Payload fields read by hook_context().
+CONTEXT_FIELDS = ("sender", "repository")
+
+
+def join_names(names: Iterable[str]) -> str:
+    """Quote and join the distinct names, in order of appearance."""
+    return ", ".join(f"'{name}'" for name in dict.fromkeys(names))
+
+
+def short_ref(ref: str) -> str:
+    """The branch or tag name of a git ref, which may contain slashes."""
+    for prefix in ("refs/heads/", "refs/tags/"):
+        if ref.startswith(prefix):
+            return ref[len(prefix):]
+    return ref
+
+
+def plain(text: str) -> HookMessage:
+    """A message shown as the text is, with HTML and markdown in it escaped."""
+    return HookMessage(text=text, html=escape(text, quote=False))
+
+
+def hook_context(body: Dict[str, Any]) -> HookContext:
+    """Extract the fields shared by all event messages, once per delivery."""
+    repository = body.get("repository") or {}
+    sender = body.get("sender") or {}
+    html_url = repository.get("html_url")
+    return HookContext(sender=sender.get("login", ""),
+                       repo=repository.get("full_name", ""),
+                       host=URL(html_url).host if html_url else "")
+
+
+class HookFormatter:
+    """
+    Turns the payload of one Gitea event type into a room message.
+
+    The template is a str.format string with the HookContext as ``ctx`` and the
+    decoded payload as ``body``, the result is sent as plain text. summarize() merges several events of the same
+    type into one message.
+
+    fields lists the top-level payload fields the formatter reads, select()
+    drops all others so large payloads are not kept around while queued or
+    coalesced.
+    """
+    name: str = "event"
+    fields: Sequence[str] = ()
+    template: str = ""
+    summary_template: str = ("{count} {name} events by {senders} in "
+                             "'{ctx.repo}' at '{ctx.host}'.")
+
+    def select(self, body: Dict[str, Any], keep: Sequence[str] = ()) -> Dict[str, Any]:
+        """Reduce the payload to the fields of this formatter, the context and keep."""
+        return {key: body[key] for key in (*CONTEXT_FIELDS, *self.fields, *keep) if key in body}
+
+    def format(self, ctx: HookContext, body: Dict[str, Any]) -> Optional[Message]:
+        return plain(self.template.format(ctx=ctx, body=body))
+
+    def item(self, ctx: HookContext, body: Dict[str, Any]) -> Optional[ItemRef]:
+        """The issue or pull request the message is about."""
+        return None
+
+    def summarize(self, items: List[HookItem]) -> Optional[Message]:
+        if len(items) == 1:
+            return self.format(*items[0])
+        return plain(self.summary_template.format(
+            ctx=items[0][0], count=len(items), name=self.name,
+            senders=join_names(ctx.sender for ctx, _ in items)))
+
+
+FORMATTERS: Dict[str, HookFormatter] = {}
+
+
+def formatter(*events: str) -> Callable[[Type[HookFormatter]], Type[HookFormatter]]:
+    """Register a formatter class for the given X-Gitea-Event values."""
+    def decorator(cls: Type[HookFormatter]) -> Type[HookFormatter]:
+        instance = cls()
+        for evt in events:
+            FORMATTERS[evt] = instance
+        return cls
+
+    return decorator
+
+
+@formatter("push")
+class PushFormatter(HookFormatter):
+    name = "push"
+    fields = ("ref", "compare_url")
+    template = ("user '{ctx.sender}' pushed {count} commit(s) to "
+                "'{ctx.repo}' at '{ctx.host}'.")
+    summary_template = ("{count} pushes, {commits} commits to {refs} by {senders} in "
+                        "'{ctx.repo}' at '{ctx.host}'.")
+    # Number of commits listed in a push message.
+    max_commits = 5
+    # Maximum length of a listed commit's first message line.
+    max_line = 72
+
+    def select(self, body: Dict[str, Any], keep: Sequence[str] = ()) -> Dict[str, Any]:
+        # Only the first max_commits commits are kept, without their file lists.
+        selected = super().select(body, keep)
+        commits = body.get("commits") or ()
+        selected["commit_count"] = len(commits)
+        selected["commits"] = [self._commit(commit) for commit in islice(commits, self.max_commits)]
+        return selected
+
+    def _commit(self, commit: Dict[str, Any]) -> Dict[str, str]:
+        line = (commit.get("message") or "").strip().partition("\n")[0]
+        if len(line) > self.max_line:
+            line = line[:self.max_line - 1] + "…"
+        author = commit.get("author") or {}
+        return {"sha": commit.get("id", "")[:7], "url": commit.get("url", ""), "line": line,
+                "author": author.get("username") or author.get("name", "")}
+
+    def format(self, ctx: HookContext, body: Dict[str, Any]) -> Optional[Message]:
+        count = body["commit_count"]
+        if count == 0:
+            return None
+        head = self.template.format(ctx=ctx, count=count)
+        commits = body.get("commits") or ()
+        text = [head, ""] + [f"* {c['sha']} {c['author']}: {c['line']}" for c in commits]
+        html = [escape(head, quote=False), "<ul>"] + [
+            f"<li><a href=\"{escape(c['url'])}\"><code>{c['sha']}</code></a> "
+            f"{escape(c['author'], quote=False)}: {escape(c['line'], quote=False)}</li>" for c in commits] + ["</ul>"]
+        more = count - len(commits)
+        compare_url = body.get("compare_url")
+        if more > 0 or compare_url:
+            tail = f"and {more} more commit(s)" if more > 0 else "Compare"
+            text.append(f"{tail}: {compare_url}" if compare_url else f"{tail}.")
+            html.append(f"<a href=\"{escape(compare_url)}\">{tail}</a>" if compare_url
+                        else f"{tail}.")
+        return HookMessage(text="\n".join(text), html="".join(html))
+
+    def summarize(self, items: List[HookItem]) -> Optional[Message]:
+        items = [(ctx, body) for ctx, body in items if body["commit_count"]]
+        if len(items) <= 1:
+            return self.format(*items[0]) if items else None
+        refs = join_names(short_ref(body["ref"]) for _, body in items)
+        return plain(self.summary_template.format(
+            ctx=items[0][0], count=len(items), refs=refs,
+            commits=sum(body["commit_count"] for _, body in items),
+            senders=join_names(ctx.sender for ctx, _ in items)))
+
+
+@formatter("create")
+class CreateFormatter(HookFormatter):
+    name = "create"
+    fields = ("ref", "ref_type")
+    template = ("user '{ctx.sender}' created {body[ref_type]} '{body[ref]}' in "
+                "'{ctx.repo}' at '{ctx.host}'.")
+
+
+@formatter("delete")
+class DeleteFormatter(HookFormatter):
+    name = "delete"
+    fields = ("ref", "ref_type")
+    template = ("user '{ctx.sender}' deleted {body[ref_type]} '{body[ref]}' in "
+                "'{ctx.repo}' at '{ctx.host}'.")
+
+
+@formatter("issues")
+class IssueFormatter(HookFormatter):
+    name = "issue"
+    fields = ("action", "number")
+    template = ("user '{ctx.sender}' {body[action]} issue #{body[number]} in "
+                "'{ctx.repo}' at '{ctx.host}'.")
+
+    def item(self, ctx: HookContext, body: Dict[str, Any]) -> Optional[ItemRef]:
+        return ItemRef(f"{ctx.repo}#{body['number']}", state=True)
+
+
+@formatter("issue_comment")
+class IssueCommentFormatter(HookFormatter):
+    name = "issue comment"
+    fields = ("action", "issue")
+    template = ("user '{ctx.sender}' {body[action]} a comment on issue #{body[issue][number]} in "
+                "'{ctx.repo}' at '{ctx.host}'.")
+
+    def item(self, ctx: HookContext, body: Dict[str, Any]) -> Optional[ItemRef]:
+        return ItemRef(f"{ctx.repo}#{body['issue']['number']}", state=False)
+
+
+@formatter("pull_request")
+class PullRequestFormatter(HookFormatter):
+    name = "pull request"
+    fields = ("action", "number", "pull_request")
+    template = ("user '{ctx.sender}' {body[action]} pull request #{body[number]} "
+                "'{body[pull_request][title]}' in '{ctx.repo}' at '{ctx.host}'.")
+
+    def item(self, ctx: HookContext, body: Dict[str, Any]) -> Optional[ItemRef]:
+        return ItemRef(f"{ctx.repo}#{body['number']}", state=True)
+
+
+@formatter("pull_request_review", "pull_request_approved", "pull_request_rejected",
+           "pull_request_comment")
+class PullRequestReviewFormatter(HookFormatter):
+    name = "review"
+    fields = ("number", "review")
+    template = ("user '{ctx.sender}' {verb} pull request #{body[number]} in "
+                "'{ctx.repo}' at '{ctx.host}'.")
+    verbs = {
+        "pull_request_review_approved": "approved",
+        "pull_request_review_rejected": "requested changes on",
+        "pull_request_review_comment": "reviewed",
+    }
+
+    def format(self, ctx: HookContext, body: Dict[str, Any]) -> Optional[Message]:
+        review_type = (body.get("review") or {}).get("type", "")
+        return plain(self.template.format(ctx=ctx, body=body,
+                                          verb=self.verbs.get(review_type, "reviewed")))
+
+    def item(self, ctx: HookContext, body: Dict[str, Any]) -> Optional[ItemRef]:
+        return ItemRef(f"{ctx.repo}#{body['number']}", state=False)
+
+
+@formatter("release")
+class ReleaseFormatter(HookFormatter):
+    name = "release"
+    fields = ("action", "release")
+    template = ("user '{ctx.sender}' {body[action]} release '{body[release][tag_name]}' in "
+                "'{ctx.repo}' at '{ctx.host}'.")
+
+
+@formatter("fork")
+class ForkFormatter(HookFormatter):
+    name = "fork"
+    fields = ("forkee",)
+    template = ("user '{ctx.sender}' forked '{body[forkee][full_name]}' to "
+                "'{ctx.repo}' at '{ctx.host}'.")
+
+
+@formatter("repository")
+class RepositoryFormatter(HookFormatter):
+    name = "repository"
+    fields = ("action",)
+    template = ("user '{ctx.sender}' {body[action]} repository "
+                "'{ctx.repo}' at '{ctx.host}'.")
+
+
+@formatter("wiki")
+class WikiFormatter(HookFormatter):
+    name = "wiki"
+    fields = ("action", "page")
+    template = ("user '{ctx.sender}' {body[action]} wiki page '{body[page]}' in "
+                "'{ctx.repo}' at '{ctx.host}'.")
+
+
+@formatter("status")
+class StatusFormatter(HookFormatter):
+    name = "status"
+    fields = ("sha", "state", "context")
+    template = ("status of commit {sha} is {body[state]} ({body[context]}) in "
+                "'{ctx.repo}' at '{ctx.host}'.")
+
+    def format(self, ctx: HookContext, body: Dict[str, Any]) -> Optional[Message]:
+        return plain(self.template.format(ctx=ctx, body=body, sha=body["sha"][:10]))
+
+
+def create_formatters(max_commits: int = PushFormatter.max_commits) -> Dict[str, HookFormatter]:
+    """
+    Copies of the registered formatters with the settings of one plugin instance.
+    All instances share this module, so FORMATTERS itself is never changed.
+    """
+    copies = {}
+    formatters = {}
+    for evt, instance in FORMATTERS.items():
+        if id(instance) not in copies:
+            copies[id(instance)] = copy(instance)
+        formatters[evt] = copies[id(instance)]
+    formatters["push"].max_commits = max_commits
+    return formatters
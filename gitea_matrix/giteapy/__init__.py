@@ -15,140 +15,294 @@
 
 from __future__ import absolute_import
 
-# import apis into sdk package
-from .api.admin_api import AdminApi
-from .api.issue_api import IssueApi
-from .api.miscellaneous_api import MiscellaneousApi
-from .api.notification_api import NotificationApi
-from .api.organization_api import OrganizationApi
-from .api.repository_api import RepositoryApi
-from .api.user_api import UserApi
+import importlib
+from typing import TYPE_CHECKING
 
 # import ApiClient
 from .api_client import ApiClient
 from .configuration import Configuration
-# import models into sdk package
-from .models.api_error import APIError
-from .models.access_token import AccessToken
-from .models.add_collaborator_option import AddCollaboratorOption
-from .models.add_time_option import AddTimeOption
-from .models.annotated_tag import AnnotatedTag
-from .models.annotated_tag_object import AnnotatedTagObject
-from .models.attachment import Attachment
-from .models.branch import Branch
-from .models.branch_protection import BranchProtection
-from .models.comment import Comment
-from .models.commit import Commit
-from .models.commit_date_options import CommitDateOptions
-from .models.commit_meta import CommitMeta
-from .models.commit_user import CommitUser
-from .models.contents_response import ContentsResponse
-from .models.create_branch_protection_option import CreateBranchProtectionOption
-from .models.create_email_option import CreateEmailOption
-from .models.create_file_options import CreateFileOptions
-from .models.create_fork_option import CreateForkOption
-from .models.create_gpg_key_option import CreateGPGKeyOption
-from .models.create_hook_option import CreateHookOption
-from .models.create_hook_option_config import CreateHookOptionConfig
-from .models.create_issue_comment_option import CreateIssueCommentOption
-from .models.create_issue_option import CreateIssueOption
-from .models.create_key_option import CreateKeyOption
-from .models.create_label_option import CreateLabelOption
-from .models.create_milestone_option import CreateMilestoneOption
-from .models.create_o_auth2_application_options import CreateOAuth2ApplicationOptions
-from .models.create_org_option import CreateOrgOption
-from .models.create_pull_request_option import CreatePullRequestOption
-from .models.create_pull_review_comment import CreatePullReviewComment
-from .models.create_pull_review_options import CreatePullReviewOptions
-from .models.create_release_option import CreateReleaseOption
-from .models.create_repo_option import CreateRepoOption
-from .models.create_status_option import CreateStatusOption
-from .models.create_team_option import CreateTeamOption
-from .models.create_user_option import CreateUserOption
-from .models.delete_email_option import DeleteEmailOption
-from .models.delete_file_options import DeleteFileOptions
-from .models.deploy_key import DeployKey
-from .models.edit_attachment_options import EditAttachmentOptions
-from .models.edit_branch_protection_option import EditBranchProtectionOption
-from .models.edit_deadline_option import EditDeadlineOption
-from .models.edit_git_hook_option import EditGitHookOption
-from .models.edit_hook_option import EditHookOption
-from .models.edit_issue_comment_option import EditIssueCommentOption
-from .models.edit_issue_option import EditIssueOption
-from .models.edit_label_option import EditLabelOption
-from .models.edit_milestone_option import EditMilestoneOption
-from .models.edit_org_option import EditOrgOption
-from .models.edit_pull_request_option import EditPullRequestOption
-from .models.edit_reaction_option import EditReactionOption
-from .models.edit_release_option import EditReleaseOption
-from .models.edit_repo_option import EditRepoOption
-from .models.edit_team_option import EditTeamOption
-from .models.edit_user_option import EditUserOption
-from .models.email import Email
-from .models.external_tracker import ExternalTracker
-from .models.external_wiki import ExternalWiki
-from .models.file_commit_response import FileCommitResponse
-from .models.file_delete_response import FileDeleteResponse
-from .models.file_links_response import FileLinksResponse
-from .models.file_response import FileResponse
-from .models.gpg_key import GPGKey
-from .models.gpg_key_email import GPGKeyEmail
-from .models.git_blob_response import GitBlobResponse
-from .models.git_entry import GitEntry
-from .models.git_hook import GitHook
-from .models.git_object import GitObject
-from .models.git_tree_response import GitTreeResponse
-from .models.hook import Hook
-from .models.identity import Identity
-from .models.inline_response200 import InlineResponse200
-from .models.inline_response2001 import InlineResponse2001
-from .models.internal_tracker import InternalTracker
-from .models.issue import Issue
-from .models.issue_deadline import IssueDeadline
-from .models.issue_labels_option import IssueLabelsOption
-from .models.label import Label
-from .models.markdown_option import MarkdownOption
-from .models.merge_pull_request_option import MergePullRequestOption
-from .models.migrate_repo_form import MigrateRepoForm
-from .models.milestone import Milestone
-from .models.notification_count import NotificationCount
-from .models.notification_subject import NotificationSubject
-from .models.notification_thread import NotificationThread
-from .models.o_auth2_application import OAuth2Application
-from .models.organization import Organization
-from .models.pr_branch_info import PRBranchInfo
-from .models.payload_commit import PayloadCommit
-from .models.payload_commit_verification import PayloadCommitVerification
-from .models.payload_user import PayloadUser
-from .models.permission import Permission
-from .models.public_key import PublicKey
-from .models.pull_request import PullRequest
-from .models.pull_request_meta import PullRequestMeta
-from .models.pull_review import PullReview
-from .models.pull_review_comment import PullReviewComment
-from .models.reaction import Reaction
-from .models.reference import Reference
-from .models.release import Release
-from .models.repo_commit import RepoCommit
-from .models.repo_topic_options import RepoTopicOptions
-from .models.repository import Repository
-from .models.repository_meta import RepositoryMeta
-from .models.review_state_type import ReviewStateType
-from .models.search_results import SearchResults
-from .models.server_version import ServerVersion
-from .models.state_type import StateType
-from .models.status import Status
-from .models.status_state import StatusState
-from .models.stop_watch import StopWatch
-from .models.submit_pull_review_options import SubmitPullReviewOptions
-from .models.tag import Tag
-from .models.team import Team
-from .models.time_stamp import TimeStamp
-from .models.topic_name import TopicName
-from .models.topic_response import TopicResponse
-from .models.tracked_time import TrackedTime
-from .models.transfer_repo_option import TransferRepoOption
-from .models.update_file_options import UpdateFileOptions
-from .models.user import User
-from .models.user_heatmap_data import UserHeatmapData
-from .models.watch_info import WatchInfo
+
+# apis and models of the sdk package, imported on first access
+_MODULES = {
+    "AdminApi": ".api.admin_api",
+    "IssueApi": ".api.issue_api",
+    "MiscellaneousApi": ".api.miscellaneous_api",
+    "NotificationApi": ".api.notification_api",
+    "OrganizationApi": ".api.organization_api",
+    "RepositoryApi": ".api.repository_api",
+    "UserApi": ".api.user_api",
+    "APIError": ".models.api_error",
+    "AccessToken": ".models.access_token",
+    "AddCollaboratorOption": ".models.add_collaborator_option",
+    "AddTimeOption": ".models.add_time_option",
+    "AnnotatedTag": ".models.annotated_tag",
+    "AnnotatedTagObject": ".models.annotated_tag_object",
+    "Attachment": ".models.attachment",
+    "Branch": ".models.branch",
+    "BranchProtection": ".models.branch_protection",
+    "Comment": ".models.comment",
+    "Commit": ".models.commit",
+    "CommitDateOptions": ".models.commit_date_options",
+    "CommitMeta": ".models.commit_meta",
+    "CommitUser": ".models.commit_user",
+    "ContentsResponse": ".models.contents_response",
+    "CreateBranchProtectionOption": ".models.create_branch_protection_option",
+    "CreateEmailOption": ".models.create_email_option",
+    "CreateFileOptions": ".models.create_file_options",
+    "CreateForkOption": ".models.create_fork_option",
+    "CreateGPGKeyOption": ".models.create_gpg_key_option",
+    "CreateHookOption": ".models.create_hook_option",
+    "CreateHookOptionConfig": ".models.create_hook_option_config",
+    "CreateIssueCommentOption": ".models.create_issue_comment_option",
+    "CreateIssueOption": ".models.create_issue_option",
+    "CreateKeyOption": ".models.create_key_option",
+    "CreateLabelOption": ".models.create_label_option",
+    "CreateMilestoneOption": ".models.create_milestone_option",
+    "CreateOAuth2ApplicationOptions": ".models.create_o_auth2_application_options",
+    "CreateOrgOption": ".models.create_org_option",
+    "CreatePullRequestOption": ".models.create_pull_request_option",
+    "CreatePullReviewComment": ".models.create_pull_review_comment",
+    "CreatePullReviewOptions": ".models.create_pull_review_options",
+    "CreateReleaseOption": ".models.create_release_option",
+    "CreateRepoOption": ".models.create_repo_option",
+    "CreateStatusOption": ".models.create_status_option",
+    "CreateTeamOption": ".models.create_team_option",
+    "CreateUserOption": ".models.create_user_option",
+    "DeleteEmailOption": ".models.delete_email_option",
+    "DeleteFileOptions": ".models.delete_file_options",
+    "DeployKey": ".models.deploy_key",
+    "EditAttachmentOptions": ".models.edit_attachment_options",
+    "EditBranchProtectionOption": ".models.edit_branch_protection_option",
+    "EditDeadlineOption": ".models.edit_deadline_option",
+    "EditGitHookOption": ".models.edit_git_hook_option",
+    "EditHookOption": ".models.edit_hook_option",
+    "EditIssueCommentOption": ".models.edit_issue_comment_option",
+    "EditIssueOption": ".models.edit_issue_option",
+    "EditLabelOption": ".models.edit_label_option",
+    "EditMilestoneOption": ".models.edit_milestone_option",
+    "EditOrgOption": ".models.edit_org_option",
+    "EditPullRequestOption": ".models.edit_pull_request_option",
+    "EditReactionOption": ".models.edit_reaction_option",
+    "EditReleaseOption": ".models.edit_release_option",
+    "EditRepoOption": ".models.edit_repo_option",
+    "EditTeamOption": ".models.edit_team_option",
+    "EditUserOption": ".models.edit_user_option",
+    "Email": ".models.email",
+    "ExternalTracker": ".models.external_tracker",
+    "ExternalWiki": ".models.external_wiki",
+    "FileCommitResponse": ".models.file_commit_response",
+    "FileDeleteResponse": ".models.file_delete_response",
+    "FileLinksResponse": ".models.file_links_response",
+    "FileResponse": ".models.file_response",
+    "GPGKey": ".models.gpg_key",
+    "GPGKeyEmail": ".models.gpg_key_email",
+    "GitBlobResponse": ".models.git_blob_response",
+    "GitEntry": ".models.git_entry",
+    "GitHook": ".models.git_hook",
+    "GitObject": ".models.git_object",
+    "GitTreeResponse": ".models.git_tree_response",
+    "Hook": ".models.hook",
+    "Identity": ".models.identity",
+    "InlineResponse200": ".models.inline_response200",
+    "InlineResponse2001": ".models.inline_response2001",
+    "InternalTracker": ".models.internal_tracker",
+    "Issue": ".models.issue",
+    "IssueDeadline": ".models.issue_deadline",
+    "IssueLabelsOption": ".models.issue_labels_option",
+    "Label": ".models.label",
+    "MarkdownOption": ".models.markdown_option",
+    "MergePullRequestOption": ".models.merge_pull_request_option",
+    "MigrateRepoForm": ".models.migrate_repo_form",
+    "Milestone": ".models.milestone",
+    "NotificationCount": ".models.notification_count",
+    "NotificationSubject": ".models.notification_subject",
+    "NotificationThread": ".models.notification_thread",
+    "OAuth2Application": ".models.o_auth2_application",
+    "Organization": ".models.organization",
+    "PRBranchInfo": ".models.pr_branch_info",
+    "PayloadCommit": ".models.payload_commit",
+    "PayloadCommitVerification": ".models.payload_commit_verification",
+    "PayloadUser": ".models.payload_user",
+    "Permission": ".models.permission",
+    "PublicKey": ".models.public_key",
+    "PullRequest": ".models.pull_request",
+    "PullRequestMeta": ".models.pull_request_meta",
+    "PullReview": ".models.pull_review",
+    "PullReviewComment": ".models.pull_review_comment",
+    "Reaction": ".models.reaction",
+    "Reference": ".models.reference",
+    "Release": ".models.release",
+    "RepoCommit": ".models.repo_commit",
+    "RepoTopicOptions": ".models.repo_topic_options",
+    "Repository": ".models.repository",
+    "RepositoryMeta": ".models.repository_meta",
+    "ReviewStateType": ".models.review_state_type",
+    "SearchResults": ".models.search_results",
+    "ServerVersion": ".models.server_version",
+    "StateType": ".models.state_type",
+    "Status": ".models.status",
+    "StatusState": ".models.status_state",
+    "StopWatch": ".models.stop_watch",
+    "SubmitPullReviewOptions": ".models.submit_pull_review_options",
+    "Tag": ".models.tag",
+    "Team": ".models.team",
+    "TimeStamp": ".models.time_stamp",
+    "TopicName": ".models.topic_name",
+    "TopicResponse": ".models.topic_response",
+    "TrackedTime": ".models.tracked_time",
+    "TransferRepoOption": ".models.transfer_repo_option",
+    "UpdateFileOptions": ".models.update_file_options",
+    "User": ".models.user",
+    "UserHeatmapData": ".models.user_heatmap_data",
+    "WatchInfo": ".models.watch_info",
+}
+
+__all__ = ["ApiClient", "Configuration"] + list(_MODULES)
+
+if TYPE_CHECKING:
+    from .api.admin_api import AdminApi
+    from .api.issue_api import IssueApi
+    from .api.miscellaneous_api import MiscellaneousApi
+    from .api.notification_api import NotificationApi
+    from .api.organization_api import OrganizationApi
+    from .api.repository_api import RepositoryApi
+    from .api.user_api import UserApi
+    from .models.api_error import APIError
+    from .models.access_token import AccessToken
+    from .models.add_collaborator_option import AddCollaboratorOption
+    from .models.add_time_option import AddTimeOption
+    from .models.annotated_tag import AnnotatedTag
+    from .models.annotated_tag_object import AnnotatedTagObject
+    from .models.attachment import Attachment
+    from .models.branch import Branch
+    from .models.branch_protection import BranchProtection
+    from .models.comment import Comment
+    from .models.commit import Commit
+    from .models.commit_date_options import CommitDateOptions
+    from .models.commit_meta import CommitMeta
+    from .models.commit_user import CommitUser
+    from .models.contents_response import ContentsResponse
+    from .models.create_branch_protection_option import CreateBranchProtectionOption
+    from .models.create_email_option import CreateEmailOption
+    from .models.create_file_options import CreateFileOptions
+    from .models.create_fork_option import CreateForkOption
+    from .models.create_gpg_key_option import CreateGPGKeyOption
+    from .models.create_hook_option import CreateHookOption
+    from .models.create_hook_option_config import CreateHookOptionConfig
+    from .models.create_issue_comment_option import CreateIssueCommentOption
+    from .models.create_issue_option import CreateIssueOption
+    from .models.create_key_option import CreateKeyOption
+    from .models.create_label_option import CreateLabelOption
+    from .models.create_milestone_option import CreateMilestoneOption
+    from .models.create_o_auth2_application_options import CreateOAuth2ApplicationOptions
+    from .models.create_org_option import CreateOrgOption
+    from .models.create_pull_request_option import CreatePullRequestOption
+    from .models.create_pull_review_comment import CreatePullReviewComment
+    from .models.create_pull_review_options import CreatePullReviewOptions
+    from .models.create_release_option import CreateReleaseOption
+    from .models.create_repo_option import CreateRepoOption
+    from .models.create_status_option import CreateStatusOption
+    from .models.create_team_option import CreateTeamOption
+    from .models.create_user_option import CreateUserOption
+    from .models.delete_email_option import DeleteEmailOption
+    from .models.delete_file_options import DeleteFileOptions
+    from .models.deploy_key import DeployKey
+    from .models.edit_attachment_options import EditAttachmentOptions
+    from .models.edit_branch_protection_option import EditBranchProtectionOption
+    from .models.edit_deadline_option import EditDeadlineOption
+    from .models.edit_git_hook_option import EditGitHookOption
+    from .models.edit_hook_option import EditHookOption
+    from .models.edit_issue_comment_option import EditIssueCommentOption
+    from .models.edit_issue_option import EditIssueOption
+    from .models.edit_label_option import EditLabelOption
+    from .models.edit_milestone_option import EditMilestoneOption
+    from .models.edit_org_option import EditOrgOption
+    from .models.edit_pull_request_option import EditPullRequestOption
+    from .models.edit_reaction_option import EditReactionOption
+    from .models.edit_release_option import EditReleaseOption
+    from .models.edit_repo_option import EditRepoOption
+    from .models.edit_team_option import EditTeamOption
+    from .models.edit_user_option import EditUserOption
+    from .models.email import Email
+    from .models.external_tracker import ExternalTracker
+    from .models.external_wiki import ExternalWiki
+    from .models.file_commit_response import FileCommitResponse
+    from .models.file_delete_response import FileDeleteResponse
+    from .models.file_links_response import FileLinksResponse
+    from .models.file_response import FileResponse
+    from .models.gpg_key import GPGKey
+    from .models.gpg_key_email import GPGKeyEmail
+    from .models.git_blob_response import GitBlobResponse
+    from .models.git_entry import GitEntry
+    from .models.git_hook import GitHook
+    from .models.git_object import GitObject
+    from .models.git_tree_response import GitTreeResponse
+    from .models.hook import Hook
+    from .models.identity import Identity
+    from .models.inline_response200 import InlineResponse200
+    from .models.inline_response2001 import InlineResponse2001
+    from .models.internal_tracker import InternalTracker
+    from .models.issue import Issue
+    from .models.issue_deadline import IssueDeadline
+    from .models.issue_labels_option import IssueLabelsOption
+    from .models.label import Label
+    from .models.markdown_option import MarkdownOption
+    from .models.merge_pull_request_option import MergePullRequestOption
+    from .models.migrate_repo_form import MigrateRepoForm
+    from .models.milestone import Milestone
+    from .models.notification_count import NotificationCount
+    from .models.notification_subject import NotificationSubject
+    from .models.notification_thread import NotificationThread
+    from .models.o_auth2_application import OAuth2Application
+    from .models.organization import Organization
+    from .models.pr_branch_info import PRBranchInfo
+    from .models.payload_commit import PayloadCommit
+    from .models.payload_commit_verification import PayloadCommitVerification
+    from .models.payload_user import PayloadUser
+    from .models.permission import Permission
+    from .models.public_key import PublicKey
+    from .models.pull_request import PullRequest
+    from .models.pull_request_meta import PullRequestMeta
+    from .models.pull_review import PullReview
+    from .models.pull_review_comment import PullReviewComment
+    from .models.reaction import Reaction
+    from .models.reference import Reference
+    from .models.release import Release
+    from .models.repo_commit import RepoCommit
+    from .models.repo_topic_options import RepoTopicOptions
+    from .models.repository import Repository
+    from .models.repository_meta import RepositoryMeta
+    from .models.review_state_type import ReviewStateType
+    from .models.search_results import SearchResults
+    from .models.server_version import ServerVersion
+    from .models.state_type import StateType
+    from .models.status import Status
+    from .models.status_state import StatusState
+    from .models.stop_watch import StopWatch
+    from .models.submit_pull_review_options import SubmitPullReviewOptions
+    from .models.tag import Tag
+    from .models.team import Team
+    from .models.time_stamp import TimeStamp
+    from .models.topic_name import TopicName
+    from .models.topic_response import TopicResponse
+    from .models.tracked_time import TrackedTime
+    from .models.transfer_repo_option import TransferRepoOption
+    from .models.update_file_options import UpdateFileOptions
+    from .models.user import User
+    from .models.user_heatmap_data import UserHeatmapData
+    from .models.watch_info import WatchInfo
+
+
+def __getattr__(name):
+    # PEP 562: import the module defining name on first access.
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
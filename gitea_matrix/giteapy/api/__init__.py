@@ -1,12 +1,43 @@
+# flake8: noqa
+
 from __future__ import absolute_import
 
-# flake8: noqa
+import importlib
+from typing import TYPE_CHECKING
+
+# apis of the api package, imported on first access
+_MODULES = {
+    "AdminApi": ".admin_api",
+    "IssueApi": ".issue_api",
+    "MiscellaneousApi": ".miscellaneous_api",
+    "NotificationApi": ".notification_api",
+    "OrganizationApi": ".organization_api",
+    "RepositoryApi": ".repository_api",
+    "UserApi": ".user_api",
+}
+
+__all__ = list(_MODULES)
+
+if TYPE_CHECKING:
+    from .admin_api import AdminApi
+    from .issue_api import IssueApi
+    from .miscellaneous_api import MiscellaneousApi
+    from .notification_api import NotificationApi
+    from .organization_api import OrganizationApi
+    from .repository_api import RepositoryApi
+    from .user_api import UserApi
+
+
+def __getattr__(name):
+    # PEP 562: import the module defining name on first access.
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-# import apis into api package
-from .admin_api import AdminApi
-from .issue_api import IssueApi
-from .miscellaneous_api import MiscellaneousApi
-from .notification_api import NotificationApi
-from .organization_api import OrganizationApi
-from .repository_api import RepositoryApi
-from .user_api import UserApi
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
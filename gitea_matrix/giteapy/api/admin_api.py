@@ -36,17 +36,17 @@ class AdminApi(object):
     def admin_create_org(self, username, organization, **kwargs):  # noqa: E501
         """Create an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_create_org(username, organization, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_create_org(username, organization, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of the user that will own the created organization (required)
         :param CreateOrgOption organization: (required)
         :return: Organization
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -58,17 +58,17 @@ class AdminApi(object):
     def admin_create_org_with_http_info(self, username, organization, **kwargs):  # noqa: E501
         """Create an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_create_org_with_http_info(username, organization, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_create_org_with_http_info(username, organization, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of the user that will own the created organization (required)
         :param CreateOrgOption organization: (required)
         :return: Organization
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'organization']  # noqa: E501
@@ -76,6 +76,7 @@ class AdminApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -136,22 +137,23 @@ class AdminApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def admin_create_public_key(self, username, **kwargs):  # noqa: E501
         """Add a public key on behalf of a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_create_public_key(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_create_public_key(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of the user (required)
         :param CreateKeyOption key:
         :return: PublicKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -163,17 +165,17 @@ class AdminApi(object):
     def admin_create_public_key_with_http_info(self, username, **kwargs):  # noqa: E501
         """Add a public key on behalf of a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_create_public_key_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_create_public_key_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of the user (required)
         :param CreateKeyOption key:
         :return: PublicKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'key']  # noqa: E501
@@ -181,6 +183,7 @@ class AdminApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -237,22 +240,23 @@ class AdminApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def admin_create_repo(self, username, repository, **kwargs):  # noqa: E501
         """Create a repository on behalf of a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_create_repo(username, repository, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_create_repo(username, repository, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of the user. This user will own the created repository (required)
         :param CreateRepoOption repository: (required)
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -264,17 +268,17 @@ class AdminApi(object):
     def admin_create_repo_with_http_info(self, username, repository, **kwargs):  # noqa: E501
         """Create a repository on behalf of a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_create_repo_with_http_info(username, repository, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_create_repo_with_http_info(username, repository, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of the user. This user will own the created repository (required)
         :param CreateRepoOption repository: (required)
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'repository']  # noqa: E501
@@ -282,6 +286,7 @@ class AdminApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -342,21 +347,22 @@ class AdminApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def admin_create_user(self, **kwargs):  # noqa: E501
         """Create a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_create_user(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_create_user(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateUserOption body:
         :return: User
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -368,16 +374,16 @@ class AdminApi(object):
     def admin_create_user_with_http_info(self, **kwargs):  # noqa: E501
         """Create a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_create_user_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_create_user_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateUserOption body:
         :return: User
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['body']  # noqa: E501
@@ -385,6 +391,7 @@ class AdminApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -435,21 +442,22 @@ class AdminApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def admin_delete_user(self, username, **kwargs):  # noqa: E501
         """Delete a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_delete_user(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_delete_user(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -461,16 +469,16 @@ class AdminApi(object):
     def admin_delete_user_with_http_info(self, username, **kwargs):  # noqa: E501
         """Delete a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_delete_user_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_delete_user_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username']  # noqa: E501
@@ -478,6 +486,7 @@ class AdminApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -532,22 +541,23 @@ class AdminApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def admin_delete_user_public_key(self, username, id, **kwargs):  # noqa: E501
         """Delete a user's public key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_delete_user_public_key(username, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_delete_user_public_key(username, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
         :param int id: id of the key to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -559,17 +569,17 @@ class AdminApi(object):
     def admin_delete_user_public_key_with_http_info(self, username, id, **kwargs):  # noqa: E501
         """Delete a user's public key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_delete_user_public_key_with_http_info(username, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_delete_user_public_key_with_http_info(username, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
         :param int id: id of the key to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'id']  # noqa: E501
@@ -577,6 +587,7 @@ class AdminApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -637,22 +648,23 @@ class AdminApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def admin_edit_user(self, username, **kwargs):  # noqa: E501
         """Edit an existing user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_edit_user(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_edit_user(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to edit (required)
         :param EditUserOption body:
         :return: User
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -664,17 +676,17 @@ class AdminApi(object):
     def admin_edit_user_with_http_info(self, username, **kwargs):  # noqa: E501
         """Edit an existing user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_edit_user_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_edit_user_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to edit (required)
         :param EditUserOption body:
         :return: User
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'body']  # noqa: E501
@@ -682,6 +694,7 @@ class AdminApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -738,22 +751,23 @@ class AdminApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def admin_get_all_orgs(self, **kwargs):  # noqa: E501
         """List all organizations  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_get_all_orgs(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_get_all_orgs(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Organization]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -765,17 +779,17 @@ class AdminApi(object):
     def admin_get_all_orgs_with_http_info(self, **kwargs):  # noqa: E501
         """List all organizations  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_get_all_orgs_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_get_all_orgs_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Organization]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -783,6 +797,7 @@ class AdminApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -835,22 +850,23 @@ class AdminApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def admin_get_all_users(self, **kwargs):  # noqa: E501
         """List all users  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_get_all_users(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_get_all_users(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -862,17 +878,17 @@ class AdminApi(object):
     def admin_get_all_users_with_http_info(self, **kwargs):  # noqa: E501
         """List all users  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.admin_get_all_users_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.admin_get_all_users_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -880,6 +896,7 @@ class AdminApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -932,4 +949,5 @@ class AdminApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
@@ -36,10 +36,10 @@ class IssueApi(object):
     def issue_add_label(self, owner, repo, index, **kwargs):  # noqa: E501
         """Add a label to an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_add_label(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_add_label(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -48,7 +48,7 @@ class IssueApi(object):
         :param IssueLabelsOption body:
         :return: list[Label]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -60,10 +60,10 @@ class IssueApi(object):
     def issue_add_label_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Add a label to an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_add_label_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_add_label_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -72,7 +72,7 @@ class IssueApi(object):
         :param IssueLabelsOption body:
         :return: list[Label]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'body']  # noqa: E501
@@ -80,6 +80,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -148,15 +149,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_add_subscription(self, owner, repo, index, user, **kwargs):  # noqa: E501
         """Subscribe user to issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_add_subscription(owner, repo, index, user, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_add_subscription(owner, repo, index, user, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -165,7 +167,7 @@ class IssueApi(object):
         :param str user: user to subscribe (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -177,10 +179,10 @@ class IssueApi(object):
     def issue_add_subscription_with_http_info(self, owner, repo, index, user, **kwargs):  # noqa: E501
         """Subscribe user to issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_add_subscription_with_http_info(owner, repo, index, user, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_add_subscription_with_http_info(owner, repo, index, user, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -189,7 +191,7 @@ class IssueApi(object):
         :param str user: user to subscribe (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'user']  # noqa: E501
@@ -197,6 +199,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -269,15 +272,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_add_time(self, owner, repo, index, **kwargs):  # noqa: E501
         """Add tracked time to a issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_add_time(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_add_time(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -286,7 +290,7 @@ class IssueApi(object):
         :param AddTimeOption body:
         :return: TrackedTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -298,10 +302,10 @@ class IssueApi(object):
     def issue_add_time_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Add tracked time to a issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_add_time_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_add_time_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -310,7 +314,7 @@ class IssueApi(object):
         :param AddTimeOption body:
         :return: TrackedTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'body']  # noqa: E501
@@ -318,6 +322,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -386,15 +391,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_check_subscription(self, owner, repo, index, **kwargs):  # noqa: E501
         """Check if user is subscribed to an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_check_subscription(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_check_subscription(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -402,7 +408,7 @@ class IssueApi(object):
         :param int index: index of the issue (required)
         :return: WatchInfo
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -414,10 +420,10 @@ class IssueApi(object):
     def issue_check_subscription_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Check if user is subscribed to an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_check_subscription_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_check_subscription_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -425,7 +431,7 @@ class IssueApi(object):
         :param int index: index of the issue (required)
         :return: WatchInfo
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index']  # noqa: E501
@@ -433,6 +439,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -499,15 +506,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_clear_labels(self, owner, repo, index, **kwargs):  # noqa: E501
         """Remove all labels from an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_clear_labels(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_clear_labels(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -515,7 +523,7 @@ class IssueApi(object):
         :param int index: index of the issue (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -527,10 +535,10 @@ class IssueApi(object):
     def issue_clear_labels_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Remove all labels from an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_clear_labels_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_clear_labels_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -538,7 +546,7 @@ class IssueApi(object):
         :param int index: index of the issue (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index']  # noqa: E501
@@ -546,6 +554,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -612,15 +621,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_create_comment(self, owner, repo, index, **kwargs):  # noqa: E501
         """Add a comment to an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_create_comment(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_create_comment(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -629,7 +639,7 @@ class IssueApi(object):
         :param CreateIssueCommentOption body:
         :return: Comment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -641,10 +651,10 @@ class IssueApi(object):
     def issue_create_comment_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Add a comment to an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_create_comment_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_create_comment_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -653,7 +663,7 @@ class IssueApi(object):
         :param CreateIssueCommentOption body:
         :return: Comment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'body']  # noqa: E501
@@ -661,6 +671,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -729,15 +740,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_create_issue(self, owner, repo, **kwargs):  # noqa: E501
         """Create an issue. If using deadline only the date will be taken into account, and time of day ignored.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_create_issue(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_create_issue(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -745,7 +757,7 @@ class IssueApi(object):
         :param CreateIssueOption body:
         :return: Issue
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -757,10 +769,10 @@ class IssueApi(object):
     def issue_create_issue_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Create an issue. If using deadline only the date will be taken into account, and time of day ignored.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_create_issue_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_create_issue_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -768,7 +780,7 @@ class IssueApi(object):
         :param CreateIssueOption body:
         :return: Issue
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -776,6 +788,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -838,15 +851,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_create_label(self, owner, repo, **kwargs):  # noqa: E501
         """Create a label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_create_label(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_create_label(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -854,7 +868,7 @@ class IssueApi(object):
         :param CreateLabelOption body:
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -866,10 +880,10 @@ class IssueApi(object):
     def issue_create_label_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Create a label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_create_label_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_create_label_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -877,7 +891,7 @@ class IssueApi(object):
         :param CreateLabelOption body:
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -885,6 +899,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -947,15 +962,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_create_milestone(self, owner, repo, **kwargs):  # noqa: E501
         """Create a milestone  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_create_milestone(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_create_milestone(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -963,7 +979,7 @@ class IssueApi(object):
         :param CreateMilestoneOption body:
         :return: Milestone
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -975,10 +991,10 @@ class IssueApi(object):
     def issue_create_milestone_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Create a milestone  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_create_milestone_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_create_milestone_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -986,7 +1002,7 @@ class IssueApi(object):
         :param CreateMilestoneOption body:
         :return: Milestone
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -994,6 +1010,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1056,15 +1073,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_delete_comment(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a comment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_comment(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_comment(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1072,7 +1090,7 @@ class IssueApi(object):
         :param int id: id of comment to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1084,10 +1102,10 @@ class IssueApi(object):
     def issue_delete_comment_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a comment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_comment_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_comment_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1095,7 +1113,7 @@ class IssueApi(object):
         :param int id: id of comment to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -1103,6 +1121,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1169,15 +1188,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_delete_comment_deprecated(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Delete a comment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_comment_deprecated(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_comment_deprecated(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1186,7 +1206,7 @@ class IssueApi(object):
         :param int id: id of comment to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1198,10 +1218,10 @@ class IssueApi(object):
     def issue_delete_comment_deprecated_with_http_info(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Delete a comment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_comment_deprecated_with_http_info(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_comment_deprecated_with_http_info(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1210,7 +1230,7 @@ class IssueApi(object):
         :param int id: id of comment to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'id']  # noqa: E501
@@ -1218,6 +1238,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1290,15 +1311,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_delete_comment_reaction(self, owner, repo, id, **kwargs):  # noqa: E501
         """Remove a reaction from a comment of an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_comment_reaction(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_comment_reaction(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1307,7 +1329,7 @@ class IssueApi(object):
         :param EditReactionOption content:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1319,10 +1341,10 @@ class IssueApi(object):
     def issue_delete_comment_reaction_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Remove a reaction from a comment of an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_comment_reaction_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_comment_reaction_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1331,7 +1353,7 @@ class IssueApi(object):
         :param EditReactionOption content:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'content']  # noqa: E501
@@ -1339,6 +1361,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1407,15 +1430,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_delete_issue_reaction(self, owner, repo, index, **kwargs):  # noqa: E501
         """Remove a reaction from an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_issue_reaction(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_issue_reaction(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1424,7 +1448,7 @@ class IssueApi(object):
         :param EditReactionOption content:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1436,10 +1460,10 @@ class IssueApi(object):
     def issue_delete_issue_reaction_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Remove a reaction from an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_issue_reaction_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_issue_reaction_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1448,7 +1472,7 @@ class IssueApi(object):
         :param EditReactionOption content:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'content']  # noqa: E501
@@ -1456,6 +1480,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1524,15 +1549,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_delete_label(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_label(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_label(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1540,7 +1566,7 @@ class IssueApi(object):
         :param int id: id of the label to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1552,10 +1578,10 @@ class IssueApi(object):
     def issue_delete_label_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_label_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_label_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1563,7 +1589,7 @@ class IssueApi(object):
         :param int id: id of the label to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -1571,6 +1597,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1637,15 +1664,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_delete_milestone(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a milestone  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_milestone(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_milestone(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1653,7 +1681,7 @@ class IssueApi(object):
         :param int id: id of the milestone to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1665,10 +1693,10 @@ class IssueApi(object):
     def issue_delete_milestone_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a milestone  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_milestone_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_milestone_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1676,7 +1704,7 @@ class IssueApi(object):
         :param int id: id of the milestone to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -1684,6 +1712,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1750,15 +1779,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_delete_stop_watch(self, owner, repo, index, **kwargs):  # noqa: E501
         """Delete an issue's existing stopwatch.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_stop_watch(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_stop_watch(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1766,7 +1796,7 @@ class IssueApi(object):
         :param int index: index of the issue to stop the stopwatch on (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1778,10 +1808,10 @@ class IssueApi(object):
     def issue_delete_stop_watch_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Delete an issue's existing stopwatch.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_stop_watch_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_stop_watch_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1789,7 +1819,7 @@ class IssueApi(object):
         :param int index: index of the issue to stop the stopwatch on (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index']  # noqa: E501
@@ -1797,6 +1827,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1863,15 +1894,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_delete_subscription(self, owner, repo, index, user, **kwargs):  # noqa: E501
         """Unsubscribe user from issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_subscription(owner, repo, index, user, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_subscription(owner, repo, index, user, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1880,7 +1912,7 @@ class IssueApi(object):
         :param str user: user witch unsubscribe (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1892,10 +1924,10 @@ class IssueApi(object):
     def issue_delete_subscription_with_http_info(self, owner, repo, index, user, **kwargs):  # noqa: E501
         """Unsubscribe user from issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_subscription_with_http_info(owner, repo, index, user, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_subscription_with_http_info(owner, repo, index, user, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1904,7 +1936,7 @@ class IssueApi(object):
         :param str user: user witch unsubscribe (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'user']  # noqa: E501
@@ -1912,6 +1944,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1984,15 +2017,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_delete_time(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Delete specific tracked time  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_time(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_time(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2001,7 +2035,7 @@ class IssueApi(object):
         :param int id: id of time to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2013,10 +2047,10 @@ class IssueApi(object):
     def issue_delete_time_with_http_info(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Delete specific tracked time  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_delete_time_with_http_info(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_delete_time_with_http_info(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2025,7 +2059,7 @@ class IssueApi(object):
         :param int id: id of time to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'id']  # noqa: E501
@@ -2033,6 +2067,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2105,15 +2140,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_edit_comment(self, owner, repo, id, **kwargs):  # noqa: E501
         """Edit a comment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_comment(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_comment(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2122,7 +2158,7 @@ class IssueApi(object):
         :param EditIssueCommentOption body:
         :return: Comment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2134,10 +2170,10 @@ class IssueApi(object):
     def issue_edit_comment_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Edit a comment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_comment_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_comment_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2146,7 +2182,7 @@ class IssueApi(object):
         :param EditIssueCommentOption body:
         :return: Comment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'body']  # noqa: E501
@@ -2154,6 +2190,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2222,15 +2259,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_edit_comment_deprecated(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Edit a comment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_comment_deprecated(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_comment_deprecated(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2240,7 +2278,7 @@ class IssueApi(object):
         :param EditIssueCommentOption body:
         :return: Comment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2252,10 +2290,10 @@ class IssueApi(object):
     def issue_edit_comment_deprecated_with_http_info(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Edit a comment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_comment_deprecated_with_http_info(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_comment_deprecated_with_http_info(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2265,7 +2303,7 @@ class IssueApi(object):
         :param EditIssueCommentOption body:
         :return: Comment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'id', 'body']  # noqa: E501
@@ -2273,6 +2311,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2347,15 +2386,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_edit_issue(self, owner, repo, index, **kwargs):  # noqa: E501
         """Edit an issue. If using deadline only the date will be taken into account, and time of day ignored.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_issue(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_issue(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2364,7 +2404,7 @@ class IssueApi(object):
         :param EditIssueOption body:
         :return: Issue
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2376,10 +2416,10 @@ class IssueApi(object):
     def issue_edit_issue_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Edit an issue. If using deadline only the date will be taken into account, and time of day ignored.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_issue_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_issue_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2388,7 +2428,7 @@ class IssueApi(object):
         :param EditIssueOption body:
         :return: Issue
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'body']  # noqa: E501
@@ -2396,6 +2436,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2464,15 +2505,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_edit_issue_deadline(self, owner, repo, index, **kwargs):  # noqa: E501
         """Set an issue deadline. If set to null, the deadline is deleted. If using deadline only the date will be taken into account, and time of day ignored.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_issue_deadline(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_issue_deadline(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2481,7 +2523,7 @@ class IssueApi(object):
         :param EditDeadlineOption body:
         :return: IssueDeadline
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2493,10 +2535,10 @@ class IssueApi(object):
     def issue_edit_issue_deadline_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Set an issue deadline. If set to null, the deadline is deleted. If using deadline only the date will be taken into account, and time of day ignored.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_issue_deadline_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_issue_deadline_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2505,7 +2547,7 @@ class IssueApi(object):
         :param EditDeadlineOption body:
         :return: IssueDeadline
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'body']  # noqa: E501
@@ -2513,6 +2555,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2581,15 +2624,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_edit_label(self, owner, repo, id, **kwargs):  # noqa: E501
         """Update a label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_label(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_label(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2598,7 +2642,7 @@ class IssueApi(object):
         :param EditLabelOption body:
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2610,10 +2654,10 @@ class IssueApi(object):
     def issue_edit_label_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Update a label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_label_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_label_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2622,7 +2666,7 @@ class IssueApi(object):
         :param EditLabelOption body:
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'body']  # noqa: E501
@@ -2630,6 +2674,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2698,15 +2743,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_edit_milestone(self, owner, repo, id, **kwargs):  # noqa: E501
         """Update a milestone  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_milestone(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_milestone(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2715,7 +2761,7 @@ class IssueApi(object):
         :param EditMilestoneOption body:
         :return: Milestone
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2727,10 +2773,10 @@ class IssueApi(object):
     def issue_edit_milestone_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Update a milestone  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_edit_milestone_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_edit_milestone_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2739,7 +2785,7 @@ class IssueApi(object):
         :param EditMilestoneOption body:
         :return: Milestone
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'body']  # noqa: E501
@@ -2747,6 +2793,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2815,15 +2862,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_get_comment(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a comment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_comment(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_comment(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2831,7 +2879,7 @@ class IssueApi(object):
         :param int id: id of the comment (required)
         :return: Comment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2843,10 +2891,10 @@ class IssueApi(object):
     def issue_get_comment_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a comment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_comment_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_comment_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2854,7 +2902,7 @@ class IssueApi(object):
         :param int id: id of the comment (required)
         :return: Comment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -2862,6 +2910,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2928,15 +2977,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_get_comment_reactions(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a list of reactions from a comment of an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_comment_reactions(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_comment_reactions(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2944,7 +2994,7 @@ class IssueApi(object):
         :param int id: id of the comment to edit (required)
         :return: list[Reaction]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2956,10 +3006,10 @@ class IssueApi(object):
     def issue_get_comment_reactions_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a list of reactions from a comment of an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_comment_reactions_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_comment_reactions_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2967,7 +3017,7 @@ class IssueApi(object):
         :param int id: id of the comment to edit (required)
         :return: list[Reaction]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -2975,6 +3025,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3041,15 +3092,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_get_comments(self, owner, repo, index, **kwargs):  # noqa: E501
         """List all comments on an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_comments(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_comments(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3059,7 +3111,7 @@ class IssueApi(object):
         :param datetime before: if provided, only comments updated before the provided time are returned.
         :return: list[Comment]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3071,10 +3123,10 @@ class IssueApi(object):
     def issue_get_comments_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """List all comments on an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_comments_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_comments_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3084,7 +3136,7 @@ class IssueApi(object):
         :param datetime before: if provided, only comments updated before the provided time are returned.
         :return: list[Comment]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'since', 'before']  # noqa: E501
@@ -3092,6 +3144,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3162,15 +3215,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_get_issue(self, owner, repo, index, **kwargs):  # noqa: E501
         """Get an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_issue(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_issue(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3178,7 +3232,7 @@ class IssueApi(object):
         :param int index: index of the issue to get (required)
         :return: Issue
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3190,10 +3244,10 @@ class IssueApi(object):
     def issue_get_issue_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Get an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_issue_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_issue_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3201,7 +3255,7 @@ class IssueApi(object):
         :param int index: index of the issue to get (required)
         :return: Issue
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index']  # noqa: E501
@@ -3209,6 +3263,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3275,15 +3330,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_get_issue_reactions(self, owner, repo, index, **kwargs):  # noqa: E501
         """Get a list reactions of an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_issue_reactions(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_issue_reactions(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3293,7 +3349,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Reaction]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3305,10 +3361,10 @@ class IssueApi(object):
     def issue_get_issue_reactions_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Get a list reactions of an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_issue_reactions_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_issue_reactions_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3318,7 +3374,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Reaction]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'page', 'limit']  # noqa: E501
@@ -3326,6 +3382,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3396,15 +3453,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_get_label(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a single label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_label(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_label(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3412,7 +3470,7 @@ class IssueApi(object):
         :param int id: id of the label to get (required)
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3424,10 +3482,10 @@ class IssueApi(object):
     def issue_get_label_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a single label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_label_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_label_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3435,7 +3493,7 @@ class IssueApi(object):
         :param int id: id of the label to get (required)
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -3443,6 +3501,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3509,15 +3568,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_get_labels(self, owner, repo, index, **kwargs):  # noqa: E501
         """Get an issue's labels  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_labels(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_labels(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3525,7 +3585,7 @@ class IssueApi(object):
         :param int index: index of the issue (required)
         :return: list[Label]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3537,10 +3597,10 @@ class IssueApi(object):
     def issue_get_labels_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Get an issue's labels  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_labels_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_labels_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3548,7 +3608,7 @@ class IssueApi(object):
         :param int index: index of the issue (required)
         :return: list[Label]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index']  # noqa: E501
@@ -3556,6 +3616,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3622,15 +3683,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_get_milestone(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a milestone  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_milestone(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_milestone(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3638,7 +3700,7 @@ class IssueApi(object):
         :param int id: id of the milestone (required)
         :return: Milestone
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3650,10 +3712,10 @@ class IssueApi(object):
     def issue_get_milestone_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a milestone  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_milestone_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_milestone_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3661,7 +3723,7 @@ class IssueApi(object):
         :param int id: id of the milestone (required)
         :return: Milestone
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -3669,6 +3731,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3735,15 +3798,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_get_milestones_list(self, owner, repo, **kwargs):  # noqa: E501
         """Get all of a repository's opened milestones  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_milestones_list(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_milestones_list(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3753,7 +3817,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Milestone]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3765,10 +3829,10 @@ class IssueApi(object):
     def issue_get_milestones_list_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Get all of a repository's opened milestones  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_milestones_list_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_milestones_list_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3778,7 +3842,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Milestone]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'state', 'page', 'limit']  # noqa: E501
@@ -3786,6 +3850,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3852,15 +3917,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_get_repo_comments(self, owner, repo, **kwargs):  # noqa: E501
         """List all comments in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_repo_comments(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_repo_comments(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3871,7 +3937,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Comment]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3883,10 +3949,10 @@ class IssueApi(object):
     def issue_get_repo_comments_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List all comments in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_get_repo_comments_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_get_repo_comments_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3897,7 +3963,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Comment]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'since', 'before', 'page', 'limit']  # noqa: E501
@@ -3905,6 +3971,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3973,15 +4040,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_list_issues(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's issues  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_list_issues(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_list_issues(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3995,7 +4063,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Issue]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4007,10 +4075,10 @@ class IssueApi(object):
     def issue_list_issues_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's issues  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_list_issues_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_list_issues_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4024,7 +4092,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Issue]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'state', 'labels', 'q', 'type', 'milestones', 'page', 'limit']  # noqa: E501
@@ -4032,6 +4100,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4106,15 +4175,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_list_labels(self, owner, repo, **kwargs):  # noqa: E501
         """Get all of a repository's labels  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_list_labels(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_list_labels(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4123,7 +4193,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Label]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4135,10 +4205,10 @@ class IssueApi(object):
     def issue_list_labels_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Get all of a repository's labels  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_list_labels_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_list_labels_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4147,7 +4217,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Label]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'page', 'limit']  # noqa: E501
@@ -4155,6 +4225,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4219,15 +4290,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_post_comment_reaction(self, owner, repo, id, **kwargs):  # noqa: E501
         """Add a reaction to a comment of an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_post_comment_reaction(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_post_comment_reaction(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4236,7 +4308,7 @@ class IssueApi(object):
         :param EditReactionOption content:
         :return: Reaction
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4248,10 +4320,10 @@ class IssueApi(object):
     def issue_post_comment_reaction_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Add a reaction to a comment of an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_post_comment_reaction_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_post_comment_reaction_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4260,7 +4332,7 @@ class IssueApi(object):
         :param EditReactionOption content:
         :return: Reaction
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'content']  # noqa: E501
@@ -4268,6 +4340,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4336,15 +4409,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_post_issue_reaction(self, owner, repo, index, **kwargs):  # noqa: E501
         """Add a reaction to an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_post_issue_reaction(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_post_issue_reaction(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4353,7 +4427,7 @@ class IssueApi(object):
         :param EditReactionOption content:
         :return: Reaction
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4365,10 +4439,10 @@ class IssueApi(object):
     def issue_post_issue_reaction_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Add a reaction to an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_post_issue_reaction_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_post_issue_reaction_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4377,7 +4451,7 @@ class IssueApi(object):
         :param EditReactionOption content:
         :return: Reaction
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'content']  # noqa: E501
@@ -4385,6 +4459,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4453,15 +4528,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_remove_label(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Remove a label from an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_remove_label(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_remove_label(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4470,7 +4546,7 @@ class IssueApi(object):
         :param int id: id of the label to remove (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4482,10 +4558,10 @@ class IssueApi(object):
     def issue_remove_label_with_http_info(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Remove a label from an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_remove_label_with_http_info(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_remove_label_with_http_info(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4494,7 +4570,7 @@ class IssueApi(object):
         :param int id: id of the label to remove (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'id']  # noqa: E501
@@ -4502,6 +4578,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4574,15 +4651,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_replace_labels(self, owner, repo, index, **kwargs):  # noqa: E501
         """Replace an issue's labels  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_replace_labels(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_replace_labels(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4591,7 +4669,7 @@ class IssueApi(object):
         :param IssueLabelsOption body:
         :return: list[Label]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4603,10 +4681,10 @@ class IssueApi(object):
     def issue_replace_labels_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Replace an issue's labels  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_replace_labels_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_replace_labels_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4615,7 +4693,7 @@ class IssueApi(object):
         :param IssueLabelsOption body:
         :return: list[Label]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'body']  # noqa: E501
@@ -4623,6 +4701,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4691,15 +4770,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_reset_time(self, owner, repo, index, **kwargs):  # noqa: E501
         """Reset a tracked time of an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_reset_time(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_reset_time(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4707,7 +4787,7 @@ class IssueApi(object):
         :param int index: index of the issue to add tracked time to (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4719,10 +4799,10 @@ class IssueApi(object):
     def issue_reset_time_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Reset a tracked time of an issue  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_reset_time_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_reset_time_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4730,7 +4810,7 @@ class IssueApi(object):
         :param int index: index of the issue to add tracked time to (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index']  # noqa: E501
@@ -4738,6 +4818,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4804,15 +4885,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_search_issues(self, **kwargs):  # noqa: E501
         """Search for issues across the repositories that the user has access to  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_search_issues(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_search_issues(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str state: whether issue is open or closed
@@ -4823,7 +4905,7 @@ class IssueApi(object):
         :param int page: page number of requested issues
         :return: list[Issue]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4835,10 +4917,10 @@ class IssueApi(object):
     def issue_search_issues_with_http_info(self, **kwargs):  # noqa: E501
         """Search for issues across the repositories that the user has access to  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_search_issues_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_search_issues_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str state: whether issue is open or closed
@@ -4849,7 +4931,7 @@ class IssueApi(object):
         :param int page: page number of requested issues
         :return: list[Issue]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['state', 'labels', 'q', 'priority_repo_id', 'type', 'page']  # noqa: E501
@@ -4857,6 +4939,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4917,15 +5000,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_start_stop_watch(self, owner, repo, index, **kwargs):  # noqa: E501
         """Start stopwatch on an issue.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_start_stop_watch(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_start_stop_watch(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4933,7 +5017,7 @@ class IssueApi(object):
         :param int index: index of the issue to create the stopwatch on (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4945,10 +5029,10 @@ class IssueApi(object):
     def issue_start_stop_watch_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Start stopwatch on an issue.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_start_stop_watch_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_start_stop_watch_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4956,7 +5040,7 @@ class IssueApi(object):
         :param int index: index of the issue to create the stopwatch on (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index']  # noqa: E501
@@ -4964,6 +5048,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5030,15 +5115,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_stop_stop_watch(self, owner, repo, index, **kwargs):  # noqa: E501
         """Stop an issue's existing stopwatch.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_stop_stop_watch(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_stop_stop_watch(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5046,7 +5132,7 @@ class IssueApi(object):
         :param int index: index of the issue to stop the stopwatch on (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5058,10 +5144,10 @@ class IssueApi(object):
     def issue_stop_stop_watch_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Stop an issue's existing stopwatch.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_stop_stop_watch_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_stop_stop_watch_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5069,7 +5155,7 @@ class IssueApi(object):
         :param int index: index of the issue to stop the stopwatch on (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index']  # noqa: E501
@@ -5077,6 +5163,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5143,15 +5230,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_subscriptions(self, owner, repo, index, **kwargs):  # noqa: E501
         """Get users who subscribed on an issue.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_subscriptions(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_subscriptions(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5161,7 +5249,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5173,10 +5261,10 @@ class IssueApi(object):
     def issue_subscriptions_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Get users who subscribed on an issue.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_subscriptions_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_subscriptions_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5186,7 +5274,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'page', 'limit']  # noqa: E501
@@ -5194,6 +5282,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5264,15 +5353,16 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def issue_tracked_times(self, owner, repo, index, **kwargs):  # noqa: E501
         """List an issue's tracked times  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_tracked_times(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_tracked_times(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5284,7 +5374,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[TrackedTime]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5296,10 +5386,10 @@ class IssueApi(object):
     def issue_tracked_times_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """List an issue's tracked times  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.issue_tracked_times_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.issue_tracked_times_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5311,7 +5401,7 @@ class IssueApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[TrackedTime]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'since', 'before', 'page', 'limit']  # noqa: E501
@@ -5319,6 +5409,7 @@ class IssueApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5393,4 +5484,5 @@ class IssueApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
@@ -36,15 +36,15 @@ class MiscellaneousApi(object):
     def get_signing_key(self, **kwargs):  # noqa: E501
         """Get default signing-key.gpg  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.get_signing_key(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.get_signing_key(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :return: str
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -56,15 +56,15 @@ class MiscellaneousApi(object):
     def get_signing_key_with_http_info(self, **kwargs):  # noqa: E501
         """Get default signing-key.gpg  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.get_signing_key_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.get_signing_key_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :return: str
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = []  # noqa: E501
@@ -72,6 +72,7 @@ class MiscellaneousApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -120,20 +121,21 @@ class MiscellaneousApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def get_version(self, **kwargs):  # noqa: E501
         """Returns the version of the Gitea application  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.get_version(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.get_version(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :return: ServerVersion
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -145,15 +147,15 @@ class MiscellaneousApi(object):
     def get_version_with_http_info(self, **kwargs):  # noqa: E501
         """Returns the version of the Gitea application  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.get_version_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.get_version_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :return: ServerVersion
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = []  # noqa: E501
@@ -161,6 +163,7 @@ class MiscellaneousApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -209,21 +212,22 @@ class MiscellaneousApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def render_markdown(self, **kwargs):  # noqa: E501
         """Render a markdown document as HTML  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.render_markdown(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.render_markdown(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param MarkdownOption body:
         :return: str
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -235,16 +239,16 @@ class MiscellaneousApi(object):
     def render_markdown_with_http_info(self, **kwargs):  # noqa: E501
         """Render a markdown document as HTML  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.render_markdown_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.render_markdown_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param MarkdownOption body:
         :return: str
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['body']  # noqa: E501
@@ -252,6 +256,7 @@ class MiscellaneousApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -302,21 +307,22 @@ class MiscellaneousApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def render_markdown_raw(self, body, **kwargs):  # noqa: E501
         """Render raw markdown as HTML  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.render_markdown_raw(body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.render_markdown_raw(body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str body: Request body to render (required)
         :return: str
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -328,16 +334,16 @@ class MiscellaneousApi(object):
     def render_markdown_raw_with_http_info(self, body, **kwargs):  # noqa: E501
         """Render raw markdown as HTML  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.render_markdown_raw_with_http_info(body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.render_markdown_raw_with_http_info(body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str body: Request body to render (required)
         :return: str
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['body']  # noqa: E501
@@ -345,6 +351,7 @@ class MiscellaneousApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -399,4 +406,5 @@ class MiscellaneousApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
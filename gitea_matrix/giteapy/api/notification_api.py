@@ -36,10 +36,10 @@ class NotificationApi(object):
     def notify_get_list(self, **kwargs):  # noqa: E501
         """List users's notification threads  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_get_list(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_get_list(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str all: If true, show notifications marked as read. Default value is false
@@ -49,7 +49,7 @@ class NotificationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[NotificationThread]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -61,10 +61,10 @@ class NotificationApi(object):
     def notify_get_list_with_http_info(self, **kwargs):  # noqa: E501
         """List users's notification threads  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_get_list_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_get_list_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str all: If true, show notifications marked as read. Default value is false
@@ -74,7 +74,7 @@ class NotificationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[NotificationThread]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['all', 'since', 'before', 'page', 'limit']  # noqa: E501
@@ -82,6 +82,7 @@ class NotificationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -140,15 +141,16 @@ class NotificationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def notify_get_repo_list(self, owner, repo, **kwargs):  # noqa: E501
         """List users's notification threads on a specific repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_get_repo_list(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_get_repo_list(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -160,7 +162,7 @@ class NotificationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[NotificationThread]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -172,10 +174,10 @@ class NotificationApi(object):
     def notify_get_repo_list_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List users's notification threads on a specific repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_get_repo_list_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_get_repo_list_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -187,7 +189,7 @@ class NotificationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[NotificationThread]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'all', 'since', 'before', 'page', 'limit']  # noqa: E501
@@ -195,6 +197,7 @@ class NotificationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -265,21 +268,22 @@ class NotificationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def notify_get_thread(self, id, **kwargs):  # noqa: E501
         """Get notification thread by ID  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_get_thread(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_get_thread(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str id: id of notification thread (required)
         :return: NotificationThread
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -291,16 +295,16 @@ class NotificationApi(object):
     def notify_get_thread_with_http_info(self, id, **kwargs):  # noqa: E501
         """Get notification thread by ID  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_get_thread_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_get_thread_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str id: id of notification thread (required)
         :return: NotificationThread
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -308,6 +312,7 @@ class NotificationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -362,20 +367,21 @@ class NotificationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def notify_new_available(self, **kwargs):  # noqa: E501
         """Check if unread notifications exist  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_new_available(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_new_available(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :return: NotificationCount
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -387,15 +393,15 @@ class NotificationApi(object):
     def notify_new_available_with_http_info(self, **kwargs):  # noqa: E501
         """Check if unread notifications exist  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_new_available_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_new_available_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :return: NotificationCount
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = []  # noqa: E501
@@ -403,6 +409,7 @@ class NotificationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -451,21 +458,22 @@ class NotificationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def notify_read_list(self, **kwargs):  # noqa: E501
         """Mark notification threads as read  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_read_list(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_read_list(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param datetime last_read_at: Describes the last point that notifications were checked. Anything updated since this time will not be updated.
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -477,16 +485,16 @@ class NotificationApi(object):
     def notify_read_list_with_http_info(self, **kwargs):  # noqa: E501
         """Mark notification threads as read  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_read_list_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_read_list_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param datetime last_read_at: Describes the last point that notifications were checked. Anything updated since this time will not be updated.
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['last_read_at']  # noqa: E501
@@ -494,6 +502,7 @@ class NotificationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -544,15 +553,16 @@ class NotificationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def notify_read_repo_list(self, owner, repo, **kwargs):  # noqa: E501
         """Mark notification threads as read on a specific repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_read_repo_list(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_read_repo_list(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -560,7 +570,7 @@ class NotificationApi(object):
         :param datetime last_read_at: Describes the last point that notifications were checked. Anything updated since this time will not be updated.
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -572,10 +582,10 @@ class NotificationApi(object):
     def notify_read_repo_list_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Mark notification threads as read on a specific repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_read_repo_list_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_read_repo_list_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -583,7 +593,7 @@ class NotificationApi(object):
         :param datetime last_read_at: Describes the last point that notifications were checked. Anything updated since this time will not be updated.
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'last_read_at']  # noqa: E501
@@ -591,6 +601,7 @@ class NotificationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -653,21 +664,22 @@ class NotificationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def notify_read_thread(self, id, **kwargs):  # noqa: E501
         """Mark notification thread as read by ID  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_read_thread(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_read_thread(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str id: id of notification thread (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -679,16 +691,16 @@ class NotificationApi(object):
     def notify_read_thread_with_http_info(self, id, **kwargs):  # noqa: E501
         """Mark notification thread as read by ID  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.notify_read_thread_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.notify_read_thread_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str id: id of notification thread (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -696,6 +708,7 @@ class NotificationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -750,4 +763,5 @@ class NotificationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
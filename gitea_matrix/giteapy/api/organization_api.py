@@ -36,17 +36,17 @@ class OrganizationApi(object):
     def create_org_repo(self, org, **kwargs):  # noqa: E501
         """Create a repository in an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.create_org_repo(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.create_org_repo(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of organization (required)
         :param CreateRepoOption body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -58,17 +58,17 @@ class OrganizationApi(object):
     def create_org_repo_with_http_info(self, org, **kwargs):  # noqa: E501
         """Create a repository in an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.create_org_repo_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.create_org_repo_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of organization (required)
         :param CreateRepoOption body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'body']  # noqa: E501
@@ -76,6 +76,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -132,22 +133,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def create_org_repo_deprecated(self, org, **kwargs):  # noqa: E501
         """Create a repository in an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.create_org_repo_deprecated(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.create_org_repo_deprecated(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of organization (required)
         :param CreateRepoOption body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -159,17 +161,17 @@ class OrganizationApi(object):
     def create_org_repo_deprecated_with_http_info(self, org, **kwargs):  # noqa: E501
         """Create a repository in an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.create_org_repo_deprecated_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.create_org_repo_deprecated_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of organization (required)
         :param CreateRepoOption body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'body']  # noqa: E501
@@ -177,6 +179,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -233,22 +236,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_add_team_member(self, id, username, **kwargs):  # noqa: E501
         """Add a team member  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_add_team_member(id, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_add_team_member(id, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
         :param str username: username of the user to add (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -260,17 +264,17 @@ class OrganizationApi(object):
     def org_add_team_member_with_http_info(self, id, username, **kwargs):  # noqa: E501
         """Add a team member  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_add_team_member_with_http_info(id, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_add_team_member_with_http_info(id, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
         :param str username: username of the user to add (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id', 'username']  # noqa: E501
@@ -278,6 +282,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -338,15 +343,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_add_team_repository(self, id, org, repo, **kwargs):  # noqa: E501
         """Add a repository to a team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_add_team_repository(id, org, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_add_team_repository(id, org, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
@@ -354,7 +360,7 @@ class OrganizationApi(object):
         :param str repo: name of the repo to add (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -366,10 +372,10 @@ class OrganizationApi(object):
     def org_add_team_repository_with_http_info(self, id, org, repo, **kwargs):  # noqa: E501
         """Add a repository to a team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_add_team_repository_with_http_info(id, org, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_add_team_repository_with_http_info(id, org, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
@@ -377,7 +383,7 @@ class OrganizationApi(object):
         :param str repo: name of the repo to add (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id', 'org', 'repo']  # noqa: E501
@@ -385,6 +391,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -451,22 +458,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_conceal_member(self, org, username, **kwargs):  # noqa: E501
         """Conceal a user's membership  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_conceal_member(org, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_conceal_member(org, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param str username: username of the user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -478,17 +486,17 @@ class OrganizationApi(object):
     def org_conceal_member_with_http_info(self, org, username, **kwargs):  # noqa: E501
         """Conceal a user's membership  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_conceal_member_with_http_info(org, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_conceal_member_with_http_info(org, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param str username: username of the user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'username']  # noqa: E501
@@ -496,6 +504,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -556,21 +565,22 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_create(self, organization, **kwargs):  # noqa: E501
         """Create an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_create(organization, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_create(organization, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateOrgOption organization: (required)
         :return: Organization
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -582,16 +592,16 @@ class OrganizationApi(object):
     def org_create_with_http_info(self, organization, **kwargs):  # noqa: E501
         """Create an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_create_with_http_info(organization, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_create_with_http_info(organization, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateOrgOption organization: (required)
         :return: Organization
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['organization']  # noqa: E501
@@ -599,6 +609,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -653,22 +664,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_create_hook(self, org, body, **kwargs):  # noqa: E501
         """Create a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_create_hook(org, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_create_hook(org, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param CreateHookOption body: (required)
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -680,17 +692,17 @@ class OrganizationApi(object):
     def org_create_hook_with_http_info(self, org, body, **kwargs):  # noqa: E501
         """Create a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_create_hook_with_http_info(org, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_create_hook_with_http_info(org, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param CreateHookOption body: (required)
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'body']  # noqa: E501
@@ -698,6 +710,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -758,22 +771,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_create_label(self, org, **kwargs):  # noqa: E501
         """Create a label for an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_create_label(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_create_label(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param CreateLabelOption body:
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -785,17 +799,17 @@ class OrganizationApi(object):
     def org_create_label_with_http_info(self, org, **kwargs):  # noqa: E501
         """Create a label for an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_create_label_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_create_label_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param CreateLabelOption body:
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'body']  # noqa: E501
@@ -803,6 +817,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -859,22 +874,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_create_team(self, org, **kwargs):  # noqa: E501
         """Create a team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_create_team(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_create_team(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param CreateTeamOption body:
         :return: Team
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -886,17 +902,17 @@ class OrganizationApi(object):
     def org_create_team_with_http_info(self, org, **kwargs):  # noqa: E501
         """Create a team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_create_team_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_create_team_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param CreateTeamOption body:
         :return: Team
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'body']  # noqa: E501
@@ -904,6 +920,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -960,21 +977,22 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_delete(self, org, **kwargs):  # noqa: E501
         """Delete an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_delete(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_delete(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: organization that is to be deleted (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -986,16 +1004,16 @@ class OrganizationApi(object):
     def org_delete_with_http_info(self, org, **kwargs):  # noqa: E501
         """Delete an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_delete_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_delete_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: organization that is to be deleted (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org']  # noqa: E501
@@ -1003,6 +1021,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1057,22 +1076,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_delete_hook(self, org, id, **kwargs):  # noqa: E501
         """Delete a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_delete_hook(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_delete_hook(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param int id: id of the hook to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1084,17 +1104,17 @@ class OrganizationApi(object):
     def org_delete_hook_with_http_info(self, org, id, **kwargs):  # noqa: E501
         """Delete a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_delete_hook_with_http_info(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_delete_hook_with_http_info(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param int id: id of the hook to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'id']  # noqa: E501
@@ -1102,6 +1122,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1162,22 +1183,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_delete_label(self, org, id, **kwargs):  # noqa: E501
         """Delete a label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_delete_label(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_delete_label(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param int id: id of the label to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1189,17 +1211,17 @@ class OrganizationApi(object):
     def org_delete_label_with_http_info(self, org, id, **kwargs):  # noqa: E501
         """Delete a label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_delete_label_with_http_info(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_delete_label_with_http_info(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param int id: id of the label to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'id']  # noqa: E501
@@ -1207,6 +1229,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1267,22 +1290,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_delete_member(self, org, username, **kwargs):  # noqa: E501
         """Remove a member from an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_delete_member(org, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_delete_member(org, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param str username: username of the user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1294,17 +1318,17 @@ class OrganizationApi(object):
     def org_delete_member_with_http_info(self, org, username, **kwargs):  # noqa: E501
         """Remove a member from an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_delete_member_with_http_info(org, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_delete_member_with_http_info(org, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param str username: username of the user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'username']  # noqa: E501
@@ -1312,6 +1336,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1372,21 +1397,22 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_delete_team(self, id, **kwargs):  # noqa: E501
         """Delete a team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_delete_team(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_delete_team(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1398,16 +1424,16 @@ class OrganizationApi(object):
     def org_delete_team_with_http_info(self, id, **kwargs):  # noqa: E501
         """Delete a team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_delete_team_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_delete_team_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -1415,6 +1441,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1469,22 +1496,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_edit(self, org, body, **kwargs):  # noqa: E501
         """Edit an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_edit(org, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_edit(org, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization to edit (required)
         :param EditOrgOption body: (required)
         :return: Organization
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1496,17 +1524,17 @@ class OrganizationApi(object):
     def org_edit_with_http_info(self, org, body, **kwargs):  # noqa: E501
         """Edit an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_edit_with_http_info(org, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_edit_with_http_info(org, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization to edit (required)
         :param EditOrgOption body: (required)
         :return: Organization
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'body']  # noqa: E501
@@ -1514,6 +1542,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1574,15 +1603,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_edit_hook(self, org, id, **kwargs):  # noqa: E501
         """Update a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_edit_hook(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_edit_hook(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -1590,7 +1620,7 @@ class OrganizationApi(object):
         :param EditHookOption body:
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1602,10 +1632,10 @@ class OrganizationApi(object):
     def org_edit_hook_with_http_info(self, org, id, **kwargs):  # noqa: E501
         """Update a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_edit_hook_with_http_info(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_edit_hook_with_http_info(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -1613,7 +1643,7 @@ class OrganizationApi(object):
         :param EditHookOption body:
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'id', 'body']  # noqa: E501
@@ -1621,6 +1651,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1683,15 +1714,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_edit_label(self, org, id, **kwargs):  # noqa: E501
         """Update a label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_edit_label(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_edit_label(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -1699,7 +1731,7 @@ class OrganizationApi(object):
         :param EditLabelOption body:
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1711,10 +1743,10 @@ class OrganizationApi(object):
     def org_edit_label_with_http_info(self, org, id, **kwargs):  # noqa: E501
         """Update a label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_edit_label_with_http_info(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_edit_label_with_http_info(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -1722,7 +1754,7 @@ class OrganizationApi(object):
         :param EditLabelOption body:
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'id', 'body']  # noqa: E501
@@ -1730,6 +1762,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1792,22 +1825,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_edit_team(self, id, **kwargs):  # noqa: E501
         """Edit a team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_edit_team(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_edit_team(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team to edit (required)
         :param EditTeamOption body:
         :return: Team
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1819,17 +1853,17 @@ class OrganizationApi(object):
     def org_edit_team_with_http_info(self, id, **kwargs):  # noqa: E501
         """Edit a team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_edit_team_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_edit_team_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team to edit (required)
         :param EditTeamOption body:
         :return: Team
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id', 'body']  # noqa: E501
@@ -1837,6 +1871,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1893,21 +1928,22 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_get(self, org, **kwargs):  # noqa: E501
         """Get an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_get(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_get(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization to get (required)
         :return: Organization
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1919,16 +1955,16 @@ class OrganizationApi(object):
     def org_get_with_http_info(self, org, **kwargs):  # noqa: E501
         """Get an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_get_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_get_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization to get (required)
         :return: Organization
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org']  # noqa: E501
@@ -1936,6 +1972,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1990,22 +2027,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_get_all(self, **kwargs):  # noqa: E501
         """Get list of organizations  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_get_all(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_get_all(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Organization]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2017,17 +2055,17 @@ class OrganizationApi(object):
     def org_get_all_with_http_info(self, **kwargs):  # noqa: E501
         """Get list of organizations  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_get_all_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_get_all_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Organization]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -2035,6 +2073,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2087,22 +2126,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_get_hook(self, org, id, **kwargs):  # noqa: E501
         """Get a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_get_hook(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_get_hook(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param int id: id of the hook to get (required)
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2114,17 +2154,17 @@ class OrganizationApi(object):
     def org_get_hook_with_http_info(self, org, id, **kwargs):  # noqa: E501
         """Get a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_get_hook_with_http_info(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_get_hook_with_http_info(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param int id: id of the hook to get (required)
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'id']  # noqa: E501
@@ -2132,6 +2172,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2192,22 +2233,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_get_label(self, org, id, **kwargs):  # noqa: E501
         """Get a single label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_get_label(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_get_label(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param int id: id of the label to get (required)
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2219,17 +2261,17 @@ class OrganizationApi(object):
     def org_get_label_with_http_info(self, org, id, **kwargs):  # noqa: E501
         """Get a single label  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_get_label_with_http_info(org, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_get_label_with_http_info(org, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param int id: id of the label to get (required)
         :return: Label
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'id']  # noqa: E501
@@ -2237,6 +2279,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2297,21 +2340,22 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_get_team(self, id, **kwargs):  # noqa: E501
         """Get a team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_get_team(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_get_team(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team to get (required)
         :return: Team
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2323,16 +2367,16 @@ class OrganizationApi(object):
     def org_get_team_with_http_info(self, id, **kwargs):  # noqa: E501
         """Get a team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_get_team_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_get_team_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team to get (required)
         :return: Team
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -2340,6 +2384,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2394,22 +2439,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_is_member(self, org, username, **kwargs):  # noqa: E501
         """Check if a user is a member of an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_is_member(org, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_is_member(org, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param str username: username of the user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2421,17 +2467,17 @@ class OrganizationApi(object):
     def org_is_member_with_http_info(self, org, username, **kwargs):  # noqa: E501
         """Check if a user is a member of an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_is_member_with_http_info(org, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_is_member_with_http_info(org, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param str username: username of the user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'username']  # noqa: E501
@@ -2439,6 +2485,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2499,22 +2546,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_is_public_member(self, org, username, **kwargs):  # noqa: E501
         """Check if a user is a public member of an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_is_public_member(org, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_is_public_member(org, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param str username: username of the user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2526,17 +2574,17 @@ class OrganizationApi(object):
     def org_is_public_member_with_http_info(self, org, username, **kwargs):  # noqa: E501
         """Check if a user is a public member of an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_is_public_member_with_http_info(org, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_is_public_member_with_http_info(org, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param str username: username of the user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'username']  # noqa: E501
@@ -2544,6 +2592,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2604,22 +2653,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_current_user_orgs(self, **kwargs):  # noqa: E501
         """List the current user's organizations  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_current_user_orgs(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_current_user_orgs(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Organization]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2631,17 +2681,17 @@ class OrganizationApi(object):
     def org_list_current_user_orgs_with_http_info(self, **kwargs):  # noqa: E501
         """List the current user's organizations  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_current_user_orgs_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_current_user_orgs_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Organization]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -2649,6 +2699,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2701,15 +2752,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_hooks(self, org, **kwargs):  # noqa: E501
         """List an organization's webhooks  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_hooks(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_hooks(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -2717,7 +2769,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Hook]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2729,10 +2781,10 @@ class OrganizationApi(object):
     def org_list_hooks_with_http_info(self, org, **kwargs):  # noqa: E501
         """List an organization's webhooks  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_hooks_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_hooks_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -2740,7 +2792,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Hook]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'page', 'limit']  # noqa: E501
@@ -2748,6 +2800,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2806,15 +2859,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_labels(self, org, **kwargs):  # noqa: E501
         """List an organization's labels  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_labels(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_labels(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -2822,7 +2876,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Label]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2834,10 +2888,10 @@ class OrganizationApi(object):
     def org_list_labels_with_http_info(self, org, **kwargs):  # noqa: E501
         """List an organization's labels  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_labels_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_labels_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -2845,7 +2899,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Label]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'page', 'limit']  # noqa: E501
@@ -2853,6 +2907,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2911,15 +2966,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_members(self, org, **kwargs):  # noqa: E501
         """List an organization's members  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_members(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_members(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -2927,7 +2983,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2939,10 +2995,10 @@ class OrganizationApi(object):
     def org_list_members_with_http_info(self, org, **kwargs):  # noqa: E501
         """List an organization's members  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_members_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_members_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -2950,7 +3006,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'page', 'limit']  # noqa: E501
@@ -2958,6 +3014,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3016,15 +3073,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_public_members(self, org, **kwargs):  # noqa: E501
         """List an organization's public members  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_public_members(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_public_members(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -3032,7 +3090,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3044,10 +3102,10 @@ class OrganizationApi(object):
     def org_list_public_members_with_http_info(self, org, **kwargs):  # noqa: E501
         """List an organization's public members  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_public_members_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_public_members_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -3055,7 +3113,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'page', 'limit']  # noqa: E501
@@ -3063,6 +3121,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3121,15 +3180,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_repos(self, org, **kwargs):  # noqa: E501
         """List an organization's repos  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_repos(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_repos(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -3137,7 +3197,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3149,10 +3209,10 @@ class OrganizationApi(object):
     def org_list_repos_with_http_info(self, org, **kwargs):  # noqa: E501
         """List an organization's repos  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_repos_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_repos_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -3160,7 +3220,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'page', 'limit']  # noqa: E501
@@ -3168,6 +3228,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3226,22 +3287,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_team_member(self, id, username, **kwargs):  # noqa: E501
         """List a particular member of team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_team_member(id, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_team_member(id, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
         :param str username: username of the member to list (required)
         :return: User
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3253,17 +3315,17 @@ class OrganizationApi(object):
     def org_list_team_member_with_http_info(self, id, username, **kwargs):  # noqa: E501
         """List a particular member of team  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_team_member_with_http_info(id, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_team_member_with_http_info(id, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
         :param str username: username of the member to list (required)
         :return: User
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id', 'username']  # noqa: E501
@@ -3271,6 +3333,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3331,15 +3394,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_team_members(self, id, **kwargs):  # noqa: E501
         """List a team's members  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_team_members(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_team_members(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
@@ -3347,7 +3411,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3359,10 +3423,10 @@ class OrganizationApi(object):
     def org_list_team_members_with_http_info(self, id, **kwargs):  # noqa: E501
         """List a team's members  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_team_members_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_team_members_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
@@ -3370,7 +3434,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id', 'page', 'limit']  # noqa: E501
@@ -3378,6 +3442,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3436,15 +3501,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_team_repos(self, id, **kwargs):  # noqa: E501
         """List a team's repos  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_team_repos(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_team_repos(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
@@ -3452,7 +3518,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3464,10 +3530,10 @@ class OrganizationApi(object):
     def org_list_team_repos_with_http_info(self, id, **kwargs):  # noqa: E501
         """List a team's repos  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_team_repos_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_team_repos_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
@@ -3475,7 +3541,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id', 'page', 'limit']  # noqa: E501
@@ -3483,6 +3549,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3541,15 +3608,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_teams(self, org, **kwargs):  # noqa: E501
         """List an organization's teams  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_teams(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_teams(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -3557,7 +3625,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Team]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3569,10 +3637,10 @@ class OrganizationApi(object):
     def org_list_teams_with_http_info(self, org, **kwargs):  # noqa: E501
         """List an organization's teams  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_teams_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_teams_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -3580,7 +3648,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Team]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'page', 'limit']  # noqa: E501
@@ -3588,6 +3656,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3646,15 +3715,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_list_user_orgs(self, username, **kwargs):  # noqa: E501
         """List a user's organizations  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_user_orgs(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_user_orgs(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3662,7 +3732,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Organization]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3674,10 +3744,10 @@ class OrganizationApi(object):
     def org_list_user_orgs_with_http_info(self, username, **kwargs):  # noqa: E501
         """List a user's organizations  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_list_user_orgs_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_list_user_orgs_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3685,7 +3755,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Organization]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'page', 'limit']  # noqa: E501
@@ -3693,6 +3763,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3751,22 +3822,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_publicize_member(self, org, username, **kwargs):  # noqa: E501
         """Publicize a user's membership  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_publicize_member(org, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_publicize_member(org, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param str username: username of the user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3778,17 +3850,17 @@ class OrganizationApi(object):
     def org_publicize_member_with_http_info(self, org, username, **kwargs):  # noqa: E501
         """Publicize a user's membership  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_publicize_member_with_http_info(org, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_publicize_member_with_http_info(org, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
         :param str username: username of the user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'username']  # noqa: E501
@@ -3796,6 +3868,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3856,22 +3929,23 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_remove_team_member(self, id, username, **kwargs):  # noqa: E501
         """Remove a team member  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_remove_team_member(id, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_remove_team_member(id, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
         :param str username: username of the user to remove (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3883,17 +3957,17 @@ class OrganizationApi(object):
     def org_remove_team_member_with_http_info(self, id, username, **kwargs):  # noqa: E501
         """Remove a team member  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_remove_team_member_with_http_info(id, username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_remove_team_member_with_http_info(id, username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
         :param str username: username of the user to remove (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id', 'username']  # noqa: E501
@@ -3901,6 +3975,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3961,16 +4036,17 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def org_remove_team_repository(self, id, org, repo, **kwargs):  # noqa: E501
         """Remove a repository from a team  # noqa: E501
 
         This does not delete the repository, it only removes the repository from the team.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_remove_team_repository(id, org, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_remove_team_repository(id, org, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
@@ -3978,7 +4054,7 @@ class OrganizationApi(object):
         :param str repo: name of the repo to remove (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3991,10 +4067,10 @@ class OrganizationApi(object):
         """Remove a repository from a team  # noqa: E501
 
         This does not delete the repository, it only removes the repository from the team.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.org_remove_team_repository_with_http_info(id, org, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.org_remove_team_repository_with_http_info(id, org, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the team (required)
@@ -4002,7 +4078,7 @@ class OrganizationApi(object):
         :param str repo: name of the repo to remove (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id', 'org', 'repo']  # noqa: E501
@@ -4010,6 +4086,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4076,15 +4153,16 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def team_search(self, org, **kwargs):  # noqa: E501
         """Search for teams within an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.team_search(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.team_search(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -4094,7 +4172,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: InlineResponse200
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4106,10 +4184,10 @@ class OrganizationApi(object):
     def team_search_with_http_info(self, org, **kwargs):  # noqa: E501
         """Search for teams within an organization  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.team_search_with_http_info(org, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.team_search_with_http_info(org, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str org: name of the organization (required)
@@ -4119,7 +4197,7 @@ class OrganizationApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: InlineResponse200
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['org', 'q', 'include_desc', 'page', 'limit']  # noqa: E501
@@ -4127,6 +4205,7 @@ class OrganizationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4189,4 +4268,5 @@ class OrganizationApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
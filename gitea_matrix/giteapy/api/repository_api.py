@@ -36,16 +36,16 @@ class RepositoryApi(object):
     def create_current_user_repo(self, **kwargs):  # noqa: E501
         """Create a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.create_current_user_repo(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.create_current_user_repo(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateRepoOption body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -57,16 +57,16 @@ class RepositoryApi(object):
     def create_current_user_repo_with_http_info(self, **kwargs):  # noqa: E501
         """Create a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.create_current_user_repo_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.create_current_user_repo_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateRepoOption body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['body']  # noqa: E501
@@ -74,6 +74,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -124,15 +125,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def create_fork(self, owner, repo, **kwargs):  # noqa: E501
         """Fork a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.create_fork(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.create_fork(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to fork (required)
@@ -140,7 +142,7 @@ class RepositoryApi(object):
         :param CreateForkOption body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -152,10 +154,10 @@ class RepositoryApi(object):
     def create_fork_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Fork a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.create_fork_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.create_fork_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to fork (required)
@@ -163,7 +165,7 @@ class RepositoryApi(object):
         :param CreateForkOption body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -171,6 +173,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -233,15 +236,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def get_blob(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Gets the blob of a repository.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.get_blob(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.get_blob(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -249,7 +253,7 @@ class RepositoryApi(object):
         :param str sha: sha of the commit (required)
         :return: GitBlobResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -261,10 +265,10 @@ class RepositoryApi(object):
     def get_blob_with_http_info(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Gets the blob of a repository.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.get_blob_with_http_info(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.get_blob_with_http_info(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -272,7 +276,7 @@ class RepositoryApi(object):
         :param str sha: sha of the commit (required)
         :return: GitBlobResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'sha']  # noqa: E501
@@ -280,6 +284,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -346,15 +351,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def get_tag(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Gets the tag object of an annotated tag (not lightweight tags)  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.get_tag(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.get_tag(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -362,7 +368,7 @@ class RepositoryApi(object):
         :param str sha: sha of the tag. The Git tags API only supports annotated tag objects, not lightweight tags. (required)
         :return: AnnotatedTag
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -374,10 +380,10 @@ class RepositoryApi(object):
     def get_tag_with_http_info(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Gets the tag object of an annotated tag (not lightweight tags)  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.get_tag_with_http_info(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.get_tag_with_http_info(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -385,7 +391,7 @@ class RepositoryApi(object):
         :param str sha: sha of the tag. The Git tags API only supports annotated tag objects, not lightweight tags. (required)
         :return: AnnotatedTag
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'sha']  # noqa: E501
@@ -393,6 +399,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -459,15 +466,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def get_tree(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Gets the tree of a repository.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.get_tree(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.get_tree(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -478,7 +486,7 @@ class RepositoryApi(object):
         :param int per_page: number of items per page; default is 1000 or what is set in app.ini as DEFAULT_GIT_TREES_PER_PAGE
         :return: GitTreeResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -490,10 +498,10 @@ class RepositoryApi(object):
     def get_tree_with_http_info(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Gets the tree of a repository.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.get_tree_with_http_info(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.get_tree_with_http_info(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -504,7 +512,7 @@ class RepositoryApi(object):
         :param int per_page: number of items per page; default is 1000 or what is set in app.ini as DEFAULT_GIT_TREES_PER_PAGE
         :return: GitTreeResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'sha', 'recursive', 'page', 'per_page']  # noqa: E501
@@ -512,6 +520,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -584,15 +593,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def list_forks(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's forks  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.list_forks(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.list_forks(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -601,7 +611,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -613,10 +623,10 @@ class RepositoryApi(object):
     def list_forks_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's forks  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.list_forks_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.list_forks_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -625,7 +635,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'page', 'limit']  # noqa: E501
@@ -633,6 +643,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -697,15 +708,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_add_collaborator(self, owner, repo, collaborator, **kwargs):  # noqa: E501
         """Add a collaborator to a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_add_collaborator(owner, repo, collaborator, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_add_collaborator(owner, repo, collaborator, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -714,7 +726,7 @@ class RepositoryApi(object):
         :param AddCollaboratorOption body:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -726,10 +738,10 @@ class RepositoryApi(object):
     def repo_add_collaborator_with_http_info(self, owner, repo, collaborator, **kwargs):  # noqa: E501
         """Add a collaborator to a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_add_collaborator_with_http_info(owner, repo, collaborator, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_add_collaborator_with_http_info(owner, repo, collaborator, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -738,7 +750,7 @@ class RepositoryApi(object):
         :param AddCollaboratorOption body:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'collaborator', 'body']  # noqa: E501
@@ -746,6 +758,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -814,15 +827,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_add_topc(self, owner, repo, topic, **kwargs):  # noqa: E501
         """Add a topic to a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_add_topc(owner, repo, topic, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_add_topc(owner, repo, topic, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -830,7 +844,7 @@ class RepositoryApi(object):
         :param str topic: name of the topic to add (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -842,10 +856,10 @@ class RepositoryApi(object):
     def repo_add_topc_with_http_info(self, owner, repo, topic, **kwargs):  # noqa: E501
         """Add a topic to a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_add_topc_with_http_info(owner, repo, topic, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_add_topc_with_http_info(owner, repo, topic, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -853,7 +867,7 @@ class RepositoryApi(object):
         :param str topic: name of the topic to add (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'topic']  # noqa: E501
@@ -861,6 +875,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -927,15 +942,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_check_collaborator(self, owner, repo, collaborator, **kwargs):  # noqa: E501
         """Check if a user is a collaborator of a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_check_collaborator(owner, repo, collaborator, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_check_collaborator(owner, repo, collaborator, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -943,7 +959,7 @@ class RepositoryApi(object):
         :param str collaborator: username of the collaborator (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -955,10 +971,10 @@ class RepositoryApi(object):
     def repo_check_collaborator_with_http_info(self, owner, repo, collaborator, **kwargs):  # noqa: E501
         """Check if a user is a collaborator of a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_check_collaborator_with_http_info(owner, repo, collaborator, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_check_collaborator_with_http_info(owner, repo, collaborator, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -966,7 +982,7 @@ class RepositoryApi(object):
         :param str collaborator: username of the collaborator (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'collaborator']  # noqa: E501
@@ -974,6 +990,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1040,15 +1057,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_create_branch_protection(self, owner, repo, **kwargs):  # noqa: E501
         """Create a branch protections for a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_branch_protection(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_branch_protection(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1056,7 +1074,7 @@ class RepositoryApi(object):
         :param CreateBranchProtectionOption body:
         :return: BranchProtection
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1068,10 +1086,10 @@ class RepositoryApi(object):
     def repo_create_branch_protection_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Create a branch protections for a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_branch_protection_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_branch_protection_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1079,7 +1097,7 @@ class RepositoryApi(object):
         :param CreateBranchProtectionOption body:
         :return: BranchProtection
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -1087,6 +1105,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1149,15 +1168,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_create_file(self, owner, repo, filepath, body, **kwargs):  # noqa: E501
         """Create a file in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_file(owner, repo, filepath, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_file(owner, repo, filepath, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1166,7 +1186,7 @@ class RepositoryApi(object):
         :param CreateFileOptions body: (required)
         :return: FileResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1178,10 +1198,10 @@ class RepositoryApi(object):
     def repo_create_file_with_http_info(self, owner, repo, filepath, body, **kwargs):  # noqa: E501
         """Create a file in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_file_with_http_info(owner, repo, filepath, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_file_with_http_info(owner, repo, filepath, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1190,7 +1210,7 @@ class RepositoryApi(object):
         :param CreateFileOptions body: (required)
         :return: FileResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'filepath', 'body']  # noqa: E501
@@ -1198,6 +1218,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1270,15 +1291,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_create_hook(self, owner, repo, **kwargs):  # noqa: E501
         """Create a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_hook(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_hook(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1286,7 +1308,7 @@ class RepositoryApi(object):
         :param CreateHookOption body:
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1298,10 +1320,10 @@ class RepositoryApi(object):
     def repo_create_hook_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Create a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_hook_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_hook_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1309,7 +1331,7 @@ class RepositoryApi(object):
         :param CreateHookOption body:
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -1317,6 +1339,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1379,15 +1402,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_create_key(self, owner, repo, **kwargs):  # noqa: E501
         """Add a key to a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_key(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_key(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1395,7 +1419,7 @@ class RepositoryApi(object):
         :param CreateKeyOption body:
         :return: DeployKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1407,10 +1431,10 @@ class RepositoryApi(object):
     def repo_create_key_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Add a key to a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_key_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_key_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1418,7 +1442,7 @@ class RepositoryApi(object):
         :param CreateKeyOption body:
         :return: DeployKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -1426,6 +1450,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1488,15 +1513,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_create_pull_request(self, owner, repo, **kwargs):  # noqa: E501
         """Create a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_pull_request(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_pull_request(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1504,7 +1530,7 @@ class RepositoryApi(object):
         :param CreatePullRequestOption body:
         :return: PullRequest
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1516,10 +1542,10 @@ class RepositoryApi(object):
     def repo_create_pull_request_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Create a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_pull_request_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_pull_request_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1527,7 +1553,7 @@ class RepositoryApi(object):
         :param CreatePullRequestOption body:
         :return: PullRequest
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -1535,6 +1561,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1597,15 +1624,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_create_pull_review(self, owner, repo, index, body, **kwargs):  # noqa: E501
         """Create a review to an pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_pull_review(owner, repo, index, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_pull_review(owner, repo, index, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1614,7 +1642,7 @@ class RepositoryApi(object):
         :param CreatePullReviewOptions body: (required)
         :return: PullReview
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1626,10 +1654,10 @@ class RepositoryApi(object):
     def repo_create_pull_review_with_http_info(self, owner, repo, index, body, **kwargs):  # noqa: E501
         """Create a review to an pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_pull_review_with_http_info(owner, repo, index, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_pull_review_with_http_info(owner, repo, index, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1638,7 +1666,7 @@ class RepositoryApi(object):
         :param CreatePullReviewOptions body: (required)
         :return: PullReview
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'body']  # noqa: E501
@@ -1646,6 +1674,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1718,15 +1747,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_create_release(self, owner, repo, **kwargs):  # noqa: E501
         """Create a release  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_release(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_release(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1734,7 +1764,7 @@ class RepositoryApi(object):
         :param CreateReleaseOption body:
         :return: Release
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1746,10 +1776,10 @@ class RepositoryApi(object):
     def repo_create_release_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Create a release  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_release_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_release_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1757,7 +1787,7 @@ class RepositoryApi(object):
         :param CreateReleaseOption body:
         :return: Release
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -1765,6 +1795,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1827,15 +1858,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_create_release_attachment(self, owner, repo, id, attachment, **kwargs):  # noqa: E501
         """Create a release attachment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_release_attachment(owner, repo, id, attachment, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_release_attachment(owner, repo, id, attachment, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1845,7 +1877,7 @@ class RepositoryApi(object):
         :param str name: name of the attachment
         :return: Attachment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1857,10 +1889,10 @@ class RepositoryApi(object):
     def repo_create_release_attachment_with_http_info(self, owner, repo, id, attachment, **kwargs):  # noqa: E501
         """Create a release attachment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_release_attachment_with_http_info(owner, repo, id, attachment, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_release_attachment_with_http_info(owner, repo, id, attachment, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1870,7 +1902,7 @@ class RepositoryApi(object):
         :param str name: name of the attachment
         :return: Attachment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'attachment', 'name']  # noqa: E501
@@ -1878,6 +1910,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1952,15 +1985,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_create_status(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Create a commit status  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_status(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_status(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1969,7 +2003,7 @@ class RepositoryApi(object):
         :param CreateStatusOption body:
         :return: Status
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1981,10 +2015,10 @@ class RepositoryApi(object):
     def repo_create_status_with_http_info(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Create a commit status  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_create_status_with_http_info(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_create_status_with_http_info(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -1993,7 +2027,7 @@ class RepositoryApi(object):
         :param CreateStatusOption body:
         :return: Status
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'sha', 'body']  # noqa: E501
@@ -2001,6 +2035,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2069,22 +2104,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete(self, owner, repo, **kwargs):  # noqa: E501
         """Delete a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to delete (required)
         :param str repo: name of the repo to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2096,17 +2132,17 @@ class RepositoryApi(object):
     def repo_delete_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Delete a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to delete (required)
         :param str repo: name of the repo to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -2114,6 +2150,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2174,15 +2211,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_branch(self, owner, repo, branch, **kwargs):  # noqa: E501
         """Delete a specific branch from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_branch(owner, repo, branch, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_branch(owner, repo, branch, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2190,7 +2228,7 @@ class RepositoryApi(object):
         :param str branch: branch to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2202,10 +2240,10 @@ class RepositoryApi(object):
     def repo_delete_branch_with_http_info(self, owner, repo, branch, **kwargs):  # noqa: E501
         """Delete a specific branch from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_branch_with_http_info(owner, repo, branch, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_branch_with_http_info(owner, repo, branch, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2213,7 +2251,7 @@ class RepositoryApi(object):
         :param str branch: branch to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'branch']  # noqa: E501
@@ -2221,6 +2259,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2287,15 +2326,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_branch_protection(self, owner, repo, name, **kwargs):  # noqa: E501
         """Delete a specific branch protection for the repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_branch_protection(owner, repo, name, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_branch_protection(owner, repo, name, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2303,7 +2343,7 @@ class RepositoryApi(object):
         :param str name: name of protected branch (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2315,10 +2355,10 @@ class RepositoryApi(object):
     def repo_delete_branch_protection_with_http_info(self, owner, repo, name, **kwargs):  # noqa: E501
         """Delete a specific branch protection for the repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_branch_protection_with_http_info(owner, repo, name, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_branch_protection_with_http_info(owner, repo, name, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2326,7 +2366,7 @@ class RepositoryApi(object):
         :param str name: name of protected branch (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'name']  # noqa: E501
@@ -2334,6 +2374,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2400,15 +2441,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_collaborator(self, owner, repo, collaborator, **kwargs):  # noqa: E501
         """Delete a collaborator from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_collaborator(owner, repo, collaborator, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_collaborator(owner, repo, collaborator, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2416,7 +2458,7 @@ class RepositoryApi(object):
         :param str collaborator: username of the collaborator to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2428,10 +2470,10 @@ class RepositoryApi(object):
     def repo_delete_collaborator_with_http_info(self, owner, repo, collaborator, **kwargs):  # noqa: E501
         """Delete a collaborator from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_collaborator_with_http_info(owner, repo, collaborator, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_collaborator_with_http_info(owner, repo, collaborator, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2439,7 +2481,7 @@ class RepositoryApi(object):
         :param str collaborator: username of the collaborator to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'collaborator']  # noqa: E501
@@ -2447,6 +2489,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2513,15 +2556,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_file(self, owner, repo, filepath, body, **kwargs):  # noqa: E501
         """Delete a file in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_file(owner, repo, filepath, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_file(owner, repo, filepath, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2530,7 +2574,7 @@ class RepositoryApi(object):
         :param DeleteFileOptions body: (required)
         :return: FileDeleteResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2542,10 +2586,10 @@ class RepositoryApi(object):
     def repo_delete_file_with_http_info(self, owner, repo, filepath, body, **kwargs):  # noqa: E501
         """Delete a file in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_file_with_http_info(owner, repo, filepath, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_file_with_http_info(owner, repo, filepath, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2554,7 +2598,7 @@ class RepositoryApi(object):
         :param DeleteFileOptions body: (required)
         :return: FileDeleteResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'filepath', 'body']  # noqa: E501
@@ -2562,6 +2606,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2634,15 +2679,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_git_hook(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a Git hook in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_git_hook(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_git_hook(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2650,7 +2696,7 @@ class RepositoryApi(object):
         :param str id: id of the hook to get (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2662,10 +2708,10 @@ class RepositoryApi(object):
     def repo_delete_git_hook_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a Git hook in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_git_hook_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_git_hook_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2673,7 +2719,7 @@ class RepositoryApi(object):
         :param str id: id of the hook to get (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -2681,6 +2727,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2747,15 +2794,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_hook(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a hook in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_hook(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_hook(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2763,7 +2811,7 @@ class RepositoryApi(object):
         :param int id: id of the hook to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2775,10 +2823,10 @@ class RepositoryApi(object):
     def repo_delete_hook_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a hook in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_hook_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_hook_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2786,7 +2834,7 @@ class RepositoryApi(object):
         :param int id: id of the hook to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -2794,6 +2842,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2860,15 +2909,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_key(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a key from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_key(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_key(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2876,7 +2926,7 @@ class RepositoryApi(object):
         :param int id: id of the key to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2888,10 +2938,10 @@ class RepositoryApi(object):
     def repo_delete_key_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a key from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_key_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_key_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2899,7 +2949,7 @@ class RepositoryApi(object):
         :param int id: id of the key to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -2907,6 +2957,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2973,15 +3024,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_pull_review(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Delete a specific review from a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_pull_review(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_pull_review(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -2990,7 +3042,7 @@ class RepositoryApi(object):
         :param int id: id of the review (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3002,10 +3054,10 @@ class RepositoryApi(object):
     def repo_delete_pull_review_with_http_info(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Delete a specific review from a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_pull_review_with_http_info(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_pull_review_with_http_info(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3014,7 +3066,7 @@ class RepositoryApi(object):
         :param int id: id of the review (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'id']  # noqa: E501
@@ -3022,6 +3074,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3094,15 +3147,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_release(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a release  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_release(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_release(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3110,7 +3164,7 @@ class RepositoryApi(object):
         :param int id: id of the release to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3122,10 +3176,10 @@ class RepositoryApi(object):
     def repo_delete_release_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Delete a release  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_release_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_release_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3133,7 +3187,7 @@ class RepositoryApi(object):
         :param int id: id of the release to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -3141,6 +3195,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3207,15 +3262,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_release_attachment(self, owner, repo, id, attachment_id, **kwargs):  # noqa: E501
         """Delete a release attachment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_release_attachment(owner, repo, id, attachment_id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_release_attachment(owner, repo, id, attachment_id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3224,7 +3280,7 @@ class RepositoryApi(object):
         :param int attachment_id: id of the attachment to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3236,10 +3292,10 @@ class RepositoryApi(object):
     def repo_delete_release_attachment_with_http_info(self, owner, repo, id, attachment_id, **kwargs):  # noqa: E501
         """Delete a release attachment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_release_attachment_with_http_info(owner, repo, id, attachment_id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_release_attachment_with_http_info(owner, repo, id, attachment_id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3248,7 +3304,7 @@ class RepositoryApi(object):
         :param int attachment_id: id of the attachment to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'attachment_id']  # noqa: E501
@@ -3256,6 +3312,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3328,15 +3385,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_delete_topic(self, owner, repo, topic, **kwargs):  # noqa: E501
         """Delete a topic from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_topic(owner, repo, topic, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_topic(owner, repo, topic, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3344,7 +3402,7 @@ class RepositoryApi(object):
         :param str topic: name of the topic to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3356,10 +3414,10 @@ class RepositoryApi(object):
     def repo_delete_topic_with_http_info(self, owner, repo, topic, **kwargs):  # noqa: E501
         """Delete a topic from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_delete_topic_with_http_info(owner, repo, topic, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_delete_topic_with_http_info(owner, repo, topic, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3367,7 +3425,7 @@ class RepositoryApi(object):
         :param str topic: name of the topic to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'topic']  # noqa: E501
@@ -3375,6 +3433,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3441,15 +3500,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_edit(self, owner, repo, **kwargs):  # noqa: E501
         """Edit a repository's properties. Only fields that are set will be changed.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to edit (required)
@@ -3457,7 +3517,7 @@ class RepositoryApi(object):
         :param EditRepoOption body: Properties of a repo that you can edit
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3469,10 +3529,10 @@ class RepositoryApi(object):
     def repo_edit_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Edit a repository's properties. Only fields that are set will be changed.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to edit (required)
@@ -3480,7 +3540,7 @@ class RepositoryApi(object):
         :param EditRepoOption body: Properties of a repo that you can edit
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -3488,6 +3548,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3550,15 +3611,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_edit_branch_protection(self, owner, repo, name, **kwargs):  # noqa: E501
         """Edit a branch protections for a repository. Only fields that are set will be changed  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_branch_protection(owner, repo, name, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_branch_protection(owner, repo, name, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3567,7 +3629,7 @@ class RepositoryApi(object):
         :param EditBranchProtectionOption body:
         :return: BranchProtection
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3579,10 +3641,10 @@ class RepositoryApi(object):
     def repo_edit_branch_protection_with_http_info(self, owner, repo, name, **kwargs):  # noqa: E501
         """Edit a branch protections for a repository. Only fields that are set will be changed  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_branch_protection_with_http_info(owner, repo, name, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_branch_protection_with_http_info(owner, repo, name, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3591,7 +3653,7 @@ class RepositoryApi(object):
         :param EditBranchProtectionOption body:
         :return: BranchProtection
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'name', 'body']  # noqa: E501
@@ -3599,6 +3661,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3667,15 +3730,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_edit_git_hook(self, owner, repo, id, **kwargs):  # noqa: E501
         """Edit a Git hook in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_git_hook(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_git_hook(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3684,7 +3748,7 @@ class RepositoryApi(object):
         :param EditGitHookOption body:
         :return: GitHook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3696,10 +3760,10 @@ class RepositoryApi(object):
     def repo_edit_git_hook_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Edit a Git hook in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_git_hook_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_git_hook_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3708,7 +3772,7 @@ class RepositoryApi(object):
         :param EditGitHookOption body:
         :return: GitHook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'body']  # noqa: E501
@@ -3716,6 +3780,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3784,15 +3849,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_edit_hook(self, owner, repo, id, **kwargs):  # noqa: E501
         """Edit a hook in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_hook(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_hook(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3801,7 +3867,7 @@ class RepositoryApi(object):
         :param EditHookOption body:
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3813,10 +3879,10 @@ class RepositoryApi(object):
     def repo_edit_hook_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Edit a hook in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_hook_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_hook_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3825,7 +3891,7 @@ class RepositoryApi(object):
         :param EditHookOption body:
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'body']  # noqa: E501
@@ -3833,6 +3899,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3901,15 +3968,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_edit_pull_request(self, owner, repo, index, **kwargs):  # noqa: E501
         """Update a pull request. If using deadline only the date will be taken into account, and time of day ignored.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_pull_request(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_pull_request(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3918,7 +3986,7 @@ class RepositoryApi(object):
         :param EditPullRequestOption body:
         :return: PullRequest
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3930,10 +3998,10 @@ class RepositoryApi(object):
     def repo_edit_pull_request_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Update a pull request. If using deadline only the date will be taken into account, and time of day ignored.  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_pull_request_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_pull_request_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -3942,7 +4010,7 @@ class RepositoryApi(object):
         :param EditPullRequestOption body:
         :return: PullRequest
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'body']  # noqa: E501
@@ -3950,6 +4018,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4018,15 +4087,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_edit_release(self, owner, repo, id, **kwargs):  # noqa: E501
         """Update a release  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_release(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_release(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4035,7 +4105,7 @@ class RepositoryApi(object):
         :param EditReleaseOption body:
         :return: Release
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4047,10 +4117,10 @@ class RepositoryApi(object):
     def repo_edit_release_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Update a release  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_release_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_release_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4059,7 +4129,7 @@ class RepositoryApi(object):
         :param EditReleaseOption body:
         :return: Release
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'body']  # noqa: E501
@@ -4067,6 +4137,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4135,15 +4206,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_edit_release_attachment(self, owner, repo, id, attachment_id, **kwargs):  # noqa: E501
         """Edit a release attachment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_release_attachment(owner, repo, id, attachment_id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_release_attachment(owner, repo, id, attachment_id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4153,7 +4225,7 @@ class RepositoryApi(object):
         :param EditAttachmentOptions body:
         :return: Attachment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4165,10 +4237,10 @@ class RepositoryApi(object):
     def repo_edit_release_attachment_with_http_info(self, owner, repo, id, attachment_id, **kwargs):  # noqa: E501
         """Edit a release attachment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_edit_release_attachment_with_http_info(owner, repo, id, attachment_id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_edit_release_attachment_with_http_info(owner, repo, id, attachment_id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4178,7 +4250,7 @@ class RepositoryApi(object):
         :param EditAttachmentOptions body:
         :return: Attachment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'attachment_id', 'body']  # noqa: E501
@@ -4186,6 +4258,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4260,22 +4333,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get(self, owner, repo, **kwargs):  # noqa: E501
         """Get a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4287,17 +4361,17 @@ class RepositoryApi(object):
     def repo_get_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Get a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -4305,6 +4379,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4365,15 +4440,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_all_commits(self, owner, repo, **kwargs):  # noqa: E501
         """Get a list of all commits from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_all_commits(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_all_commits(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4383,7 +4459,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Commit]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4395,10 +4471,10 @@ class RepositoryApi(object):
     def repo_get_all_commits_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Get a list of all commits from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_all_commits_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_all_commits_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4408,7 +4484,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Commit]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'sha', 'page', 'limit']  # noqa: E501
@@ -4416,6 +4492,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4482,15 +4559,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_archive(self, owner, repo, archive, **kwargs):  # noqa: E501
         """Get an archive of a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_archive(owner, repo, archive, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_archive(owner, repo, archive, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4498,7 +4576,7 @@ class RepositoryApi(object):
         :param str archive: archive to download, consisting of a git reference and archive (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4510,10 +4588,10 @@ class RepositoryApi(object):
     def repo_get_archive_with_http_info(self, owner, repo, archive, **kwargs):  # noqa: E501
         """Get an archive of a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_archive_with_http_info(owner, repo, archive, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_archive_with_http_info(owner, repo, archive, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4521,7 +4599,7 @@ class RepositoryApi(object):
         :param str archive: archive to download, consisting of a git reference and archive (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'archive']  # noqa: E501
@@ -4529,6 +4607,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4595,15 +4674,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_branch(self, owner, repo, branch, **kwargs):  # noqa: E501
         """Retrieve a specific branch from a repository, including its effective branch protection  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_branch(owner, repo, branch, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_branch(owner, repo, branch, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4611,7 +4691,7 @@ class RepositoryApi(object):
         :param str branch: branch to get (required)
         :return: Branch
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4623,10 +4703,10 @@ class RepositoryApi(object):
     def repo_get_branch_with_http_info(self, owner, repo, branch, **kwargs):  # noqa: E501
         """Retrieve a specific branch from a repository, including its effective branch protection  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_branch_with_http_info(owner, repo, branch, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_branch_with_http_info(owner, repo, branch, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4634,7 +4714,7 @@ class RepositoryApi(object):
         :param str branch: branch to get (required)
         :return: Branch
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'branch']  # noqa: E501
@@ -4642,6 +4722,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4708,15 +4789,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_branch_protection(self, owner, repo, name, **kwargs):  # noqa: E501
         """Get a specific branch protection for the repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_branch_protection(owner, repo, name, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_branch_protection(owner, repo, name, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4724,7 +4806,7 @@ class RepositoryApi(object):
         :param str name: name of protected branch (required)
         :return: BranchProtection
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4736,10 +4818,10 @@ class RepositoryApi(object):
     def repo_get_branch_protection_with_http_info(self, owner, repo, name, **kwargs):  # noqa: E501
         """Get a specific branch protection for the repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_branch_protection_with_http_info(owner, repo, name, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_branch_protection_with_http_info(owner, repo, name, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4747,7 +4829,7 @@ class RepositoryApi(object):
         :param str name: name of protected branch (required)
         :return: BranchProtection
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'name']  # noqa: E501
@@ -4755,6 +4837,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4821,21 +4904,22 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_by_id(self, id, **kwargs):  # noqa: E501
         """Get a repository by id  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_by_id(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_by_id(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the repo to get (required)
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4847,16 +4931,16 @@ class RepositoryApi(object):
     def repo_get_by_id_with_http_info(self, id, **kwargs):  # noqa: E501
         """Get a repository by id  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_by_id_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_by_id_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of the repo to get (required)
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -4864,6 +4948,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4918,15 +5003,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_combined_status_by_ref(self, owner, repo, ref, **kwargs):  # noqa: E501
         """Get a commit's combined status, by branch/tag/commit reference  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_combined_status_by_ref(owner, repo, ref, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_combined_status_by_ref(owner, repo, ref, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4935,7 +5021,7 @@ class RepositoryApi(object):
         :param int page: page number of results
         :return: Status
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4947,10 +5033,10 @@ class RepositoryApi(object):
     def repo_get_combined_status_by_ref_with_http_info(self, owner, repo, ref, **kwargs):  # noqa: E501
         """Get a commit's combined status, by branch/tag/commit reference  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_combined_status_by_ref_with_http_info(owner, repo, ref, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_combined_status_by_ref_with_http_info(owner, repo, ref, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -4959,7 +5045,7 @@ class RepositoryApi(object):
         :param int page: page number of results
         :return: Status
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'ref', 'page']  # noqa: E501
@@ -4967,6 +5053,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5035,15 +5122,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_contents(self, owner, repo, filepath, **kwargs):  # noqa: E501
         """Gets the metadata and contents (if a file) of an entry in a repository, or a list of entries if a dir  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_contents(owner, repo, filepath, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_contents(owner, repo, filepath, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5052,7 +5140,7 @@ class RepositoryApi(object):
         :param str ref: The name of the commit/branch/tag. Default the repository’s default branch (usually master)
         :return: ContentsResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5064,10 +5152,10 @@ class RepositoryApi(object):
     def repo_get_contents_with_http_info(self, owner, repo, filepath, **kwargs):  # noqa: E501
         """Gets the metadata and contents (if a file) of an entry in a repository, or a list of entries if a dir  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_contents_with_http_info(owner, repo, filepath, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_contents_with_http_info(owner, repo, filepath, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5076,7 +5164,7 @@ class RepositoryApi(object):
         :param str ref: The name of the commit/branch/tag. Default the repository’s default branch (usually master)
         :return: ContentsResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'filepath', 'ref']  # noqa: E501
@@ -5084,6 +5172,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5152,15 +5241,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_contents_list(self, owner, repo, **kwargs):  # noqa: E501
         """Gets the metadata of all the entries of the root dir  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_contents_list(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_contents_list(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5168,7 +5258,7 @@ class RepositoryApi(object):
         :param str ref: The name of the commit/branch/tag. Default the repository’s default branch (usually master)
         :return: list[ContentsResponse]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5180,10 +5270,10 @@ class RepositoryApi(object):
     def repo_get_contents_list_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Gets the metadata of all the entries of the root dir  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_contents_list_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_contents_list_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5191,7 +5281,7 @@ class RepositoryApi(object):
         :param str ref: The name of the commit/branch/tag. Default the repository’s default branch (usually master)
         :return: list[ContentsResponse]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'ref']  # noqa: E501
@@ -5199,6 +5289,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5261,15 +5352,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_editor_config(self, owner, repo, filepath, **kwargs):  # noqa: E501
         """Get the EditorConfig definitions of a file in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_editor_config(owner, repo, filepath, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_editor_config(owner, repo, filepath, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5277,7 +5369,7 @@ class RepositoryApi(object):
         :param str filepath: filepath of file to get (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5289,10 +5381,10 @@ class RepositoryApi(object):
     def repo_get_editor_config_with_http_info(self, owner, repo, filepath, **kwargs):  # noqa: E501
         """Get the EditorConfig definitions of a file in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_editor_config_with_http_info(owner, repo, filepath, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_editor_config_with_http_info(owner, repo, filepath, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5300,7 +5392,7 @@ class RepositoryApi(object):
         :param str filepath: filepath of file to get (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'filepath']  # noqa: E501
@@ -5308,6 +5400,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5374,15 +5467,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_git_hook(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a Git hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_git_hook(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_git_hook(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5390,7 +5484,7 @@ class RepositoryApi(object):
         :param str id: id of the hook to get (required)
         :return: GitHook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5402,10 +5496,10 @@ class RepositoryApi(object):
     def repo_get_git_hook_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a Git hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_git_hook_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_git_hook_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5413,7 +5507,7 @@ class RepositoryApi(object):
         :param str id: id of the hook to get (required)
         :return: GitHook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -5421,6 +5515,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5487,15 +5582,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_hook(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_hook(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_hook(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5503,7 +5599,7 @@ class RepositoryApi(object):
         :param int id: id of the hook to get (required)
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5515,10 +5611,10 @@ class RepositoryApi(object):
     def repo_get_hook_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a hook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_hook_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_hook_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5526,7 +5622,7 @@ class RepositoryApi(object):
         :param int id: id of the hook to get (required)
         :return: Hook
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -5534,6 +5630,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5600,15 +5697,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_key(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a repository's key by id  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_key(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_key(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5616,7 +5714,7 @@ class RepositoryApi(object):
         :param int id: id of the key to get (required)
         :return: DeployKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5628,10 +5726,10 @@ class RepositoryApi(object):
     def repo_get_key_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a repository's key by id  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_key_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_key_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5639,7 +5737,7 @@ class RepositoryApi(object):
         :param int id: id of the key to get (required)
         :return: DeployKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -5647,6 +5745,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5713,15 +5812,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_pull_request(self, owner, repo, index, **kwargs):  # noqa: E501
         """Get a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_pull_request(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_pull_request(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5729,7 +5829,7 @@ class RepositoryApi(object):
         :param int index: index of the pull request to get (required)
         :return: PullRequest
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5741,10 +5841,10 @@ class RepositoryApi(object):
     def repo_get_pull_request_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Get a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_pull_request_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_pull_request_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5752,7 +5852,7 @@ class RepositoryApi(object):
         :param int index: index of the pull request to get (required)
         :return: PullRequest
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index']  # noqa: E501
@@ -5760,6 +5860,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5826,15 +5927,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_pull_review(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Get a specific review for a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_pull_review(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_pull_review(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5843,7 +5945,7 @@ class RepositoryApi(object):
         :param int id: id of the review (required)
         :return: PullReview
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5855,10 +5957,10 @@ class RepositoryApi(object):
     def repo_get_pull_review_with_http_info(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Get a specific review for a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_pull_review_with_http_info(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_pull_review_with_http_info(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5867,7 +5969,7 @@ class RepositoryApi(object):
         :param int id: id of the review (required)
         :return: PullReview
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'id']  # noqa: E501
@@ -5875,6 +5977,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5947,15 +6050,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_pull_review_comments(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Get a specific review for a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_pull_review_comments(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_pull_review_comments(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5964,7 +6068,7 @@ class RepositoryApi(object):
         :param int id: id of the review (required)
         :return: list[PullReviewComment]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -5976,10 +6080,10 @@ class RepositoryApi(object):
     def repo_get_pull_review_comments_with_http_info(self, owner, repo, index, id, **kwargs):  # noqa: E501
         """Get a specific review for a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_pull_review_comments_with_http_info(owner, repo, index, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_pull_review_comments_with_http_info(owner, repo, index, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -5988,7 +6092,7 @@ class RepositoryApi(object):
         :param int id: id of the review (required)
         :return: list[PullReviewComment]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'id']  # noqa: E501
@@ -5996,6 +6100,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6068,15 +6173,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_raw_file(self, owner, repo, filepath, **kwargs):  # noqa: E501
         """Get a file from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_raw_file(owner, repo, filepath, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_raw_file(owner, repo, filepath, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -6084,7 +6190,7 @@ class RepositoryApi(object):
         :param str filepath: filepath of the file to get (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -6096,10 +6202,10 @@ class RepositoryApi(object):
     def repo_get_raw_file_with_http_info(self, owner, repo, filepath, **kwargs):  # noqa: E501
         """Get a file from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_raw_file_with_http_info(owner, repo, filepath, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_raw_file_with_http_info(owner, repo, filepath, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -6107,7 +6213,7 @@ class RepositoryApi(object):
         :param str filepath: filepath of the file to get (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'filepath']  # noqa: E501
@@ -6115,6 +6221,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6181,15 +6288,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_release(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a release  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_release(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_release(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -6197,7 +6305,7 @@ class RepositoryApi(object):
         :param int id: id of the release to get (required)
         :return: Release
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -6209,10 +6317,10 @@ class RepositoryApi(object):
     def repo_get_release_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Get a release  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_release_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_release_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -6220,7 +6328,7 @@ class RepositoryApi(object):
         :param int id: id of the release to get (required)
         :return: Release
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -6228,6 +6336,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6294,15 +6403,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_release_attachment(self, owner, repo, id, attachment_id, **kwargs):  # noqa: E501
         """Get a release attachment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_release_attachment(owner, repo, id, attachment_id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_release_attachment(owner, repo, id, attachment_id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -6311,7 +6421,7 @@ class RepositoryApi(object):
         :param int attachment_id: id of the attachment to get (required)
         :return: Attachment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -6323,10 +6433,10 @@ class RepositoryApi(object):
     def repo_get_release_attachment_with_http_info(self, owner, repo, id, attachment_id, **kwargs):  # noqa: E501
         """Get a release attachment  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_release_attachment_with_http_info(owner, repo, id, attachment_id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_release_attachment_with_http_info(owner, repo, id, attachment_id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -6335,7 +6445,7 @@ class RepositoryApi(object):
         :param int attachment_id: id of the attachment to get (required)
         :return: Attachment
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id', 'attachment_id']  # noqa: E501
@@ -6343,6 +6453,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6415,15 +6526,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_get_single_commit(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Get a single commit from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_single_commit(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_single_commit(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -6431,7 +6543,7 @@ class RepositoryApi(object):
         :param str sha: a git ref or commit sha (required)
         :return: Commit
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -6443,10 +6555,10 @@ class RepositoryApi(object):
     def repo_get_single_commit_with_http_info(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Get a single commit from a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_get_single_commit_with_http_info(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_get_single_commit_with_http_info(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -6454,7 +6566,7 @@ class RepositoryApi(object):
         :param str sha: a git ref or commit sha (required)
         :return: Commit
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'sha']  # noqa: E501
@@ -6462,6 +6574,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6528,22 +6641,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_all_git_refs(self, owner, repo, **kwargs):  # noqa: E501
         """Get specified ref or filtered repository's refs  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_all_git_refs(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_all_git_refs(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: list[Reference]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -6555,17 +6669,17 @@ class RepositoryApi(object):
     def repo_list_all_git_refs_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Get specified ref or filtered repository's refs  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_all_git_refs_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_all_git_refs_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: list[Reference]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -6573,6 +6687,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6633,22 +6748,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_branch_protection(self, owner, repo, **kwargs):  # noqa: E501
         """List branch protections for a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_branch_protection(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_branch_protection(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: list[BranchProtection]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -6660,17 +6776,17 @@ class RepositoryApi(object):
     def repo_list_branch_protection_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List branch protections for a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_branch_protection_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_branch_protection_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: list[BranchProtection]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -6678,6 +6794,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6738,22 +6855,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_branches(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's branches  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_branches(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_branches(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: list[Branch]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -6765,17 +6883,17 @@ class RepositoryApi(object):
     def repo_list_branches_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's branches  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_branches_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_branches_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: list[Branch]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -6783,6 +6901,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6843,15 +6962,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_collaborators(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's collaborators  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_collaborators(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_collaborators(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -6860,7 +6980,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -6872,10 +6992,10 @@ class RepositoryApi(object):
     def repo_list_collaborators_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's collaborators  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_collaborators_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_collaborators_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -6884,7 +7004,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'page', 'limit']  # noqa: E501
@@ -6892,6 +7012,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6956,22 +7077,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_git_hooks(self, owner, repo, **kwargs):  # noqa: E501
         """List the Git hooks in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_git_hooks(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_git_hooks(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: list[GitHook]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -6983,17 +7105,17 @@ class RepositoryApi(object):
     def repo_list_git_hooks_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List the Git hooks in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_git_hooks_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_git_hooks_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: list[GitHook]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -7001,6 +7123,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -7061,15 +7184,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_git_refs(self, owner, repo, ref, **kwargs):  # noqa: E501
         """Get specified ref or filtered repository's refs  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_git_refs(owner, repo, ref, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_git_refs(owner, repo, ref, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7077,7 +7201,7 @@ class RepositoryApi(object):
         :param str ref: part or full name of the ref (required)
         :return: list[Reference]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -7089,10 +7213,10 @@ class RepositoryApi(object):
     def repo_list_git_refs_with_http_info(self, owner, repo, ref, **kwargs):  # noqa: E501
         """Get specified ref or filtered repository's refs  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_git_refs_with_http_info(owner, repo, ref, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_git_refs_with_http_info(owner, repo, ref, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7100,7 +7224,7 @@ class RepositoryApi(object):
         :param str ref: part or full name of the ref (required)
         :return: list[Reference]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'ref']  # noqa: E501
@@ -7108,6 +7232,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -7174,15 +7299,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_hooks(self, owner, repo, **kwargs):  # noqa: E501
         """List the hooks in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_hooks(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_hooks(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7191,7 +7317,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Hook]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -7203,10 +7329,10 @@ class RepositoryApi(object):
     def repo_list_hooks_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List the hooks in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_hooks_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_hooks_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7215,7 +7341,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Hook]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'page', 'limit']  # noqa: E501
@@ -7223,6 +7349,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -7287,15 +7414,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_keys(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's keys  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_keys(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_keys(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7306,7 +7434,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[DeployKey]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -7318,10 +7446,10 @@ class RepositoryApi(object):
     def repo_list_keys_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's keys  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_keys_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_keys_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7332,7 +7460,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[DeployKey]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'key_id', 'fingerprint', 'page', 'limit']  # noqa: E501
@@ -7340,6 +7468,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -7408,15 +7537,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_pull_requests(self, owner, repo, **kwargs):  # noqa: E501
         """List a repo's pull requests  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_pull_requests(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_pull_requests(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7429,7 +7559,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[PullRequest]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -7441,10 +7571,10 @@ class RepositoryApi(object):
     def repo_list_pull_requests_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repo's pull requests  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_pull_requests_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_pull_requests_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7457,7 +7587,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[PullRequest]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'state', 'sort', 'milestone', 'labels', 'page', 'limit']  # noqa: E501
@@ -7465,6 +7595,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -7538,15 +7669,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_pull_reviews(self, owner, repo, index, **kwargs):  # noqa: E501
         """List all reviews for a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_pull_reviews(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_pull_reviews(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7556,7 +7688,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[PullReview]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -7568,10 +7700,10 @@ class RepositoryApi(object):
     def repo_list_pull_reviews_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """List all reviews for a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_pull_reviews_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_pull_reviews_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7581,7 +7713,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[PullReview]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'page', 'limit']  # noqa: E501
@@ -7589,6 +7721,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -7659,15 +7792,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_release_attachments(self, owner, repo, id, **kwargs):  # noqa: E501
         """List release's attachments  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_release_attachments(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_release_attachments(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7675,7 +7809,7 @@ class RepositoryApi(object):
         :param int id: id of the release (required)
         :return: list[Attachment]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -7687,10 +7821,10 @@ class RepositoryApi(object):
     def repo_list_release_attachments_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """List release's attachments  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_release_attachments_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_release_attachments_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7698,7 +7832,7 @@ class RepositoryApi(object):
         :param int id: id of the release (required)
         :return: list[Attachment]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -7706,6 +7840,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -7772,15 +7907,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_releases(self, owner, repo, **kwargs):  # noqa: E501
         """List a repo's releases  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_releases(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_releases(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7790,7 +7926,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Release]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -7802,10 +7938,10 @@ class RepositoryApi(object):
     def repo_list_releases_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repo's releases  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_releases_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_releases_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7815,7 +7951,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Release]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'per_page', 'page', 'limit']  # noqa: E501
@@ -7823,6 +7959,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -7889,15 +8026,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_stargazers(self, owner, repo, **kwargs):  # noqa: E501
         """List a repo's stargazers  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_stargazers(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_stargazers(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7906,7 +8044,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -7918,10 +8056,10 @@ class RepositoryApi(object):
     def repo_list_stargazers_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repo's stargazers  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_stargazers_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_stargazers_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -7930,7 +8068,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'page', 'limit']  # noqa: E501
@@ -7938,6 +8076,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -8002,15 +8141,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_statuses(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Get a commit's statuses  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_statuses(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_statuses(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8022,7 +8162,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Status]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -8034,10 +8174,10 @@ class RepositoryApi(object):
     def repo_list_statuses_with_http_info(self, owner, repo, sha, **kwargs):  # noqa: E501
         """Get a commit's statuses  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_statuses_with_http_info(owner, repo, sha, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_statuses_with_http_info(owner, repo, sha, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8049,7 +8189,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Status]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'sha', 'sort', 'state', 'page', 'limit']  # noqa: E501
@@ -8057,6 +8197,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -8131,15 +8272,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_subscribers(self, owner, repo, **kwargs):  # noqa: E501
         """List a repo's watchers  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_subscribers(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_subscribers(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8148,7 +8290,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -8160,10 +8302,10 @@ class RepositoryApi(object):
     def repo_list_subscribers_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repo's watchers  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_subscribers_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_subscribers_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8172,7 +8314,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'page', 'limit']  # noqa: E501
@@ -8180,6 +8322,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -8244,15 +8387,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_tags(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's tags  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_tags(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_tags(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8261,7 +8405,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, default maximum page size is 50
         :return: list[Tag]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -8273,10 +8417,10 @@ class RepositoryApi(object):
     def repo_list_tags_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repository's tags  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_tags_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_tags_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8285,7 +8429,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, default maximum page size is 50
         :return: list[Tag]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'page', 'limit']  # noqa: E501
@@ -8293,6 +8437,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -8357,15 +8502,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_list_topics(self, owner, repo, **kwargs):  # noqa: E501
         """Get list of topics that a repository has  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_topics(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_topics(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8374,7 +8520,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: TopicName
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -8386,10 +8532,10 @@ class RepositoryApi(object):
     def repo_list_topics_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Get list of topics that a repository has  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_list_topics_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_list_topics_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8398,7 +8544,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: TopicName
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'page', 'limit']  # noqa: E501
@@ -8406,6 +8552,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -8470,15 +8617,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_merge_pull_request(self, owner, repo, index, **kwargs):  # noqa: E501
         """Merge a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_merge_pull_request(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_merge_pull_request(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8487,7 +8635,7 @@ class RepositoryApi(object):
         :param MergePullRequestOption body:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -8499,10 +8647,10 @@ class RepositoryApi(object):
     def repo_merge_pull_request_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Merge a pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_merge_pull_request_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_merge_pull_request_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8511,7 +8659,7 @@ class RepositoryApi(object):
         :param MergePullRequestOption body:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'body']  # noqa: E501
@@ -8519,6 +8667,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -8587,21 +8736,22 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_migrate(self, **kwargs):  # noqa: E501
         """Migrate a remote git repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_migrate(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_migrate(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param MigrateRepoForm body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -8613,16 +8763,16 @@ class RepositoryApi(object):
     def repo_migrate_with_http_info(self, **kwargs):  # noqa: E501
         """Migrate a remote git repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_migrate_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_migrate_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param MigrateRepoForm body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['body']  # noqa: E501
@@ -8630,6 +8780,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -8680,22 +8831,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_mirror_sync(self, owner, repo, **kwargs):  # noqa: E501
         """Sync a mirrored repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_mirror_sync(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_mirror_sync(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to sync (required)
         :param str repo: name of the repo to sync (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -8707,17 +8859,17 @@ class RepositoryApi(object):
     def repo_mirror_sync_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Sync a mirrored repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_mirror_sync_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_mirror_sync_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to sync (required)
         :param str repo: name of the repo to sync (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -8725,6 +8877,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -8785,15 +8938,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_pull_request_is_merged(self, owner, repo, index, **kwargs):  # noqa: E501
         """Check if a pull request has been merged  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_pull_request_is_merged(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_pull_request_is_merged(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8801,7 +8955,7 @@ class RepositoryApi(object):
         :param int index: index of the pull request (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -8813,10 +8967,10 @@ class RepositoryApi(object):
     def repo_pull_request_is_merged_with_http_info(self, owner, repo, index, **kwargs):  # noqa: E501
         """Check if a pull request has been merged  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_pull_request_is_merged_with_http_info(owner, repo, index, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_pull_request_is_merged_with_http_info(owner, repo, index, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -8824,7 +8978,7 @@ class RepositoryApi(object):
         :param int index: index of the pull request (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index']  # noqa: E501
@@ -8832,6 +8986,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -8898,15 +9053,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_search(self, **kwargs):  # noqa: E501
         """Search for repositories  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_search(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_search(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str q: keyword
@@ -8925,7 +9081,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: SearchResults
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -8937,10 +9093,10 @@ class RepositoryApi(object):
     def repo_search_with_http_info(self, **kwargs):  # noqa: E501
         """Search for repositories  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_search_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_search_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str q: keyword
@@ -8959,7 +9115,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: SearchResults
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['q', 'topic', 'include_desc', 'uid', 'priority_owner_id', 'starred_by', 'private', 'template', 'mode', 'exclusive', 'sort', 'order', 'page', 'limit']  # noqa: E501
@@ -8967,6 +9123,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -9043,22 +9200,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_signing_key(self, owner, repo, **kwargs):  # noqa: E501
         """Get signing-key.gpg for given repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_signing_key(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_signing_key(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: str
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -9070,17 +9228,17 @@ class RepositoryApi(object):
     def repo_signing_key_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Get signing-key.gpg for given repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_signing_key_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_signing_key_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: str
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -9088,6 +9246,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -9148,15 +9307,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_submit_pull_review(self, owner, repo, index, id, body, **kwargs):  # noqa: E501
         """Submit a pending review to an pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_submit_pull_review(owner, repo, index, id, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_submit_pull_review(owner, repo, index, id, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -9166,7 +9326,7 @@ class RepositoryApi(object):
         :param SubmitPullReviewOptions body: (required)
         :return: PullReview
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -9178,10 +9338,10 @@ class RepositoryApi(object):
     def repo_submit_pull_review_with_http_info(self, owner, repo, index, id, body, **kwargs):  # noqa: E501
         """Submit a pending review to an pull request  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_submit_pull_review_with_http_info(owner, repo, index, id, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_submit_pull_review_with_http_info(owner, repo, index, id, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -9191,7 +9351,7 @@ class RepositoryApi(object):
         :param SubmitPullReviewOptions body: (required)
         :return: PullReview
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'index', 'id', 'body']  # noqa: E501
@@ -9199,6 +9359,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -9277,15 +9438,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_test_hook(self, owner, repo, id, **kwargs):  # noqa: E501
         """Test a push webhook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_test_hook(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_test_hook(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -9293,7 +9455,7 @@ class RepositoryApi(object):
         :param int id: id of the hook to test (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -9305,10 +9467,10 @@ class RepositoryApi(object):
     def repo_test_hook_with_http_info(self, owner, repo, id, **kwargs):  # noqa: E501
         """Test a push webhook  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_test_hook_with_http_info(owner, repo, id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_test_hook_with_http_info(owner, repo, id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -9316,7 +9478,7 @@ class RepositoryApi(object):
         :param int id: id of the hook to test (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'id']  # noqa: E501
@@ -9324,6 +9486,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -9390,15 +9553,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_tracked_times(self, owner, repo, **kwargs):  # noqa: E501
         """List a repo's tracked times  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_tracked_times(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_tracked_times(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -9410,7 +9574,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[TrackedTime]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -9422,10 +9586,10 @@ class RepositoryApi(object):
     def repo_tracked_times_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """List a repo's tracked times  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_tracked_times_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_tracked_times_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -9437,7 +9601,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[TrackedTime]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'user', 'since', 'before', 'page', 'limit']  # noqa: E501
@@ -9445,6 +9609,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -9515,15 +9680,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_transfer(self, owner, repo, body, **kwargs):  # noqa: E501
         """Transfer a repo ownership  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_transfer(owner, repo, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_transfer(owner, repo, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to transfer (required)
@@ -9531,7 +9697,7 @@ class RepositoryApi(object):
         :param TransferRepoOption body: Transfer Options (required)
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -9543,10 +9709,10 @@ class RepositoryApi(object):
     def repo_transfer_with_http_info(self, owner, repo, body, **kwargs):  # noqa: E501
         """Transfer a repo ownership  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_transfer_with_http_info(owner, repo, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_transfer_with_http_info(owner, repo, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to transfer (required)
@@ -9554,7 +9720,7 @@ class RepositoryApi(object):
         :param TransferRepoOption body: Transfer Options (required)
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -9562,6 +9728,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -9628,15 +9795,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_update_file(self, owner, repo, filepath, body, **kwargs):  # noqa: E501
         """Update a file in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_update_file(owner, repo, filepath, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_update_file(owner, repo, filepath, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -9645,7 +9813,7 @@ class RepositoryApi(object):
         :param UpdateFileOptions body: (required)
         :return: FileResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -9657,10 +9825,10 @@ class RepositoryApi(object):
     def repo_update_file_with_http_info(self, owner, repo, filepath, body, **kwargs):  # noqa: E501
         """Update a file in a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_update_file_with_http_info(owner, repo, filepath, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_update_file_with_http_info(owner, repo, filepath, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -9669,7 +9837,7 @@ class RepositoryApi(object):
         :param UpdateFileOptions body: (required)
         :return: FileResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'filepath', 'body']  # noqa: E501
@@ -9677,6 +9845,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -9749,15 +9918,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def repo_update_topics(self, owner, repo, **kwargs):  # noqa: E501
         """Replace list of topics for a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_update_topics(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_update_topics(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -9765,7 +9935,7 @@ class RepositoryApi(object):
         :param RepoTopicOptions body:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -9777,10 +9947,10 @@ class RepositoryApi(object):
     def repo_update_topics_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Replace list of topics for a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.repo_update_topics_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.repo_update_topics_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -9788,7 +9958,7 @@ class RepositoryApi(object):
         :param RepoTopicOptions body:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'body']  # noqa: E501
@@ -9796,6 +9966,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -9858,15 +10029,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def topic_search(self, q, **kwargs):  # noqa: E501
         """search topics via keyword  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.topic_search(q, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.topic_search(q, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str q: keywords to search (required)
@@ -9874,7 +10046,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[TopicResponse]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -9886,10 +10058,10 @@ class RepositoryApi(object):
     def topic_search_with_http_info(self, q, **kwargs):  # noqa: E501
         """search topics via keyword  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.topic_search_with_http_info(q, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.topic_search_with_http_info(q, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str q: keywords to search (required)
@@ -9897,7 +10069,7 @@ class RepositoryApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[TopicResponse]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['q', 'page', 'limit']  # noqa: E501
@@ -9905,6 +10077,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -9963,22 +10136,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_check_subscription(self, owner, repo, **kwargs):  # noqa: E501
         """Check if the current user is watching a repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_check_subscription(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_check_subscription(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: WatchInfo
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -9990,17 +10164,17 @@ class RepositoryApi(object):
     def user_current_check_subscription_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Check if the current user is watching a repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_check_subscription_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_check_subscription_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: WatchInfo
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -10008,6 +10182,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -10068,22 +10243,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_delete_subscription(self, owner, repo, **kwargs):  # noqa: E501
         """Unwatch a repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_delete_subscription(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_delete_subscription(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -10095,17 +10271,17 @@ class RepositoryApi(object):
     def user_current_delete_subscription_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Unwatch a repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_delete_subscription_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_delete_subscription_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -10113,6 +10289,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -10173,22 +10350,23 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_put_subscription(self, owner, repo, **kwargs):  # noqa: E501
         """Watch a repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_put_subscription(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_put_subscription(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: WatchInfo
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -10200,17 +10378,17 @@ class RepositoryApi(object):
     def user_current_put_subscription_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Watch a repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_put_subscription_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_put_subscription_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: WatchInfo
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -10218,6 +10396,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -10278,15 +10457,16 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_tracked_times(self, owner, repo, user, **kwargs):  # noqa: E501
         """List a user's tracked times in a repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_tracked_times(owner, repo, user, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_tracked_times(owner, repo, user, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -10294,7 +10474,7 @@ class RepositoryApi(object):
         :param str user: username of user (required)
         :return: list[TrackedTime]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -10306,10 +10486,10 @@ class RepositoryApi(object):
     def user_tracked_times_with_http_info(self, owner, repo, user, **kwargs):  # noqa: E501
         """List a user's tracked times in a repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_tracked_times_with_http_info(owner, repo, user, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_tracked_times_with_http_info(owner, repo, user, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
@@ -10317,7 +10497,7 @@ class RepositoryApi(object):
         :param str user: username of user (required)
         :return: list[TrackedTime]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo', 'user']  # noqa: E501
@@ -10325,6 +10505,7 @@ class RepositoryApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -10391,4 +10572,5 @@ class RepositoryApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
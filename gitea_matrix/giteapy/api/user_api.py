@@ -36,16 +36,16 @@ class UserApi(object):
     def create_current_user_repo(self, **kwargs):  # noqa: E501
         """Create a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.create_current_user_repo(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.create_current_user_repo(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateRepoOption body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -57,16 +57,16 @@ class UserApi(object):
     def create_current_user_repo_with_http_info(self, **kwargs):  # noqa: E501
         """Create a repository  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.create_current_user_repo_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.create_current_user_repo_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateRepoOption body:
         :return: Repository
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['body']  # noqa: E501
@@ -74,6 +74,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -124,21 +125,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_add_email(self, **kwargs):  # noqa: E501
         """Add email addresses  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_add_email(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_add_email(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateEmailOption body:
         :return: list[Email]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -150,16 +152,16 @@ class UserApi(object):
     def user_add_email_with_http_info(self, **kwargs):  # noqa: E501
         """Add email addresses  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_add_email_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_add_email_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateEmailOption body:
         :return: list[Email]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['body']  # noqa: E501
@@ -167,6 +169,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -217,22 +220,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_check_following(self, follower, followee, **kwargs):  # noqa: E501
         """Check if one user is following another user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_check_following(follower, followee, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_check_following(follower, followee, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str follower: username of following user (required)
         :param str followee: username of followed user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -244,17 +248,17 @@ class UserApi(object):
     def user_check_following_with_http_info(self, follower, followee, **kwargs):  # noqa: E501
         """Check if one user is following another user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_check_following_with_http_info(follower, followee, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_check_following_with_http_info(follower, followee, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str follower: username of following user (required)
         :param str followee: username of followed user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['follower', 'followee']  # noqa: E501
@@ -262,6 +266,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -322,21 +327,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_create_o_auth2_application(self, body, **kwargs):  # noqa: E501
         """creates a new OAuth2 application  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_create_o_auth2_application(body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_create_o_auth2_application(body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateOAuth2ApplicationOptions body: (required)
         :return: OAuth2Application
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -348,16 +354,16 @@ class UserApi(object):
     def user_create_o_auth2_application_with_http_info(self, body, **kwargs):  # noqa: E501
         """creates a new OAuth2 application  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_create_o_auth2_application_with_http_info(body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_create_o_auth2_application_with_http_info(body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateOAuth2ApplicationOptions body: (required)
         :return: OAuth2Application
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['body']  # noqa: E501
@@ -365,6 +371,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -419,22 +426,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_create_token(self, username, **kwargs):  # noqa: E501
         """Create an access token  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_create_token(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_create_token(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
         :param AccessToken access_token:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -446,17 +454,17 @@ class UserApi(object):
     def user_create_token_with_http_info(self, username, **kwargs):  # noqa: E501
         """Create an access token  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_create_token_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_create_token_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
         :param AccessToken access_token:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'access_token']  # noqa: E501
@@ -464,6 +472,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -520,21 +529,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_check_following(self, username, **kwargs):  # noqa: E501
         """Check whether a user is followed by the authenticated user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_check_following(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_check_following(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of followed user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -546,16 +556,16 @@ class UserApi(object):
     def user_current_check_following_with_http_info(self, username, **kwargs):  # noqa: E501
         """Check whether a user is followed by the authenticated user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_check_following_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_check_following_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of followed user (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username']  # noqa: E501
@@ -563,6 +573,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -617,22 +628,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_check_starring(self, owner, repo, **kwargs):  # noqa: E501
         """Whether the authenticated is starring the repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_check_starring(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_check_starring(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -644,17 +656,17 @@ class UserApi(object):
     def user_current_check_starring_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Whether the authenticated is starring the repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_check_starring_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_check_starring_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo (required)
         :param str repo: name of the repo (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -662,6 +674,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -722,21 +735,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_delete_follow(self, username, **kwargs):  # noqa: E501
         """Unfollow a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_delete_follow(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_delete_follow(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to unfollow (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -748,16 +762,16 @@ class UserApi(object):
     def user_current_delete_follow_with_http_info(self, username, **kwargs):  # noqa: E501
         """Unfollow a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_delete_follow_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_delete_follow_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to unfollow (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username']  # noqa: E501
@@ -765,6 +779,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -819,21 +834,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_delete_gpg_key(self, id, **kwargs):  # noqa: E501
         """Remove a GPG key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_delete_gpg_key(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_delete_gpg_key(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of key to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -845,16 +861,16 @@ class UserApi(object):
     def user_current_delete_gpg_key_with_http_info(self, id, **kwargs):  # noqa: E501
         """Remove a GPG key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_delete_gpg_key_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_delete_gpg_key_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of key to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -862,6 +878,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -916,21 +933,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_delete_key(self, id, **kwargs):  # noqa: E501
         """Delete a public key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_delete_key(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_delete_key(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of key to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -942,16 +960,16 @@ class UserApi(object):
     def user_current_delete_key_with_http_info(self, id, **kwargs):  # noqa: E501
         """Delete a public key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_delete_key_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_delete_key_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of key to delete (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -959,6 +977,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1013,22 +1032,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_delete_star(self, owner, repo, **kwargs):  # noqa: E501
         """Unstar the given repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_delete_star(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_delete_star(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to unstar (required)
         :param str repo: name of the repo to unstar (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1040,17 +1060,17 @@ class UserApi(object):
     def user_current_delete_star_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Unstar the given repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_delete_star_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_delete_star_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to unstar (required)
         :param str repo: name of the repo to unstar (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -1058,6 +1078,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1118,21 +1139,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_get_gpg_key(self, id, **kwargs):  # noqa: E501
         """Get a GPG key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_get_gpg_key(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_get_gpg_key(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of key to get (required)
         :return: GPGKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1144,16 +1166,16 @@ class UserApi(object):
     def user_current_get_gpg_key_with_http_info(self, id, **kwargs):  # noqa: E501
         """Get a GPG key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_get_gpg_key_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_get_gpg_key_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of key to get (required)
         :return: GPGKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -1161,6 +1183,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1215,21 +1238,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_get_key(self, id, **kwargs):  # noqa: E501
         """Get a public key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_get_key(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_get_key(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of key to get (required)
         :return: PublicKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1241,16 +1265,16 @@ class UserApi(object):
     def user_current_get_key_with_http_info(self, id, **kwargs):  # noqa: E501
         """Get a public key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_get_key_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_get_key_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: id of key to get (required)
         :return: PublicKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -1258,6 +1282,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1312,22 +1337,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_list_followers(self, **kwargs):  # noqa: E501
         """List the authenticated user's followers  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_followers(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_followers(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1339,17 +1365,17 @@ class UserApi(object):
     def user_current_list_followers_with_http_info(self, **kwargs):  # noqa: E501
         """List the authenticated user's followers  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_followers_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_followers_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -1357,6 +1383,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1409,22 +1436,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_list_following(self, **kwargs):  # noqa: E501
         """List the users that the authenticated user is following  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_following(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_following(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1436,17 +1464,17 @@ class UserApi(object):
     def user_current_list_following_with_http_info(self, **kwargs):  # noqa: E501
         """List the users that the authenticated user is following  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_following_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_following_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -1454,6 +1482,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1506,22 +1535,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_list_gpg_keys(self, **kwargs):  # noqa: E501
         """List the authenticated user's GPG keys  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_gpg_keys(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_gpg_keys(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[GPGKey]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1533,17 +1563,17 @@ class UserApi(object):
     def user_current_list_gpg_keys_with_http_info(self, **kwargs):  # noqa: E501
         """List the authenticated user's GPG keys  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_gpg_keys_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_gpg_keys_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[GPGKey]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -1551,6 +1581,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1603,15 +1634,16 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_list_keys(self, **kwargs):  # noqa: E501
         """List the authenticated user's public keys  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_keys(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_keys(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str fingerprint: fingerprint of the key
@@ -1619,7 +1651,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[PublicKey]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1631,10 +1663,10 @@ class UserApi(object):
     def user_current_list_keys_with_http_info(self, **kwargs):  # noqa: E501
         """List the authenticated user's public keys  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_keys_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_keys_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str fingerprint: fingerprint of the key
@@ -1642,7 +1674,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[PublicKey]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['fingerprint', 'page', 'limit']  # noqa: E501
@@ -1650,6 +1682,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1704,22 +1737,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_list_repos(self, **kwargs):  # noqa: E501
         """List the repos that the authenticated user owns or has access to  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_repos(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_repos(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1731,17 +1765,17 @@ class UserApi(object):
     def user_current_list_repos_with_http_info(self, **kwargs):  # noqa: E501
         """List the repos that the authenticated user owns or has access to  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_repos_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_repos_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -1749,6 +1783,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1801,22 +1836,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_list_starred(self, **kwargs):  # noqa: E501
         """The repos that the authenticated user has starred  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_starred(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_starred(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1828,17 +1864,17 @@ class UserApi(object):
     def user_current_list_starred_with_http_info(self, **kwargs):  # noqa: E501
         """The repos that the authenticated user has starred  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_starred_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_starred_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -1846,6 +1882,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1898,22 +1935,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_list_subscriptions(self, **kwargs):  # noqa: E501
         """List repositories watched by the authenticated user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_subscriptions(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_subscriptions(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -1925,17 +1963,17 @@ class UserApi(object):
     def user_current_list_subscriptions_with_http_info(self, **kwargs):  # noqa: E501
         """List repositories watched by the authenticated user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_list_subscriptions_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_list_subscriptions_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -1943,6 +1981,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1995,21 +2034,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_post_gpg_key(self, **kwargs):  # noqa: E501
         """Create a GPG key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_post_gpg_key(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_post_gpg_key(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateGPGKeyOption form:
         :return: GPGKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2021,16 +2061,16 @@ class UserApi(object):
     def user_current_post_gpg_key_with_http_info(self, **kwargs):  # noqa: E501
         """Create a GPG key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_post_gpg_key_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_post_gpg_key_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateGPGKeyOption form:
         :return: GPGKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['form']  # noqa: E501
@@ -2038,6 +2078,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2088,21 +2129,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_post_key(self, **kwargs):  # noqa: E501
         """Create a public key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_post_key(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_post_key(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateKeyOption body:
         :return: PublicKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2114,16 +2156,16 @@ class UserApi(object):
     def user_current_post_key_with_http_info(self, **kwargs):  # noqa: E501
         """Create a public key  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_post_key_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_post_key_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param CreateKeyOption body:
         :return: PublicKey
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['body']  # noqa: E501
@@ -2131,6 +2173,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2181,21 +2224,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_put_follow(self, username, **kwargs):  # noqa: E501
         """Follow a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_put_follow(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_put_follow(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to follow (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2207,16 +2251,16 @@ class UserApi(object):
     def user_current_put_follow_with_http_info(self, username, **kwargs):  # noqa: E501
         """Follow a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_put_follow_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_put_follow_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to follow (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username']  # noqa: E501
@@ -2224,6 +2268,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2278,22 +2323,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_put_star(self, owner, repo, **kwargs):  # noqa: E501
         """Star the given repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_put_star(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_put_star(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to star (required)
         :param str repo: name of the repo to star (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2305,17 +2351,17 @@ class UserApi(object):
     def user_current_put_star_with_http_info(self, owner, repo, **kwargs):  # noqa: E501
         """Star the given repo  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_put_star_with_http_info(owner, repo, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_put_star_with_http_info(owner, repo, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str owner: owner of the repo to star (required)
         :param str repo: name of the repo to star (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['owner', 'repo']  # noqa: E501
@@ -2323,6 +2369,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2383,22 +2430,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_current_tracked_times(self, **kwargs):  # noqa: E501
         """List the current user's tracked times  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_tracked_times(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_tracked_times(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param datetime since: Only show times updated after the given time. This is a timestamp in RFC 3339 format
         :param datetime before: Only show times updated before the given time. This is a timestamp in RFC 3339 format
         :return: list[TrackedTime]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2410,17 +2458,17 @@ class UserApi(object):
     def user_current_tracked_times_with_http_info(self, **kwargs):  # noqa: E501
         """List the current user's tracked times  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_current_tracked_times_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_current_tracked_times_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param datetime since: Only show times updated after the given time. This is a timestamp in RFC 3339 format
         :param datetime before: Only show times updated before the given time. This is a timestamp in RFC 3339 format
         :return: list[TrackedTime]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['since', 'before']  # noqa: E501
@@ -2428,6 +2476,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2480,22 +2529,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_delete_access_token(self, username, token, **kwargs):  # noqa: E501
         """delete an access token  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_delete_access_token(username, token, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_delete_access_token(username, token, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
         :param int token: token to be deleted (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2507,17 +2557,17 @@ class UserApi(object):
     def user_delete_access_token_with_http_info(self, username, token, **kwargs):  # noqa: E501
         """delete an access token  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_delete_access_token_with_http_info(username, token, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_delete_access_token_with_http_info(username, token, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
         :param int token: token to be deleted (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'token']  # noqa: E501
@@ -2525,6 +2575,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2585,21 +2636,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_delete_email(self, **kwargs):  # noqa: E501
         """Delete email addresses  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_delete_email(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_delete_email(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param DeleteEmailOption body:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2611,16 +2663,16 @@ class UserApi(object):
     def user_delete_email_with_http_info(self, **kwargs):  # noqa: E501
         """Delete email addresses  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_delete_email_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_delete_email_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param DeleteEmailOption body:
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['body']  # noqa: E501
@@ -2628,6 +2680,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2678,21 +2731,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_delete_o_auth2_application(self, id, **kwargs):  # noqa: E501
         """delete an OAuth2 Application  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_delete_o_auth2_application(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_delete_o_auth2_application(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: token to be deleted (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2704,16 +2758,16 @@ class UserApi(object):
     def user_delete_o_auth2_application_with_http_info(self, id, **kwargs):  # noqa: E501
         """delete an OAuth2 Application  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_delete_o_auth2_application_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_delete_o_auth2_application_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: token to be deleted (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -2721,6 +2775,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2775,21 +2830,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_get(self, username, **kwargs):  # noqa: E501
         """Get a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to get (required)
         :return: User
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2801,16 +2857,16 @@ class UserApi(object):
     def user_get_with_http_info(self, username, **kwargs):  # noqa: E501
         """Get a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to get (required)
         :return: User
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username']  # noqa: E501
@@ -2818,6 +2874,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2872,20 +2929,21 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_get_current(self, **kwargs):  # noqa: E501
         """Get the authenticated user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_current(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_current(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :return: User
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2897,15 +2955,15 @@ class UserApi(object):
     def user_get_current_with_http_info(self, **kwargs):  # noqa: E501
         """Get the authenticated user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_current_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_current_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :return: User
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = []  # noqa: E501
@@ -2913,6 +2971,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2961,21 +3020,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_get_heatmap_data(self, username, **kwargs):  # noqa: E501
         """Get a user's heatmap  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_heatmap_data(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_heatmap_data(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to get (required)
         :return: list[UserHeatmapData]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -2987,16 +3047,16 @@ class UserApi(object):
     def user_get_heatmap_data_with_http_info(self, username, **kwargs):  # noqa: E501
         """Get a user's heatmap  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_heatmap_data_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_heatmap_data_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user to get (required)
         :return: list[UserHeatmapData]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username']  # noqa: E501
@@ -3004,6 +3064,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3058,21 +3119,22 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_get_o_auth2_application(self, id, **kwargs):  # noqa: E501
         """get an OAuth2 Application  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_o_auth2_application(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_o_auth2_application(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: Application ID to be found (required)
         :return: OAuth2Application
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3084,16 +3146,16 @@ class UserApi(object):
     def user_get_o_auth2_application_with_http_info(self, id, **kwargs):  # noqa: E501
         """get an OAuth2 Application  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_o_auth2_application_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_o_auth2_application_with_http_info(id, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: Application ID to be found (required)
         :return: OAuth2Application
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id']  # noqa: E501
@@ -3101,6 +3163,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3155,22 +3218,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_get_oauth2_application(self, **kwargs):  # noqa: E501
         """List the authenticated user's oauth2 applications  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_oauth2_application(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_oauth2_application(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[OAuth2Application]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3182,17 +3246,17 @@ class UserApi(object):
     def user_get_oauth2_application_with_http_info(self, **kwargs):  # noqa: E501
         """List the authenticated user's oauth2 applications  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_oauth2_application_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_oauth2_application_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[OAuth2Application]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -3200,6 +3264,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3252,22 +3317,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_get_stop_watches(self, **kwargs):  # noqa: E501
         """Get list of all existing stopwatches  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_stop_watches(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_stop_watches(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[StopWatch]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3279,17 +3345,17 @@ class UserApi(object):
     def user_get_stop_watches_with_http_info(self, **kwargs):  # noqa: E501
         """Get list of all existing stopwatches  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_stop_watches_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_stop_watches_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[StopWatch]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -3297,6 +3363,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3349,15 +3416,16 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_get_tokens(self, username, **kwargs):  # noqa: E501
         """List the authenticated user's access tokens  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_tokens(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_tokens(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3365,7 +3433,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[AccessToken]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3377,10 +3445,10 @@ class UserApi(object):
     def user_get_tokens_with_http_info(self, username, **kwargs):  # noqa: E501
         """List the authenticated user's access tokens  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_get_tokens_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_get_tokens_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3388,7 +3456,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[AccessToken]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'page', 'limit']  # noqa: E501
@@ -3396,6 +3464,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3454,20 +3523,21 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_list_emails(self, **kwargs):  # noqa: E501
         """List the authenticated user's email addresses  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_emails(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_emails(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :return: list[Email]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3479,15 +3549,15 @@ class UserApi(object):
     def user_list_emails_with_http_info(self, **kwargs):  # noqa: E501
         """List the authenticated user's email addresses  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_emails_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_emails_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :return: list[Email]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = []  # noqa: E501
@@ -3495,6 +3565,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3543,15 +3614,16 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_list_followers(self, username, **kwargs):  # noqa: E501
         """List the given user's followers  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_followers(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_followers(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3559,7 +3631,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3571,10 +3643,10 @@ class UserApi(object):
     def user_list_followers_with_http_info(self, username, **kwargs):  # noqa: E501
         """List the given user's followers  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_followers_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_followers_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3582,7 +3654,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'page', 'limit']  # noqa: E501
@@ -3590,6 +3662,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3648,15 +3721,16 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_list_following(self, username, **kwargs):  # noqa: E501
         """List the users that the given user is following  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_following(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_following(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3664,7 +3738,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3676,10 +3750,10 @@ class UserApi(object):
     def user_list_following_with_http_info(self, username, **kwargs):  # noqa: E501
         """List the users that the given user is following  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_following_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_following_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3687,7 +3761,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[User]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'page', 'limit']  # noqa: E501
@@ -3695,6 +3769,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3753,15 +3828,16 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_list_gpg_keys(self, username, **kwargs):  # noqa: E501
         """List the given user's GPG keys  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_gpg_keys(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_gpg_keys(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3769,7 +3845,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[GPGKey]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3781,10 +3857,10 @@ class UserApi(object):
     def user_list_gpg_keys_with_http_info(self, username, **kwargs):  # noqa: E501
         """List the given user's GPG keys  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_gpg_keys_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_gpg_keys_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3792,7 +3868,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[GPGKey]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'page', 'limit']  # noqa: E501
@@ -3800,6 +3876,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3858,15 +3935,16 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_list_keys(self, username, **kwargs):  # noqa: E501
         """List the given user's public keys  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_keys(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_keys(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3875,7 +3953,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[PublicKey]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3887,10 +3965,10 @@ class UserApi(object):
     def user_list_keys_with_http_info(self, username, **kwargs):  # noqa: E501
         """List the given user's public keys  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_keys_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_keys_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3899,7 +3977,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[PublicKey]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'fingerprint', 'page', 'limit']  # noqa: E501
@@ -3907,6 +3985,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3967,15 +4046,16 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_list_repos(self, username, **kwargs):  # noqa: E501
         """List the repos owned by the given user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_repos(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_repos(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -3983,7 +4063,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -3995,10 +4075,10 @@ class UserApi(object):
     def user_list_repos_with_http_info(self, username, **kwargs):  # noqa: E501
         """List the repos owned by the given user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_repos_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_repos_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -4006,7 +4086,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'page', 'limit']  # noqa: E501
@@ -4014,6 +4094,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4072,15 +4153,16 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_list_starred(self, username, **kwargs):  # noqa: E501
         """The repos that the given user has starred  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_starred(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_starred(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -4088,7 +4170,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4100,10 +4182,10 @@ class UserApi(object):
     def user_list_starred_with_http_info(self, username, **kwargs):  # noqa: E501
         """The repos that the given user has starred  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_starred_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_starred_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of user (required)
@@ -4111,7 +4193,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'page', 'limit']  # noqa: E501
@@ -4119,6 +4201,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4177,15 +4260,16 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_list_subscriptions(self, username, **kwargs):  # noqa: E501
         """List the repositories watched by a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_subscriptions(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_subscriptions(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of the user (required)
@@ -4193,7 +4277,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4205,10 +4289,10 @@ class UserApi(object):
     def user_list_subscriptions_with_http_info(self, username, **kwargs):  # noqa: E501
         """List the repositories watched by a user  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_subscriptions_with_http_info(username, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_subscriptions_with_http_info(username, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str username: username of the user (required)
@@ -4216,7 +4300,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: list[Repository]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['username', 'page', 'limit']  # noqa: E501
@@ -4224,6 +4308,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4282,22 +4367,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_list_teams(self, **kwargs):  # noqa: E501
         """List all the teams a user belongs to  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_teams(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_teams(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Team]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4309,17 +4395,17 @@ class UserApi(object):
     def user_list_teams_with_http_info(self, **kwargs):  # noqa: E501
         """List all the teams a user belongs to  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_list_teams_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_list_teams_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int page: page number of results to return (1-based)
         :param int limit: page size of results, maximum page size is 50
         :return: list[Team]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['page', 'limit']  # noqa: E501
@@ -4327,6 +4413,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4379,15 +4466,16 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_search(self, **kwargs):  # noqa: E501
         """Search for users  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_search(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_search(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str q: keyword
@@ -4396,7 +4484,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: InlineResponse2001
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4408,10 +4496,10 @@ class UserApi(object):
     def user_search_with_http_info(self, **kwargs):  # noqa: E501
         """Search for users  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_search_with_http_info(async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_search_with_http_info(async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param str q: keyword
@@ -4420,7 +4508,7 @@ class UserApi(object):
         :param int limit: page size of results, maximum page size is 50
         :return: InlineResponse2001
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['q', 'uid', 'page', 'limit']  # noqa: E501
@@ -4428,6 +4516,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4484,22 +4573,23 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
 
     def user_update_o_auth2_application(self, id, body, **kwargs):  # noqa: E501
         """update an OAuth2 Application, this includes regenerating the client secret  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_update_o_auth2_application(id, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_update_o_auth2_application(id, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: application to be updated (required)
         :param CreateOAuth2ApplicationOptions body: (required)
         :return: OAuth2Application
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
@@ -4511,17 +4601,17 @@ class UserApi(object):
     def user_update_o_auth2_application_with_http_info(self, id, body, **kwargs):  # noqa: E501
         """update an OAuth2 Application, this includes regenerating the client secret  # noqa: E501
 
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.user_update_o_auth2_application_with_http_info(id, body, async_req=True)
-        >>> result = thread.get()
+        This method returns an awaitable by default. To schedule the
+        HTTP request as an asyncio task, please pass async_req=True
+        >>> task = api.user_update_o_auth2_application_with_http_info(id, body, async_req=True)
+        >>> result = await task
 
         :param async_req bool
         :param int id: application to be updated (required)
         :param CreateOAuth2ApplicationOptions body: (required)
         :return: OAuth2Application
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns the request task.
         """
 
         all_params = ['id', 'body']  # noqa: E501
@@ -4529,6 +4619,7 @@ class UserApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4589,4 +4680,5 @@ class UserApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw=params.get('_raw'),
             collection_formats=collection_formats)
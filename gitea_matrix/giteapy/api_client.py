@@ -11,10 +11,11 @@
 
 from __future__ import absolute_import
 
+import asyncio
 import datetime
+import functools
 import json
 import mimetypes
-from multiprocessing.pool import ThreadPool
 import os
 import re
 import tempfile
@@ -23,9 +24,15 @@ import tempfile
 import six
 from six.moves.urllib.parse import quote
 
+try:
+    from dateutil.parser import parse as parse_datetime
+except ImportError:
+    parse_datetime = None
+
 from .configuration import Configuration
 from . import models as models
 from . import rest as rest
+from .raw import wrap
 
 
 class ApiClient(object):
@@ -46,6 +53,10 @@ class ApiClient(object):
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
+    :param rest_client: a shared .RESTClientObject to send requests with.
+        A shared client is not closed together with this ApiClient.
+    :param raw: return responses as .raw.JSONView objects instead of
+        models, unless a request sets _raw=False.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
@@ -59,33 +70,37 @@ class ApiClient(object):
         'datetime': datetime.datetime,
         'object': object,
     }
+    # Compiled deserializers by type string or class, shared by all clients.
+    _deserializers = {}
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
-                 cookie=None):
+                 cookie=None, rest_client=None, raw=False):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
 
-        # Use the pool property to lazily initialize the ThreadPool.
-        self._pool = None
-        self.rest_client = rest.RESTClientObject(configuration)
+        self._owns_rest_client = rest_client is None
+        if rest_client is None:
+            rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = rest_client
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
         self.cookie = cookie
+        self.raw = raw
         # Set default User-Agent.
         self.user_agent = 'Swagger-Codegen/0.0.1/python'
 
-    def __del__(self):
-        if self._pool is not None:
-            self._pool.close()
-            self._pool.join()
+    async def __aenter__(self):
+        return self
 
-    @property
-    def pool(self):
-        if self._pool is None:
-            self._pool = ThreadPool()
-        return self._pool
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the REST client and releases its pooled connections."""
+        if self._owns_rest_client:
+            await self.rest_client.close()
 
     @property
     def user_agent(self):
@@ -99,12 +114,12 @@ class ApiClient(object):
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
 
-    def __call_api(
+    async def __call_api(
             self, resource_path, method, path_params=None,
             query_params=None, header_params=None, body=None, post_params=None,
             files=None, response_type=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
-            _preload_content=True, _request_timeout=None):
+            _preload_content=True, _request_timeout=None, _raw=None):
 
         config = self.configuration
 
@@ -154,7 +169,7 @@ class ApiClient(object):
         url = self.configuration.host + resource_path
 
         # perform request and return response
-        response_data = self.request(
+        response_data = await self.request(
             method, url, query_params=query_params, headers=header_params,
             post_params=post_params, body=body,
             _preload_content=_preload_content,
@@ -166,7 +181,9 @@ class ApiClient(object):
         if _preload_content:
             # deserialize response data
             if response_type:
-                return_data = self.deserialize(response_data, response_type)
+                raw = self.raw if _raw is None else _raw
+                return_data = self.deserialize(response_data, response_type,
+                                               raw=raw)
             else:
                 return_data = None
 
@@ -218,12 +235,14 @@ class ApiClient(object):
         return {key: self.sanitize_for_serialization(val)
                 for key, val in six.iteritems(obj_dict)}
 
-    def deserialize(self, response, response_type):
+    def deserialize(self, response, response_type, raw=False):
         """Deserializes response into an object.
 
         :param response: RESTResponse object to be deserialized.
         :param response_type: class literal for
             deserialized object, or string of class name.
+        :param raw: wrap the decoded JSON in .raw.JSONView objects
+            instead of building models.
 
         :return: deserialized object.
         """
@@ -238,6 +257,8 @@ class ApiClient(object):
         except ValueError:
             data = response.data
 
+        if raw:
+            return wrap(data)
         return self.__deserialize(data, response_type)
 
     def __deserialize(self, data, klass):
@@ -250,44 +271,61 @@ class ApiClient(object):
         """
         if data is None:
             return None
+        return self.__deserializer(klass)(data)
+
+    @classmethod
+    def __deserializer(cls, klass):
+        """Returns the deserializer function of a type.
+
+        The type string is parsed once, later calls return the cached
+        function, which converts decoded JSON without further lookups.
+
+        :param klass: class literal, or string of class name.
+        :return: function taking the decoded JSON value.
+        """
+        try:
+            return cls._deserializers[klass]
+        except KeyError:
+            pass
 
         if type(klass) == str:
             if klass.startswith('list['):
-                sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
-            if klass.startswith('dict('):
-                sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in six.iteritems(data)}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
+                sub = cls.__deserializer(re.match(r'list\[(.*)\]', klass).group(1))
+                func = lambda data: [None if sub_data is None else sub(sub_data)
+                                     for sub_data in data]
+            elif klass.startswith('dict('):
+                sub = cls.__deserializer(re.match(r'dict\(([^,]*), (.*)\)', klass).group(2))
+                func = lambda data: {k: None if v is None else sub(v)
+                                     for k, v in six.iteritems(data)}
+            elif klass in cls.NATIVE_TYPES_MAPPING:
+                func = cls.__deserializer(cls.NATIVE_TYPES_MAPPING[klass])
             else:
-                klass = getattr(models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+                func = cls.__deserializer(getattr(models, klass))
+        elif klass in cls.PRIMITIVE_TYPES:
+            func = functools.partial(cls.__deserialize_primitive, klass=klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            func = cls.__deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            func = cls.__deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datatime(data)
+            func = cls.__deserialize_datatime
         else:
-            return self.__deserialize_model(data, klass)
+            return cls.__compile_model(klass)
+
+        cls._deserializers[klass] = func
+        return func
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
                  body=None, post_params=None, files=None,
                  response_type=None, auth_settings=None, async_req=None,
                  _return_http_data_only=None, collection_formats=None,
-                 _preload_content=True, _request_timeout=None):
-        """Makes the HTTP request (synchronous) and returns deserialized data.
+                 _preload_content=True, _request_timeout=None, _raw=None):
+        """Makes the HTTP request and returns deserialized data.
 
-        To make an async request, set the async_req parameter.
+        The request is performed on the running asyncio event loop, the
+        returned coroutine has to be awaited. To schedule the request as
+        a task instead, set the async_req parameter.
 
         :param resource_path: Path to method endpoint.
         :param method: Method to call.
@@ -307,93 +345,88 @@ class ApiClient(object):
                                        and headers
         :param collection_formats: dict of collection formats for path, query,
             header, and post parameters.
-        :param _preload_content: if False, the urllib3.HTTPResponse object will
-                                 be returned without reading/decoding response
-                                 data. Default is True.
+        :param _preload_content: if False, the aiohttp.ClientResponse object
+                                 will be returned without reading/decoding
+                                 response data. Default is True.
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _raw: if True, the response is returned as .raw.JSONView
+                     objects without building models, if False as models.
+                     Defaults to the raw setting of the client.
         :return:
             If async_req parameter is True,
-            the request will be called asynchronously.
-            The method will return the request thread.
+            the request will be scheduled as an asyncio task.
+            The method will return the task.
             If parameter async_req is False or missing,
-            then the method will return the response directly.
+            then the method will return an awaitable for the response.
         """
+        coro = self.__call_api(resource_path, method,
+                               path_params, query_params, header_params,
+                               body, post_params, files,
+                               response_type, auth_settings,
+                               _return_http_data_only, collection_formats,
+                               _preload_content, _request_timeout, _raw)
         if not async_req:
-            return self.__call_api(resource_path, method,
-                                   path_params, query_params, header_params,
-                                   body, post_params, files,
-                                   response_type, auth_settings,
-                                   _return_http_data_only, collection_formats,
-                                   _preload_content, _request_timeout)
-        else:
-            thread = self.pool.apply_async(self.__call_api, (resource_path,
-                                           method, path_params, query_params,
-                                           header_params, body,
-                                           post_params, files,
-                                           response_type, auth_settings,
-                                           _return_http_data_only,
-                                           collection_formats,
-                                           _preload_content, _request_timeout))
-        return thread
-
-    def request(self, method, url, query_params=None, headers=None,
-                post_params=None, body=None, _preload_content=True,
-                _request_timeout=None):
+            return coro
+        return asyncio.ensure_future(coro)
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      post_params=None, body=None, _preload_content=True,
+                      _request_timeout=None):
         """Makes the HTTP request using RESTClient."""
         if method == "GET":
-            return self.rest_client.GET(url,
-                                        query_params=query_params,
-                                        _preload_content=_preload_content,
-                                        _request_timeout=_request_timeout,
-                                        headers=headers)
+            return (await self.rest_client.GET(url,
+                                               query_params=query_params,
+                                               _preload_content=_preload_content,
+                                               _request_timeout=_request_timeout,
+                                               headers=headers))
         elif method == "HEAD":
-            return self.rest_client.HEAD(url,
-                                         query_params=query_params,
-                                         _preload_content=_preload_content,
-                                         _request_timeout=_request_timeout,
-                                         headers=headers)
+            return (await self.rest_client.HEAD(url,
+                                                query_params=query_params,
+                                                _preload_content=_preload_content,
+                                                _request_timeout=_request_timeout,
+                                                headers=headers))
         elif method == "OPTIONS":
-            return self.rest_client.OPTIONS(url,
-                                            query_params=query_params,
-                                            headers=headers,
-                                            post_params=post_params,
-                                            _preload_content=_preload_content,
-                                            _request_timeout=_request_timeout,
-                                            body=body)
+            return (await self.rest_client.OPTIONS(url,
+                                                   query_params=query_params,
+                                                   headers=headers,
+                                                   post_params=post_params,
+                                                   _preload_content=_preload_content,
+                                                   _request_timeout=_request_timeout,
+                                                   body=body))
         elif method == "POST":
-            return self.rest_client.POST(url,
-                                         query_params=query_params,
-                                         headers=headers,
-                                         post_params=post_params,
-                                         _preload_content=_preload_content,
-                                         _request_timeout=_request_timeout,
-                                         body=body)
+            return (await self.rest_client.POST(url,
+                                                query_params=query_params,
+                                                headers=headers,
+                                                post_params=post_params,
+                                                _preload_content=_preload_content,
+                                                _request_timeout=_request_timeout,
+                                                body=body))
         elif method == "PUT":
-            return self.rest_client.PUT(url,
-                                        query_params=query_params,
-                                        headers=headers,
-                                        post_params=post_params,
-                                        _preload_content=_preload_content,
-                                        _request_timeout=_request_timeout,
-                                        body=body)
+            return (await self.rest_client.PUT(url,
+                                               query_params=query_params,
+                                               headers=headers,
+                                               post_params=post_params,
+                                               _preload_content=_preload_content,
+                                               _request_timeout=_request_timeout,
+                                               body=body))
         elif method == "PATCH":
-            return self.rest_client.PATCH(url,
-                                          query_params=query_params,
-                                          headers=headers,
-                                          post_params=post_params,
-                                          _preload_content=_preload_content,
-                                          _request_timeout=_request_timeout,
-                                          body=body)
+            return (await self.rest_client.PATCH(url,
+                                                 query_params=query_params,
+                                                 headers=headers,
+                                                 post_params=post_params,
+                                                 _preload_content=_preload_content,
+                                                 _request_timeout=_request_timeout,
+                                                 body=body))
         elif method == "DELETE":
-            return self.rest_client.DELETE(url,
-                                           query_params=query_params,
-                                           headers=headers,
-                                           _preload_content=_preload_content,
-                                           _request_timeout=_request_timeout,
-                                           body=body)
+            return (await self.rest_client.DELETE(url,
+                                                  query_params=query_params,
+                                                  headers=headers,
+                                                  _preload_content=_preload_content,
+                                                  _request_timeout=_request_timeout,
+                                                  body=body))
         else:
             raise ValueError(
                 "http method must be `GET`, `HEAD`, `OPTIONS`,"
@@ -538,7 +571,8 @@ class ApiClient(object):
 
         return path
 
-    def __deserialize_primitive(self, data, klass):
+    @staticmethod
+    def __deserialize_primitive(data, klass):
         """Deserializes string to primitive type.
 
         :param data: str.
@@ -553,43 +587,56 @@ class ApiClient(object):
         except TypeError:
             return data
 
-    def __deserialize_object(self, value):
+    @staticmethod
+    def __deserialize_object(value):
         """Return a original value.
 
         :return: object.
         """
         return value
 
-    def __deserialize_date(self, string):
+    @staticmethod
+    def __deserialize_date(string):
         """Deserializes string to date.
 
         :param string: str.
         :return: date.
         """
         try:
-            from dateutil.parser import parse
-            return parse(string).date()
-        except ImportError:
+            return datetime.date.fromisoformat(string)
+        except (TypeError, ValueError):
+            pass
+        if parse_datetime is None:
             return string
+        try:
+            return parse_datetime(string).date()
         except ValueError:
             raise rest.ApiException(
                 status=0,
                 reason="Failed to parse `{0}` as date object".format(string)
             )
 
-    def __deserialize_datatime(self, string):
+    @staticmethod
+    def __deserialize_datatime(string):
         """Deserializes string to datetime.
 
-        The string should be in iso8601 datetime format.
+        The string should be in iso8601 datetime format. The RFC 3339
+        timestamps Gitea sends are parsed by datetime.fromisoformat, other
+        formats by dateutil.
 
         :param string: str.
         :return: datetime.
         """
         try:
-            from dateutil.parser import parse
-            return parse(string)
-        except ImportError:
+            if string[-1:] in ('Z', 'z'):
+                return datetime.datetime.fromisoformat(string[:-1] + '+00:00')
+            return datetime.datetime.fromisoformat(string)
+        except (TypeError, ValueError):
+            pass
+        if parse_datetime is None:
             return string
+        try:
+            return parse_datetime(string)
         except ValueError:
             raise rest.ApiException(
                 status=0,
@@ -599,40 +646,41 @@ class ApiClient(object):
                 )
             )
 
-    def __hasattr(self, object, name):
-        return name in object.__class__.__dict__
+    @classmethod
+    def __compile_model(cls, klass):
+        """Compiles and caches the deserializer of a model class.
 
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
         :param klass: class literal.
-        :return: model object.
+        :return: function taking a decoded JSON dict.
         """
-
-        if (not klass.swagger_types and
-                not self.__hasattr(klass, 'get_real_child_model')):
-            return data
-
-        kwargs = {}
-        if klass.swagger_types is not None:
-            for attr, attr_type in six.iteritems(klass.swagger_types):
-                if (data is not None and
-                        klass.attribute_map[attr] in data and
-                        isinstance(data, (list, dict))):
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if (isinstance(instance, dict) and
-                klass.swagger_types is not None and
-                isinstance(data, dict)):
-            for key, value in data.items():
-                if key not in klass.swagger_types:
-                    instance[key] = value
-        if self.__hasattr(instance, 'get_real_child_model'):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
+        has_child_model = 'get_real_child_model' in klass.__dict__
+        if not klass.swagger_types and not has_child_model:
+            cls._deserializers[klass] = cls.__deserialize_object
+            return cls.__deserialize_object
+
+        fields = []
+        extra_keys = issubclass(klass, dict)
+
+        def deserialize_model(data):
+            kwargs = {}
+            if isinstance(data, dict):
+                for attr, key, sub in fields:
+                    if key in data:
+                        value = data[key]
+                        kwargs[attr] = None if value is None else sub(value)
+            instance = klass(**kwargs)
+            if extra_keys and isinstance(data, dict):
+                for key, value in data.items():
+                    if key not in klass.swagger_types:
+                        instance[key] = value
+            if has_child_model:
+                klass_name = instance.get_real_child_model(data)
+                if klass_name:
+                    instance = cls.__deserializer(klass_name)(data)
+            return instance
+
+        # Register before compiling the fields, models may contain themselves.
+        cls._deserializers[klass] = deserialize_model
+        fields.extend((attr, klass.attribute_map[attr], cls.__deserializer(attr_type))
+                      for attr, attr_type in six.iteritems(klass.swagger_types or {}))
+        return deserialize_model
@@ -17,8 +17,8 @@ import copy
 import logging
 import multiprocessing
 import sys
-import urllib3
 
+import aiohttp
 import six
 from six.moves import http_client as httplib
 
@@ -59,7 +59,7 @@ class Configuration(object):
         # Logging Settings
         self.logger = {}
         self.logger["package_logger"] = logging.getLogger("giteapy")
-        self.logger["urllib3_logger"] = logging.getLogger("urllib3")
+        self.logger["aiohttp_logger"] = logging.getLogger("aiohttp.client")
         # Log format
         self.logger_format = '%(asctime)s %(levelname)s %(message)s'
         # Log stream handler
@@ -84,10 +84,10 @@ class Configuration(object):
         # Set this to True/False to enable/disable SSL hostname verification.
         self.assert_hostname = None
 
-        # urllib3 connection pool's maximum number of connections saved
-        # per pool. urllib3 uses 1 connection as default value, but this is
-        # not the best value when you are making a lot of possibly parallel
-        # requests to the same host, which is often the case here.
+        # aiohttp connector's maximum number of simultaneous connections.
+        # A small limit is not the best value when you are making a lot of
+        # possibly parallel requests to the same host, which is often the
+        # case here.
         # cpu_count * 5 is used as default value to increase performance.
         self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
 
@@ -219,9 +219,7 @@ class Configuration(object):
 
         :return: The token for basic HTTP authentication.
         """
-        return urllib3.util.make_headers(
-            basic_auth=self.username + ':' + self.password
-        ).get('authorization')
+        return aiohttp.BasicAuth(self.username, self.password).encode()
 
     def auth_settings(self):
         """Gets Auth Settings dict for api client.
@@ -14,128 +14,276 @@
 
 from __future__ import absolute_import
 
-# import models into model package
-from .api_error import APIError 
-from .access_token import AccessToken 
-from .add_collaborator_option import AddCollaboratorOption 
-from .add_time_option import AddTimeOption 
-from .annotated_tag import AnnotatedTag 
-from .annotated_tag_object import AnnotatedTagObject 
-from .attachment import Attachment 
-from .branch import Branch 
-from .branch_protection import BranchProtection 
-from .comment import Comment 
-from .commit import Commit 
-from .commit_date_options import CommitDateOptions 
-from .commit_meta import CommitMeta 
-from .commit_user import CommitUser 
-from .contents_response import ContentsResponse 
-from .create_branch_protection_option import CreateBranchProtectionOption 
-from .create_email_option import CreateEmailOption 
-from .create_file_options import CreateFileOptions 
-from .create_fork_option import CreateForkOption 
-from .create_gpg_key_option import CreateGPGKeyOption 
-from .create_hook_option import CreateHookOption 
-from .create_hook_option_config import CreateHookOptionConfig 
-from .create_issue_comment_option import CreateIssueCommentOption 
-from .create_issue_option import CreateIssueOption 
-from .create_key_option import CreateKeyOption 
-from .create_label_option import CreateLabelOption 
-from .create_milestone_option import CreateMilestoneOption 
-from .create_o_auth2_application_options import CreateOAuth2ApplicationOptions 
-from .create_org_option import CreateOrgOption 
-from .create_pull_request_option import CreatePullRequestOption 
-from .create_pull_review_comment import CreatePullReviewComment 
-from .create_pull_review_options import CreatePullReviewOptions 
-from .create_release_option import CreateReleaseOption 
-from .create_repo_option import CreateRepoOption 
-from .create_status_option import CreateStatusOption 
-from .create_team_option import CreateTeamOption 
-from .create_user_option import CreateUserOption 
-from .delete_email_option import DeleteEmailOption 
-from .delete_file_options import DeleteFileOptions 
-from .deploy_key import DeployKey 
-from .edit_attachment_options import EditAttachmentOptions 
-from .edit_branch_protection_option import EditBranchProtectionOption 
-from .edit_deadline_option import EditDeadlineOption 
-from .edit_git_hook_option import EditGitHookOption 
-from .edit_hook_option import EditHookOption 
-from .edit_issue_comment_option import EditIssueCommentOption 
-from .edit_issue_option import EditIssueOption 
-from .edit_label_option import EditLabelOption 
-from .edit_milestone_option import EditMilestoneOption 
-from .edit_org_option import EditOrgOption 
-from .edit_pull_request_option import EditPullRequestOption 
-from .edit_reaction_option import EditReactionOption 
-from .edit_release_option import EditReleaseOption 
-from .edit_repo_option import EditRepoOption 
-from .edit_team_option import EditTeamOption 
-from .edit_user_option import EditUserOption 
-from .email import Email 
-from .external_tracker import ExternalTracker 
-from .external_wiki import ExternalWiki 
-from .file_commit_response import FileCommitResponse 
-from .file_delete_response import FileDeleteResponse 
-from .file_links_response import FileLinksResponse 
-from .file_response import FileResponse 
-from .gpg_key import GPGKey 
-from .gpg_key_email import GPGKeyEmail 
-from .git_blob_response import GitBlobResponse 
-from .git_entry import GitEntry 
-from .git_hook import GitHook 
-from .git_object import GitObject 
-from .git_tree_response import GitTreeResponse 
-from .hook import Hook 
-from .identity import Identity 
-from .inline_response200 import InlineResponse200 
-from .inline_response2001 import InlineResponse2001 
-from .internal_tracker import InternalTracker 
-from .issue import Issue 
-from .issue_deadline import IssueDeadline 
-from .issue_labels_option import IssueLabelsOption 
-from .label import Label 
-from .markdown_option import MarkdownOption 
-from .merge_pull_request_option import MergePullRequestOption 
-from .migrate_repo_form import MigrateRepoForm 
-from .milestone import Milestone 
-from .notification_count import NotificationCount 
-from .notification_subject import NotificationSubject 
-from .notification_thread import NotificationThread 
-from .o_auth2_application import OAuth2Application 
-from .organization import Organization 
-from .pr_branch_info import PRBranchInfo 
-from .payload_commit import PayloadCommit 
-from .payload_commit_verification import PayloadCommitVerification 
-from .payload_user import PayloadUser 
-from .permission import Permission 
-from .public_key import PublicKey 
-from .pull_request import PullRequest 
-from .pull_request_meta import PullRequestMeta 
-from .pull_review import PullReview 
-from .pull_review_comment import PullReviewComment 
-from .reaction import Reaction 
-from .reference import Reference 
-from .release import Release 
-from .repo_commit import RepoCommit 
-from .repo_topic_options import RepoTopicOptions 
-from .repository import Repository 
-from .repository_meta import RepositoryMeta 
-from .review_state_type import ReviewStateType 
-from .search_results import SearchResults 
-from .server_version import ServerVersion 
-from .state_type import StateType 
-from .status import Status 
-from .status_state import StatusState 
-from .stop_watch import StopWatch 
-from .submit_pull_review_options import SubmitPullReviewOptions 
-from .tag import Tag 
-from .team import Team 
-from .time_stamp import TimeStamp 
-from .topic_name import TopicName 
-from .topic_response import TopicResponse 
-from .tracked_time import TrackedTime 
-from .transfer_repo_option import TransferRepoOption 
-from .update_file_options import UpdateFileOptions 
-from .user import User 
-from .user_heatmap_data import UserHeatmapData 
-from .watch_info import WatchInfo 
+import importlib
+from typing import TYPE_CHECKING
+
+# models of the model package, imported on first access
+_MODULES = {
+    "APIError": ".api_error",
+    "AccessToken": ".access_token",
+    "AddCollaboratorOption": ".add_collaborator_option",
+    "AddTimeOption": ".add_time_option",
+    "AnnotatedTag": ".annotated_tag",
+    "AnnotatedTagObject": ".annotated_tag_object",
+    "Attachment": ".attachment",
+    "Branch": ".branch",
+    "BranchProtection": ".branch_protection",
+    "Comment": ".comment",
+    "Commit": ".commit",
+    "CommitDateOptions": ".commit_date_options",
+    "CommitMeta": ".commit_meta",
+    "CommitUser": ".commit_user",
+    "ContentsResponse": ".contents_response",
+    "CreateBranchProtectionOption": ".create_branch_protection_option",
+    "CreateEmailOption": ".create_email_option",
+    "CreateFileOptions": ".create_file_options",
+    "CreateForkOption": ".create_fork_option",
+    "CreateGPGKeyOption": ".create_gpg_key_option",
+    "CreateHookOption": ".create_hook_option",
+    "CreateHookOptionConfig": ".create_hook_option_config",
+    "CreateIssueCommentOption": ".create_issue_comment_option",
+    "CreateIssueOption": ".create_issue_option",
+    "CreateKeyOption": ".create_key_option",
+    "CreateLabelOption": ".create_label_option",
+    "CreateMilestoneOption": ".create_milestone_option",
+    "CreateOAuth2ApplicationOptions": ".create_o_auth2_application_options",
+    "CreateOrgOption": ".create_org_option",
+    "CreatePullRequestOption": ".create_pull_request_option",
+    "CreatePullReviewComment": ".create_pull_review_comment",
+    "CreatePullReviewOptions": ".create_pull_review_options",
+    "CreateReleaseOption": ".create_release_option",
+    "CreateRepoOption": ".create_repo_option",
+    "CreateStatusOption": ".create_status_option",
+    "CreateTeamOption": ".create_team_option",
+    "CreateUserOption": ".create_user_option",
+    "DeleteEmailOption": ".delete_email_option",
+    "DeleteFileOptions": ".delete_file_options",
+    "DeployKey": ".deploy_key",
+    "EditAttachmentOptions": ".edit_attachment_options",
+    "EditBranchProtectionOption": ".edit_branch_protection_option",
+    "EditDeadlineOption": ".edit_deadline_option",
+    "EditGitHookOption": ".edit_git_hook_option",
+    "EditHookOption": ".edit_hook_option",
+    "EditIssueCommentOption": ".edit_issue_comment_option",
+    "EditIssueOption": ".edit_issue_option",
+    "EditLabelOption": ".edit_label_option",
+    "EditMilestoneOption": ".edit_milestone_option",
+    "EditOrgOption": ".edit_org_option",
+    "EditPullRequestOption": ".edit_pull_request_option",
+    "EditReactionOption": ".edit_reaction_option",
+    "EditReleaseOption": ".edit_release_option",
+    "EditRepoOption": ".edit_repo_option",
+    "EditTeamOption": ".edit_team_option",
+    "EditUserOption": ".edit_user_option",
+    "Email": ".email",
+    "ExternalTracker": ".external_tracker",
+    "ExternalWiki": ".external_wiki",
+    "FileCommitResponse": ".file_commit_response",
+    "FileDeleteResponse": ".file_delete_response",
+    "FileLinksResponse": ".file_links_response",
+    "FileResponse": ".file_response",
+    "GPGKey": ".gpg_key",
+    "GPGKeyEmail": ".gpg_key_email",
+    "GitBlobResponse": ".git_blob_response",
+    "GitEntry": ".git_entry",
+    "GitHook": ".git_hook",
+    "GitObject": ".git_object",
+    "GitTreeResponse": ".git_tree_response",
+    "Hook": ".hook",
+    "Identity": ".identity",
+    "InlineResponse200": ".inline_response200",
+    "InlineResponse2001": ".inline_response2001",
+    "InternalTracker": ".internal_tracker",
+    "Issue": ".issue",
+    "IssueDeadline": ".issue_deadline",
+    "IssueLabelsOption": ".issue_labels_option",
+    "Label": ".label",
+    "MarkdownOption": ".markdown_option",
+    "MergePullRequestOption": ".merge_pull_request_option",
+    "MigrateRepoForm": ".migrate_repo_form",
+    "Milestone": ".milestone",
+    "NotificationCount": ".notification_count",
+    "NotificationSubject": ".notification_subject",
+    "NotificationThread": ".notification_thread",
+    "OAuth2Application": ".o_auth2_application",
+    "Organization": ".organization",
+    "PRBranchInfo": ".pr_branch_info",
+    "PayloadCommit": ".payload_commit",
+    "PayloadCommitVerification": ".payload_commit_verification",
+    "PayloadUser": ".payload_user",
+    "Permission": ".permission",
+    "PublicKey": ".public_key",
+    "PullRequest": ".pull_request",
+    "PullRequestMeta": ".pull_request_meta",
+    "PullReview": ".pull_review",
+    "PullReviewComment": ".pull_review_comment",
+    "Reaction": ".reaction",
+    "Reference": ".reference",
+    "Release": ".release",
+    "RepoCommit": ".repo_commit",
+    "RepoTopicOptions": ".repo_topic_options",
+    "Repository": ".repository",
+    "RepositoryMeta": ".repository_meta",
+    "ReviewStateType": ".review_state_type",
+    "SearchResults": ".search_results",
+    "ServerVersion": ".server_version",
+    "StateType": ".state_type",
+    "Status": ".status",
+    "StatusState": ".status_state",
+    "StopWatch": ".stop_watch",
+    "SubmitPullReviewOptions": ".submit_pull_review_options",
+    "Tag": ".tag",
+    "Team": ".team",
+    "TimeStamp": ".time_stamp",
+    "TopicName": ".topic_name",
+    "TopicResponse": ".topic_response",
+    "TrackedTime": ".tracked_time",
+    "TransferRepoOption": ".transfer_repo_option",
+    "UpdateFileOptions": ".update_file_options",
+    "User": ".user",
+    "UserHeatmapData": ".user_heatmap_data",
+    "WatchInfo": ".watch_info",
+}
+
+__all__ = list(_MODULES)
+
+if TYPE_CHECKING:
+    from .api_error import APIError
+    from .access_token import AccessToken
+    from .add_collaborator_option import AddCollaboratorOption
+    from .add_time_option import AddTimeOption
+    from .annotated_tag import AnnotatedTag
+    from .annotated_tag_object import AnnotatedTagObject
+    from .attachment import Attachment
+    from .branch import Branch
+    from .branch_protection import BranchProtection
+    from .comment import Comment
+    from .commit import Commit
+    from .commit_date_options import CommitDateOptions
+    from .commit_meta import CommitMeta
+    from .commit_user import CommitUser
+    from .contents_response import ContentsResponse
+    from .create_branch_protection_option import CreateBranchProtectionOption
+    from .create_email_option import CreateEmailOption
+    from .create_file_options import CreateFileOptions
+    from .create_fork_option import CreateForkOption
+    from .create_gpg_key_option import CreateGPGKeyOption
+    from .create_hook_option import CreateHookOption
+    from .create_hook_option_config import CreateHookOptionConfig
+    from .create_issue_comment_option import CreateIssueCommentOption
+    from .create_issue_option import CreateIssueOption
+    from .create_key_option import CreateKeyOption
+    from .create_label_option import CreateLabelOption
+    from .create_milestone_option import CreateMilestoneOption
+    from .create_o_auth2_application_options import CreateOAuth2ApplicationOptions
+    from .create_org_option import CreateOrgOption
+    from .create_pull_request_option import CreatePullRequestOption
+    from .create_pull_review_comment import CreatePullReviewComment
+    from .create_pull_review_options import CreatePullReviewOptions
+    from .create_release_option import CreateReleaseOption
+    from .create_repo_option import CreateRepoOption
+    from .create_status_option import CreateStatusOption
+    from .create_team_option import CreateTeamOption
+    from .create_user_option import CreateUserOption
+    from .delete_email_option import DeleteEmailOption
+    from .delete_file_options import DeleteFileOptions
+    from .deploy_key import DeployKey
+    from .edit_attachment_options import EditAttachmentOptions
+    from .edit_branch_protection_option import EditBranchProtectionOption
+    from .edit_deadline_option import EditDeadlineOption
+    from .edit_git_hook_option import EditGitHookOption
+    from .edit_hook_option import EditHookOption
+    from .edit_issue_comment_option import EditIssueCommentOption
+    from .edit_issue_option import EditIssueOption
+    from .edit_label_option import EditLabelOption
+    from .edit_milestone_option import EditMilestoneOption
+    from .edit_org_option import EditOrgOption
+    from .edit_pull_request_option import EditPullRequestOption
+    from .edit_reaction_option import EditReactionOption
+    from .edit_release_option import EditReleaseOption
+    from .edit_repo_option import EditRepoOption
+    from .edit_team_option import EditTeamOption
+    from .edit_user_option import EditUserOption
+    from .email import Email
+    from .external_tracker import ExternalTracker
+    from .external_wiki import ExternalWiki
+    from .file_commit_response import FileCommitResponse
+    from .file_delete_response import FileDeleteResponse
+    from .file_links_response import FileLinksResponse
+    from .file_response import FileResponse
+    from .gpg_key import GPGKey
+    from .gpg_key_email import GPGKeyEmail
+    from .git_blob_response import GitBlobResponse
+    from .git_entry import GitEntry
+    from .git_hook import GitHook
+    from .git_object import GitObject
+    from .git_tree_response import GitTreeResponse
+    from .hook import Hook
+    from .identity import Identity
+    from .inline_response200 import InlineResponse200
+    from .inline_response2001 import InlineResponse2001
+    from .internal_tracker import InternalTracker
+    from .issue import Issue
+    from .issue_deadline import IssueDeadline
+    from .issue_labels_option import IssueLabelsOption
+    from .label import Label
+    from .markdown_option import MarkdownOption
+    from .merge_pull_request_option import MergePullRequestOption
+    from .migrate_repo_form import MigrateRepoForm
+    from .milestone import Milestone
+    from .notification_count import NotificationCount
+    from .notification_subject import NotificationSubject
+    from .notification_thread import NotificationThread
+    from .o_auth2_application import OAuth2Application
+    from .organization import Organization
+    from .pr_branch_info import PRBranchInfo
+    from .payload_commit import PayloadCommit
+    from .payload_commit_verification import PayloadCommitVerification
+    from .payload_user import PayloadUser
+    from .permission import Permission
+    from .public_key import PublicKey
+    from .pull_request import PullRequest
+    from .pull_request_meta import PullRequestMeta
+    from .pull_review import PullReview
+    from .pull_review_comment import PullReviewComment
+    from .reaction import Reaction
+    from .reference import Reference
+    from .release import Release
+    from .repo_commit import RepoCommit
+    from .repo_topic_options import RepoTopicOptions
+    from .repository import Repository
+    from .repository_meta import RepositoryMeta
+    from .review_state_type import ReviewStateType
+    from .search_results import SearchResults
+    from .server_version import ServerVersion
+    from .state_type import StateType
+    from .status import Status
+    from .status_state import StatusState
+    from .stop_watch import StopWatch
+    from .submit_pull_review_options import SubmitPullReviewOptions
+    from .tag import Tag
+    from .team import Team
+    from .time_stamp import TimeStamp
+    from .topic_name import TopicName
+    from .topic_response import TopicResponse
+    from .tracked_time import TrackedTime
+    from .transfer_repo_option import TransferRepoOption
+    from .update_file_options import UpdateFileOptions
+    from .user import User
+    from .user_heatmap_data import UserHeatmapData
+    from .watch_info import WatchInfo
+
+
+def __getattr__(name):
+    # PEP 562: import the module defining name on first access.
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
@@ -38,6 +38,8 @@ class AccessToken(object):
         'name': 'name'
     }
 
+    __slots__ = ('_name', 'discriminator')
+
     def __init__(self, name=None):  # noqa: E501
         """AccessToken - a model defined in Swagger"""  # noqa: E501
 
@@ -109,7 +111,7 @@ class AccessToken(object):
         if not isinstance(other, AccessToken):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -38,6 +38,8 @@ class AddCollaboratorOption(object):
         'permission': 'permission'
     }
 
+    __slots__ = ('_permission', 'discriminator')
+
     def __init__(self, permission=None):  # noqa: E501
         """AddCollaboratorOption - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +110,7 @@ class AddCollaboratorOption(object):
         if not isinstance(other, AddCollaboratorOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
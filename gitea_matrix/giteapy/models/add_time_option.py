@@ -42,6 +42,8 @@ class AddTimeOption(object):
         'user_name': 'user_name'
     }
 
+    __slots__ = ('_created', '_time', '_user_name', 'discriminator')
+
     def __init__(self, created=None, time=None, user_name=None):  # noqa: E501
         """AddTimeOption - a model defined in Swagger"""  # noqa: E501
 
@@ -165,7 +167,7 @@ class AddTimeOption(object):
         if not isinstance(other, AddTimeOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
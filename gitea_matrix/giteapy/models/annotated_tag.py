@@ -50,6 +50,11 @@ class AnnotatedTag(object):
         'verification': 'verification'
     }
 
+    __slots__ = (
+        '_message', '_object', '_sha', '_tag', '_tagger', '_url',
+        '_verification', 'discriminator'
+    )
+
     def __init__(self, message=None, object=None, sha=None, tag=None, tagger=None, url=None, verification=None):  # noqa: E501
         """AnnotatedTag - a model defined in Swagger"""  # noqa: E501
 
@@ -264,7 +269,7 @@ class AnnotatedTag(object):
         if not isinstance(other, AnnotatedTag):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -42,6 +42,8 @@ class AnnotatedTagObject(object):
         'url': 'url'
     }
 
+    __slots__ = ('_sha', '_type', '_url', 'discriminator')
+
     def __init__(self, sha=None, type=None, url=None):  # noqa: E501
         """AnnotatedTagObject - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class AnnotatedTagObject(object):
         if not isinstance(other, AnnotatedTagObject):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -40,6 +40,8 @@ class APIError(object):
         'url': 'url'
     }
 
+    __slots__ = ('_message', '_url', 'discriminator')
+
     def __init__(self, message=None, url=None):  # noqa: E501
         """APIError - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class APIError(object):
         if not isinstance(other, APIError):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
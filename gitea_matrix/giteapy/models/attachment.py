@@ -50,6 +50,11 @@ class Attachment(object):
         'uuid': 'uuid'
     }
 
+    __slots__ = (
+        '_browser_download_url', '_created_at', '_download_count',
+        '_id', '_name', '_size', '_uuid', 'discriminator'
+    )
+
     def __init__(self, browser_download_url=None, created_at=None, download_count=None, id=None, name=None, size=None, uuid=None):  # noqa: E501
         """Attachment - a model defined in Swagger"""  # noqa: E501
 
@@ -264,7 +269,7 @@ class Attachment(object):
         if not isinstance(other, Attachment):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
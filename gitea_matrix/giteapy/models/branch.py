@@ -54,6 +54,13 @@ class Branch(object):
         'user_can_push': 'user_can_push'
     }
 
+    __slots__ = (
+        '_commit', '_effective_branch_protection_name',
+        '_enable_status_check', '_name', '_protected',
+        '_required_approvals', '_status_check_contexts',
+        '_user_can_merge', '_user_can_push', 'discriminator'
+    )
+
     def __init__(self, commit=None, effective_branch_protection_name=None, enable_status_check=None, name=None, protected=None, required_approvals=None, status_check_contexts=None, user_can_merge=None, user_can_push=None):  # noqa: E501
         """Branch - a model defined in Swagger"""  # noqa: E501
 
@@ -316,7 +323,7 @@ class Branch(object):
         if not isinstance(other, Branch):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
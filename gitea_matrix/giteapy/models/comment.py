@@ -56,6 +56,12 @@ class Comment(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_body', '_created_at', '_html_url', '_id', '_issue_url',
+        '_original_author', '_original_author_id', '_pull_request_url',
+        '_updated_at', '_user', 'discriminator'
+    )
+
     def __init__(self, body=None, created_at=None, html_url=None, id=None, issue_url=None, original_author=None, original_author_id=None, pull_request_url=None, updated_at=None, user=None):  # noqa: E501
         """Comment - a model defined in Swagger"""  # noqa: E501
 
@@ -342,7 +348,7 @@ class Comment(object):
         if not isinstance(other, Comment):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -50,6 +50,11 @@ class Commit(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_author', '_commit', '_committer', '_html_url', '_parents',
+        '_sha', '_url', 'discriminator'
+    )
+
     def __init__(self, author=None, commit=None, committer=None, html_url=None, parents=None, sha=None, url=None):  # noqa: E501
         """Commit - a model defined in Swagger"""  # noqa: E501
 
@@ -264,7 +269,7 @@ class Commit(object):
         if not isinstance(other, Commit):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
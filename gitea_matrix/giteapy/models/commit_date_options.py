@@ -40,6 +40,8 @@ class CommitDateOptions(object):
         'committer': 'committer'
     }
 
+    __slots__ = ('_author', '_committer', 'discriminator')
+
     def __init__(self, author=None, committer=None):  # noqa: E501
         """CommitDateOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class CommitDateOptions(object):
         if not isinstance(other, CommitDateOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
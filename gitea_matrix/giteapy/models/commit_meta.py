@@ -40,6 +40,8 @@ class CommitMeta(object):
         'url': 'url'
     }
 
+    __slots__ = ('_sha', '_url', 'discriminator')
+
     def __init__(self, sha=None, url=None):  # noqa: E501
         """CommitMeta - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class CommitMeta(object):
         if not isinstance(other, CommitMeta):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -42,6 +42,8 @@ class CommitUser(object):
         'name': 'name'
     }
 
+    __slots__ = ('__date', '_email', '_name', 'discriminator')
+
     def __init__(self, _date=None, email=None, name=None):  # noqa: E501
         """CommitUser - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class CommitUser(object):
         if not isinstance(other, CommitUser):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -64,6 +64,13 @@ class ContentsResponse(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_links', '_content', '_download_url', '_encoding', '_git_url',
+        '_html_url', '_name', '_path', '_sha', '_size',
+        '_submodule_git_url', '_target', '_type', '_url',
+        'discriminator'
+    )
+
     def __init__(self, links=None, content=None, download_url=None, encoding=None, git_url=None, html_url=None, name=None, path=None, sha=None, size=None, submodule_git_url=None, target=None, type=None, url=None):  # noqa: E501
         """ContentsResponse - a model defined in Swagger"""  # noqa: E501
 
@@ -456,7 +463,7 @@ class ContentsResponse(object):
         if not isinstance(other, ContentsResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
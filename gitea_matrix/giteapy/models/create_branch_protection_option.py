@@ -76,6 +76,19 @@ class CreateBranchProtectionOption(object):
         'status_check_contexts': 'status_check_contexts'
     }
 
+    __slots__ = (
+        '_approvals_whitelist_teams', '_approvals_whitelist_username',
+        '_block_on_outdated_branch', '_block_on_rejected_reviews',
+        '_branch_name', '_dismiss_stale_approvals',
+        '_enable_approvals_whitelist', '_enable_merge_whitelist',
+        '_enable_push', '_enable_push_whitelist',
+        '_enable_status_check', '_merge_whitelist_teams',
+        '_merge_whitelist_usernames', '_protected_file_patterns',
+        '_push_whitelist_deploy_keys', '_push_whitelist_teams',
+        '_push_whitelist_usernames', '_require_signed_commits',
+        '_required_approvals', '_status_check_contexts', 'discriminator'
+    )
+
     def __init__(self, approvals_whitelist_teams=None, approvals_whitelist_username=None, block_on_outdated_branch=None, block_on_rejected_reviews=None, branch_name=None, dismiss_stale_approvals=None, enable_approvals_whitelist=None, enable_merge_whitelist=None, enable_push=None, enable_push_whitelist=None, enable_status_check=None, merge_whitelist_teams=None, merge_whitelist_usernames=None, protected_file_patterns=None, push_whitelist_deploy_keys=None, push_whitelist_teams=None, push_whitelist_usernames=None, require_signed_commits=None, required_approvals=None, status_check_contexts=None):  # noqa: E501
         """CreateBranchProtectionOption - a model defined in Swagger"""  # noqa: E501
 
@@ -602,7 +615,7 @@ class CreateBranchProtectionOption(object):
         if not isinstance(other, CreateBranchProtectionOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
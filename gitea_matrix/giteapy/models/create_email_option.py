@@ -38,6 +38,8 @@ class CreateEmailOption(object):
         'emails': 'emails'
     }
 
+    __slots__ = ('_emails', 'discriminator')
+
     def __init__(self, emails=None):  # noqa: E501
         """CreateEmailOption - a model defined in Swagger"""  # noqa: E501
 
@@ -110,7 +112,7 @@ class CreateEmailOption(object):
         if not isinstance(other, CreateEmailOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
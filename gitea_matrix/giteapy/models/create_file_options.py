@@ -50,6 +50,11 @@ class CreateFileOptions(object):
         'new_branch': 'new_branch'
     }
 
+    __slots__ = (
+        '_author', '_branch', '_committer', '_content', '_dates',
+        '_message', '_new_branch', 'discriminator'
+    )
+
     def __init__(self, author=None, branch=None, committer=None, content=None, dates=None, message=None, new_branch=None):  # noqa: E501
         """CreateFileOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -273,7 +278,7 @@ class CreateFileOptions(object):
         if not isinstance(other, CreateFileOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -38,6 +38,8 @@ class CreateForkOption(object):
         'organization': 'organization'
     }
 
+    __slots__ = ('_organization', 'discriminator')
+
     def __init__(self, organization=None):  # noqa: E501
         """CreateForkOption - a model defined in Swagger"""  # noqa: E501
 
@@ -110,7 +112,7 @@ class CreateForkOption(object):
         if not isinstance(other, CreateForkOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
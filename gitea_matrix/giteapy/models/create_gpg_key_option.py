@@ -38,6 +38,8 @@ class CreateGPGKeyOption(object):
         'armored_public_key': 'armored_public_key'
     }
 
+    __slots__ = ('_armored_public_key', 'discriminator')
+
     def __init__(self, armored_public_key=None):  # noqa: E501
         """CreateGPGKeyOption - a model defined in Swagger"""  # noqa: E501
 
@@ -111,7 +113,7 @@ class CreateGPGKeyOption(object):
         if not isinstance(other, CreateGPGKeyOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,11 @@ class CreateHookOption(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_active', '_branch_filter', '_config', '_events', '_type',
+        'discriminator'
+    )
+
     def __init__(self, active=False, branch_filter=None, config=None, events=None, type=None):  # noqa: E501
         """CreateHookOption - a model defined in Swagger"""  # noqa: E501
 
@@ -220,7 +225,7 @@ class CreateHookOption(object):
         if not isinstance(other, CreateHookOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -38,6 +38,8 @@ class CreateIssueCommentOption(object):
         'body': 'body'
     }
 
+    __slots__ = ('_body', 'discriminator')
+
     def __init__(self, body=None):  # noqa: E501
         """CreateIssueCommentOption - a model defined in Swagger"""  # noqa: E501
 
@@ -109,7 +111,7 @@ class CreateIssueCommentOption(object):
         if not isinstance(other, CreateIssueCommentOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,6 +52,11 @@ class CreateIssueOption(object):
         'title': 'title'
     }
 
+    __slots__ = (
+        '_assignee', '_assignees', '_body', '_closed', '_due_date',
+        '_labels', '_milestone', '_title', 'discriminator'
+    )
+
     def __init__(self, assignee=None, assignees=None, body=None, closed=None, due_date=None, labels=None, milestone=None, title=None):  # noqa: E501
         """CreateIssueOption - a model defined in Swagger"""  # noqa: E501
 
@@ -297,7 +302,7 @@ class CreateIssueOption(object):
         if not isinstance(other, CreateIssueOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -42,6 +42,8 @@ class CreateKeyOption(object):
         'title': 'title'
     }
 
+    __slots__ = ('_key', '_read_only', '_title', 'discriminator')
+
     def __init__(self, key=None, read_only=None, title=None):  # noqa: E501
         """CreateKeyOption - a model defined in Swagger"""  # noqa: E501
 
@@ -168,7 +170,7 @@ class CreateKeyOption(object):
         if not isinstance(other, CreateKeyOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
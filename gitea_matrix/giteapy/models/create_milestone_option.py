@@ -42,6 +42,8 @@ class CreateMilestoneOption(object):
         'title': 'title'
     }
 
+    __slots__ = ('_description', '_due_on', '_title', 'discriminator')
+
     def __init__(self, description=None, due_on=None, title=None):  # noqa: E501
         """CreateMilestoneOption - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class CreateMilestoneOption(object):
         if not isinstance(other, CreateMilestoneOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
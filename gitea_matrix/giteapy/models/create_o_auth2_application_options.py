@@ -40,6 +40,8 @@ class CreateOAuth2ApplicationOptions(object):
         'redirect_uris': 'redirect_uris'
     }
 
+    __slots__ = ('_name', '_redirect_uris', 'discriminator')
+
     def __init__(self, name=None, redirect_uris=None):  # noqa: E501
         """CreateOAuth2ApplicationOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class CreateOAuth2ApplicationOptions(object):
         if not isinstance(other, CreateOAuth2ApplicationOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -50,6 +50,12 @@ class CreateOrgOption(object):
         'website': 'website'
     }
 
+    __slots__ = (
+        '_description', '_full_name', '_location',
+        '_repo_admin_change_team_access', '_username', '_visibility',
+        '_website', 'discriminator'
+    )
+
     def __init__(self, description=None, full_name=None, location=None, repo_admin_change_team_access=None, username=None, visibility=None, website=None):  # noqa: E501
         """CreateOrgOption - a model defined in Swagger"""  # noqa: E501
 
@@ -273,7 +279,7 @@ class CreateOrgOption(object):
         if not isinstance(other, CreateOrgOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,6 +54,11 @@ class CreatePullRequestOption(object):
         'title': 'title'
     }
 
+    __slots__ = (
+        '_assignee', '_assignees', '_base', '_body', '_due_date',
+        '_head', '_labels', '_milestone', '_title', 'discriminator'
+    )
+
     def __init__(self, assignee=None, assignees=None, base=None, body=None, due_date=None, head=None, labels=None, milestone=None, title=None):  # noqa: E501
         """CreatePullRequestOption - a model defined in Swagger"""  # noqa: E501
 
@@ -316,7 +321,7 @@ class CreatePullRequestOption(object):
         if not isinstance(other, CreatePullRequestOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
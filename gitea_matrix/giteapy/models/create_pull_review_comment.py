@@ -44,6 +44,11 @@ class CreatePullReviewComment(object):
         'path': 'path'
     }
 
+    __slots__ = (
+        '_body', '_new_position', '_old_position', '_path',
+        'discriminator'
+    )
+
     def __init__(self, body=None, new_position=None, old_position=None, path=None):  # noqa: E501
         """CreatePullReviewComment - a model defined in Swagger"""  # noqa: E501
 
@@ -192,7 +197,7 @@ class CreatePullReviewComment(object):
         if not isinstance(other, CreatePullReviewComment):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
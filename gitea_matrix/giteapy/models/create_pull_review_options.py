@@ -44,6 +44,10 @@ class CreatePullReviewOptions(object):
         'event': 'event'
     }
 
+    __slots__ = (
+        '_body', '_comments', '_commit_id', '_event', 'discriminator'
+    )
+
     def __init__(self, body=None, comments=None, commit_id=None, event=None):  # noqa: E501
         """CreatePullReviewOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -186,7 +190,7 @@ class CreatePullReviewOptions(object):
         if not isinstance(other, CreatePullReviewOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -48,6 +48,11 @@ class CreateReleaseOption(object):
         'target_commitish': 'target_commitish'
     }
 
+    __slots__ = (
+        '_body', '_draft', '_name', '_prerelease', '_tag_name',
+        '_target_commitish', 'discriminator'
+    )
+
     def __init__(self, body=None, draft=None, name=None, prerelease=None, tag_name=None, target_commitish=None):  # noqa: E501
         """CreateReleaseOption - a model defined in Swagger"""  # noqa: E501
 
@@ -239,7 +244,7 @@ class CreateReleaseOption(object):
         if not isinstance(other, CreateReleaseOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,6 +54,12 @@ class CreateRepoOption(object):
         'readme': 'readme'
     }
 
+    __slots__ = (
+        '_auto_init', '_default_branch', '_description', '_gitignores',
+        '_issue_labels', '_license', '_name', '_private', '_readme',
+        'discriminator'
+    )
+
     def __init__(self, auto_init=None, default_branch=None, description=None, gitignores=None, issue_labels=None, license=None, name=None, private=None, readme=None):  # noqa: E501
         """CreateRepoOption - a model defined in Swagger"""  # noqa: E501
 
@@ -335,7 +341,7 @@ class CreateRepoOption(object):
         if not isinstance(other, CreateRepoOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -44,6 +44,11 @@ class CreateStatusOption(object):
         'target_url': 'target_url'
     }
 
+    __slots__ = (
+        '_context', '_description', '_state', '_target_url',
+        'discriminator'
+    )
+
     def __init__(self, context=None, description=None, state=None, target_url=None):  # noqa: E501
         """CreateStatusOption - a model defined in Swagger"""  # noqa: E501
 
@@ -186,7 +191,7 @@ class CreateStatusOption(object):
         if not isinstance(other, CreateStatusOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -48,6 +48,12 @@ class CreateTeamOption(object):
         'units': 'units'
     }
 
+    __slots__ = (
+        '_can_create_org_repo', '_description',
+        '_includes_all_repositories', '_name', '_permission', '_units',
+        'discriminator'
+    )
+
     def __init__(self, can_create_org_repo=None, description=None, includes_all_repositories=None, name=None, permission=None, units=None):  # noqa: E501
         """CreateTeamOption - a model defined in Swagger"""  # noqa: E501
 
@@ -245,7 +251,7 @@ class CreateTeamOption(object):
         if not isinstance(other, CreateTeamOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,6 +52,12 @@ class CreateUserOption(object):
         'username': 'username'
     }
 
+    __slots__ = (
+        '_email', '_full_name', '_login_name', '_must_change_password',
+        '_password', '_send_notify', '_source_id', '_username',
+        'discriminator'
+    )
+
     def __init__(self, email=None, full_name=None, login_name=None, must_change_password=None, password=None, send_notify=None, source_id=None, username=None):  # noqa: E501
         """CreateUserOption - a model defined in Swagger"""  # noqa: E501
 
@@ -293,7 +299,7 @@ class CreateUserOption(object):
         if not isinstance(other, CreateUserOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
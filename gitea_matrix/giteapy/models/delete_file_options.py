@@ -50,6 +50,11 @@ class DeleteFileOptions(object):
         'sha': 'sha'
     }
 
+    __slots__ = (
+        '_author', '_branch', '_committer', '_dates', '_message',
+        '_new_branch', '_sha', 'discriminator'
+    )
+
     def __init__(self, author=None, branch=None, committer=None, dates=None, message=None, new_branch=None, sha=None):  # noqa: E501
         """DeleteFileOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -273,7 +278,7 @@ class DeleteFileOptions(object):
         if not isinstance(other, DeleteFileOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,6 +54,11 @@ class DeployKey(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_created_at', '_fingerprint', '_id', '_key', '_key_id',
+        '_read_only', '_repository', '_title', '_url', 'discriminator'
+    )
+
     def __init__(self, created_at=None, fingerprint=None, id=None, key=None, key_id=None, read_only=None, repository=None, title=None, url=None):  # noqa: E501
         """DeployKey - a model defined in Swagger"""  # noqa: E501
 
@@ -316,7 +321,7 @@ class DeployKey(object):
         if not isinstance(other, DeployKey):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -38,6 +38,8 @@ class EditAttachmentOptions(object):
         'name': 'name'
     }
 
+    __slots__ = ('_name', 'discriminator')
+
     def __init__(self, name=None):  # noqa: E501
         """EditAttachmentOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +110,7 @@ class EditAttachmentOptions(object):
         if not isinstance(other, EditAttachmentOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
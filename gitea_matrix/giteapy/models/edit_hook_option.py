@@ -44,6 +44,11 @@ class EditHookOption(object):
         'events': 'events'
     }
 
+    __slots__ = (
+        '_active', '_branch_filter', '_config', '_events',
+        'discriminator'
+    )
+
     def __init__(self, active=None, branch_filter=None, config=None, events=None):  # noqa: E501
         """EditHookOption - a model defined in Swagger"""  # noqa: E501
 
@@ -186,7 +191,7 @@ class EditHookOption(object):
         if not isinstance(other, EditHookOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,6 +52,11 @@ class EditIssueOption(object):
         'unset_due_date': 'unset_due_date'
     }
 
+    __slots__ = (
+        '_assignee', '_assignees', '_body', '_due_date', '_milestone',
+        '_state', '_title', '_unset_due_date', 'discriminator'
+    )
+
     def __init__(self, assignee=None, assignees=None, body=None, due_date=None, milestone=None, state=None, title=None, unset_due_date=None):  # noqa: E501
         """EditIssueOption - a model defined in Swagger"""  # noqa: E501
 
@@ -290,7 +295,7 @@ class EditIssueOption(object):
         if not isinstance(other, EditIssueOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
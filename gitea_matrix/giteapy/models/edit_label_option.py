@@ -42,6 +42,8 @@ class EditLabelOption(object):
         'name': 'name'
     }
 
+    __slots__ = ('_color', '_description', '_name', 'discriminator')
+
     def __init__(self, color=None, description=None, name=None):  # noqa: E501
         """EditLabelOption - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class EditLabelOption(object):
         if not isinstance(other, EditLabelOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
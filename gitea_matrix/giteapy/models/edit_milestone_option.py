@@ -44,6 +44,10 @@ class EditMilestoneOption(object):
         'title': 'title'
     }
 
+    __slots__ = (
+        '_description', '_due_on', '_state', '_title', 'discriminator'
+    )
+
     def __init__(self, description=None, due_on=None, state=None, title=None):  # noqa: E501
         """EditMilestoneOption - a model defined in Swagger"""  # noqa: E501
 
@@ -186,7 +190,7 @@ class EditMilestoneOption(object):
         if not isinstance(other, EditMilestoneOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
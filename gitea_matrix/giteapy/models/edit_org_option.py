@@ -48,6 +48,12 @@ class EditOrgOption(object):
         'website': 'website'
     }
 
+    __slots__ = (
+        '_description', '_full_name', '_location',
+        '_repo_admin_change_team_access', '_visibility', '_website',
+        'discriminator'
+    )
+
     def __init__(self, description=None, full_name=None, location=None, repo_admin_change_team_access=None, visibility=None, website=None):  # noqa: E501
         """EditOrgOption - a model defined in Swagger"""  # noqa: E501
 
@@ -246,7 +252,7 @@ class EditOrgOption(object):
         if not isinstance(other, EditOrgOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,6 +54,12 @@ class EditPullRequestOption(object):
         'unset_due_date': 'unset_due_date'
     }
 
+    __slots__ = (
+        '_assignee', '_assignees', '_body', '_due_date', '_labels',
+        '_milestone', '_state', '_title', '_unset_due_date',
+        'discriminator'
+    )
+
     def __init__(self, assignee=None, assignees=None, body=None, due_date=None, labels=None, milestone=None, state=None, title=None, unset_due_date=None):  # noqa: E501
         """EditPullRequestOption - a model defined in Swagger"""  # noqa: E501
 
@@ -316,7 +322,7 @@ class EditPullRequestOption(object):
         if not isinstance(other, EditPullRequestOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -38,6 +38,8 @@ class EditReactionOption(object):
         'content': 'content'
     }
 
+    __slots__ = ('_content', 'discriminator')
+
     def __init__(self, content=None):  # noqa: E501
         """EditReactionOption - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +110,7 @@ class EditReactionOption(object):
         if not isinstance(other, EditReactionOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -48,6 +48,11 @@ class EditReleaseOption(object):
         'target_commitish': 'target_commitish'
     }
 
+    __slots__ = (
+        '_body', '_draft', '_name', '_prerelease', '_tag_name',
+        '_target_commitish', 'discriminator'
+    )
+
     def __init__(self, body=None, draft=None, name=None, prerelease=None, tag_name=None, target_commitish=None):  # noqa: E501
         """EditReleaseOption - a model defined in Swagger"""  # noqa: E501
 
@@ -238,7 +243,7 @@ class EditReleaseOption(object):
         if not isinstance(other, EditReleaseOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
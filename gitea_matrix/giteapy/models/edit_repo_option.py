@@ -72,6 +72,16 @@ class EditRepoOption(object):
         'website': 'website'
     }
 
+    __slots__ = (
+        '_allow_merge_commits', '_allow_rebase',
+        '_allow_rebase_explicit', '_allow_squash_merge', '_archived',
+        '_default_branch', '_description', '_external_tracker',
+        '_external_wiki', '_has_issues', '_has_pull_requests',
+        '_has_wiki', '_ignore_whitespace_conflicts',
+        '_internal_tracker', '_name', '_private', '_template',
+        '_website', 'discriminator'
+    )
+
     def __init__(self, allow_merge_commits=None, allow_rebase=None, allow_rebase_explicit=None, allow_squash_merge=None, archived=None, default_branch=None, description=None, external_tracker=None, external_wiki=None, has_issues=None, has_pull_requests=None, has_wiki=None, ignore_whitespace_conflicts=None, internal_tracker=None, name=None, private=None, template=None, website=None):  # noqa: E501
         """EditRepoOption - a model defined in Swagger"""  # noqa: E501
 
@@ -580,7 +590,7 @@ class EditRepoOption(object):
         if not isinstance(other, EditRepoOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
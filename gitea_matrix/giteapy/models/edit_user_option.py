@@ -66,6 +66,14 @@ class EditUserOption(object):
         'website': 'website'
     }
 
+    __slots__ = (
+        '_active', '_admin', '_allow_create_organization',
+        '_allow_git_hook', '_allow_import_local', '_email',
+        '_full_name', '_location', '_login_name', '_max_repo_creation',
+        '_must_change_password', '_password', '_prohibit_login',
+        '_source_id', '_website', 'discriminator'
+    )
+
     def __init__(self, active=None, admin=None, allow_create_organization=None, allow_git_hook=None, allow_import_local=None, email=None, full_name=None, location=None, login_name=None, max_repo_creation=None, must_change_password=None, password=None, prohibit_login=None, source_id=None, website=None):  # noqa: E501
         """EditUserOption - a model defined in Swagger"""  # noqa: E501
 
@@ -473,7 +481,7 @@ class EditUserOption(object):
         if not isinstance(other, EditUserOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
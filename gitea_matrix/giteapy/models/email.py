@@ -42,6 +42,8 @@ class Email(object):
         'verified': 'verified'
     }
 
+    __slots__ = ('_email', '_primary', '_verified', 'discriminator')
+
     def __init__(self, email=None, primary=None, verified=None):  # noqa: E501
         """Email - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class Email(object):
         if not isinstance(other, Email):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
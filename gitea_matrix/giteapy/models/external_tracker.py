@@ -42,6 +42,11 @@ class ExternalTracker(object):
         'external_tracker_url': 'external_tracker_url'
     }
 
+    __slots__ = (
+        '_external_tracker_format', '_external_tracker_style',
+        '_external_tracker_url', 'discriminator'
+    )
+
     def __init__(self, external_tracker_format=None, external_tracker_style=None, external_tracker_url=None):  # noqa: E501
         """ExternalTracker - a model defined in Swagger"""  # noqa: E501
 
@@ -166,7 +171,7 @@ class ExternalTracker(object):
         if not isinstance(other, ExternalTracker):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
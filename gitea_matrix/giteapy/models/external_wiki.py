@@ -38,6 +38,8 @@ class ExternalWiki(object):
         'external_wiki_url': 'external_wiki_url'
     }
 
+    __slots__ = ('_external_wiki_url', 'discriminator')
+
     def __init__(self, external_wiki_url=None):  # noqa: E501
         """ExternalWiki - a model defined in Swagger"""  # noqa: E501
 
@@ -110,7 +112,7 @@ class ExternalWiki(object):
         if not isinstance(other, ExternalWiki):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,6 +52,11 @@ class FileCommitResponse(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_author', '_committer', '_html_url', '_message', '_parents',
+        '_sha', '_tree', '_url', 'discriminator'
+    )
+
     def __init__(self, author=None, committer=None, html_url=None, message=None, parents=None, sha=None, tree=None, url=None):  # noqa: E501
         """FileCommitResponse - a model defined in Swagger"""  # noqa: E501
 
@@ -290,7 +295,7 @@ class FileCommitResponse(object):
         if not isinstance(other, FileCommitResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
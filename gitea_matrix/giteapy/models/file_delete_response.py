@@ -42,6 +42,8 @@ class FileDeleteResponse(object):
         'verification': 'verification'
     }
 
+    __slots__ = ('_commit', '_content', '_verification', 'discriminator')
+
     def __init__(self, commit=None, content=None, verification=None):  # noqa: E501
         """FileDeleteResponse - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class FileDeleteResponse(object):
         if not isinstance(other, FileDeleteResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -42,6 +42,8 @@ class FileLinksResponse(object):
         '_self': 'self'
     }
 
+    __slots__ = ('_git', '_html', '__self', 'discriminator')
+
     def __init__(self, git=None, html=None, _self=None):  # noqa: E501
         """FileLinksResponse - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class FileLinksResponse(object):
         if not isinstance(other, FileLinksResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
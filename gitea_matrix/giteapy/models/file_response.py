@@ -42,6 +42,8 @@ class FileResponse(object):
         'verification': 'verification'
     }
 
+    __slots__ = ('_commit', '_content', '_verification', 'discriminator')
+
     def __init__(self, commit=None, content=None, verification=None):  # noqa: E501
         """FileResponse - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class FileResponse(object):
         if not isinstance(other, FileResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
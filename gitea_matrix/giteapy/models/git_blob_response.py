@@ -46,6 +46,11 @@ class GitBlobResponse(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_content', '_encoding', '_sha', '_size', '_url',
+        'discriminator'
+    )
+
     def __init__(self, content=None, encoding=None, sha=None, size=None, url=None):  # noqa: E501
         """GitBlobResponse - a model defined in Swagger"""  # noqa: E501
 
@@ -212,7 +217,7 @@ class GitBlobResponse(object):
         if not isinstance(other, GitBlobResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
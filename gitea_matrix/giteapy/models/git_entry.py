@@ -48,6 +48,11 @@ class GitEntry(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_mode', '_path', '_sha', '_size', '_type', '_url',
+        'discriminator'
+    )
+
     def __init__(self, mode=None, path=None, sha=None, size=None, type=None, url=None):  # noqa: E501
         """GitEntry - a model defined in Swagger"""  # noqa: E501
 
@@ -238,7 +243,7 @@ class GitEntry(object):
         if not isinstance(other, GitEntry):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -42,6 +42,8 @@ class GitHook(object):
         'name': 'name'
     }
 
+    __slots__ = ('_content', '_is_active', '_name', 'discriminator')
+
     def __init__(self, content=None, is_active=None, name=None):  # noqa: E501
         """GitHook - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class GitHook(object):
         if not isinstance(other, GitHook):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -48,6 +48,11 @@ class GitTreeResponse(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_page', '_sha', '_total_count', '_tree', '_truncated', '_url',
+        'discriminator'
+    )
+
     def __init__(self, page=None, sha=None, total_count=None, tree=None, truncated=None, url=None):  # noqa: E501
         """GitTreeResponse - a model defined in Swagger"""  # noqa: E501
 
@@ -238,7 +243,7 @@ class GitTreeResponse(object):
         if not isinstance(other, GitTreeResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -60,6 +60,13 @@ class GPGKey(object):
         'subkeys': 'subkeys'
     }
 
+    __slots__ = (
+        '_can_certify', '_can_encrypt_comms', '_can_encrypt_storage',
+        '_can_sign', '_created_at', '_emails', '_expires_at', '_id',
+        '_key_id', '_primary_key_id', '_public_key', '_subkeys',
+        'discriminator'
+    )
+
     def __init__(self, can_certify=None, can_encrypt_comms=None, can_encrypt_storage=None, can_sign=None, created_at=None, emails=None, expires_at=None, id=None, key_id=None, primary_key_id=None, public_key=None, subkeys=None):  # noqa: E501
         """GPGKey - a model defined in Swagger"""  # noqa: E501
 
@@ -394,7 +401,7 @@ class GPGKey(object):
         if not isinstance(other, GPGKey):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -40,6 +40,8 @@ class GPGKeyEmail(object):
         'verified': 'verified'
     }
 
+    __slots__ = ('_email', '_verified', 'discriminator')
+
     def __init__(self, email=None, verified=None):  # noqa: E501
         """GPGKeyEmail - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class GPGKeyEmail(object):
         if not isinstance(other, GPGKeyEmail):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -50,6 +50,11 @@ class Hook(object):
         'updated_at': 'updated_at'
     }
 
+    __slots__ = (
+        '_active', '_config', '_created_at', '_events', '_id', '_type',
+        '_updated_at', 'discriminator'
+    )
+
     def __init__(self, active=None, config=None, created_at=None, events=None, id=None, type=None, updated_at=None):  # noqa: E501
         """Hook - a model defined in Swagger"""  # noqa: E501
 
@@ -264,7 +269,7 @@ class Hook(object):
         if not isinstance(other, Hook):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
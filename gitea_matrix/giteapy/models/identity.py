@@ -40,6 +40,8 @@ class Identity(object):
         'name': 'name'
     }
 
+    __slots__ = ('_email', '_name', 'discriminator')
+
     def __init__(self, email=None, name=None):  # noqa: E501
         """Identity - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class Identity(object):
         if not isinstance(other, Identity):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
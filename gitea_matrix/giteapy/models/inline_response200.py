@@ -40,6 +40,8 @@ class InlineResponse200(object):
         'ok': 'ok'
     }
 
+    __slots__ = ('_data', '_ok', 'discriminator')
+
     def __init__(self, data=None, ok=None):  # noqa: E501
         """InlineResponse200 - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class InlineResponse200(object):
         if not isinstance(other, InlineResponse200):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -42,6 +42,12 @@ class InternalTracker(object):
         'enable_time_tracker': 'enable_time_tracker'
     }
 
+    __slots__ = (
+        '_allow_only_contributors_to_track_time',
+        '_enable_issue_dependencies', '_enable_time_tracker',
+        'discriminator'
+    )
+
     def __init__(self, allow_only_contributors_to_track_time=None, enable_issue_dependencies=None, enable_time_tracker=None):  # noqa: E501
         """InternalTracker - a model defined in Swagger"""  # noqa: E501
 
@@ -166,7 +172,7 @@ class InternalTracker(object):
         if not isinstance(other, InternalTracker):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
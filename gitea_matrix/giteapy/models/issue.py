@@ -78,6 +78,14 @@ class Issue(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_assignee', '_assignees', '_body', '_closed_at', '_comments',
+        '_created_at', '_due_date', '_html_url', '_id', '_labels',
+        '_milestone', '_number', '_original_author',
+        '_original_author_id', '_pull_request', '_repository', '_state',
+        '_title', '_updated_at', '_url', '_user', 'discriminator'
+    )
+
     def __init__(self, assignee=None, assignees=None, body=None, closed_at=None, comments=None, created_at=None, due_date=None, html_url=None, id=None, labels=None, milestone=None, number=None, original_author=None, original_author_id=None, pull_request=None, repository=None, state=None, title=None, updated_at=None, url=None, user=None):  # noqa: E501
         """Issue - a model defined in Swagger"""  # noqa: E501
 
@@ -628,7 +636,7 @@ class Issue(object):
         if not isinstance(other, Issue):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -38,6 +38,8 @@ class IssueDeadline(object):
         'due_date': 'due_date'
     }
 
+    __slots__ = ('_due_date', 'discriminator')
+
     def __init__(self, due_date=None):  # noqa: E501
         """IssueDeadline - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +110,7 @@ class IssueDeadline(object):
         if not isinstance(other, IssueDeadline):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -38,6 +38,8 @@ class IssueLabelsOption(object):
         'labels': 'labels'
     }
 
+    __slots__ = ('_labels', 'discriminator')
+
     def __init__(self, labels=None):  # noqa: E501
         """IssueLabelsOption - a model defined in Swagger"""  # noqa: E501
 
@@ -110,7 +112,7 @@ class IssueLabelsOption(object):
         if not isinstance(other, IssueLabelsOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,11 @@ class Label(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_color', '_description', '_id', '_name', '_url',
+        'discriminator'
+    )
+
     def __init__(self, color=None, description=None, id=None, name=None, url=None):  # noqa: E501
         """Label - a model defined in Swagger"""  # noqa: E501
 
@@ -212,7 +217,7 @@ class Label(object):
         if not isinstance(other, Label):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
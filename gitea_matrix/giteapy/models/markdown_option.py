@@ -44,6 +44,8 @@ class MarkdownOption(object):
         'wiki': 'Wiki'
     }
 
+    __slots__ = ('_context', '_mode', '_text', '_wiki', 'discriminator')
+
     def __init__(self, context=None, mode=None, text=None, wiki=None):  # noqa: E501
         """MarkdownOption - a model defined in Swagger"""  # noqa: E501
 
@@ -194,7 +196,7 @@ class MarkdownOption(object):
         if not isinstance(other, MarkdownOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -44,6 +44,11 @@ class MergePullRequestOption(object):
         'force_merge': 'force_merge'
     }
 
+    __slots__ = (
+        '_do', '_merge_message_field', '_merge_title_field',
+        '_force_merge', 'discriminator'
+    )
+
     def __init__(self, do=None, merge_message_field=None, merge_title_field=None, force_merge=None):  # noqa: E501
         """MergePullRequestOption - a model defined in Swagger"""  # noqa: E501
 
@@ -193,7 +198,7 @@ class MergePullRequestOption(object):
         if not isinstance(other, MergePullRequestOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
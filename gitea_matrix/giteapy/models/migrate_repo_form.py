@@ -64,6 +64,13 @@ class MigrateRepoForm(object):
         'wiki': 'wiki'
     }
 
+    __slots__ = (
+        '_auth_password', '_auth_username', '_clone_addr',
+        '_description', '_issues', '_labels', '_milestones', '_mirror',
+        '_private', '_pull_requests', '_releases', '_repo_name', '_uid',
+        '_wiki', 'discriminator'
+    )
+
     def __init__(self, auth_password=None, auth_username=None, clone_addr=None, description=None, issues=None, labels=None, milestones=None, mirror=None, private=None, pull_requests=None, releases=None, repo_name=None, uid=None, wiki=None):  # noqa: E501
         """MigrateRepoForm - a model defined in Swagger"""  # noqa: E501
 
@@ -449,7 +456,7 @@ class MigrateRepoForm(object):
         if not isinstance(other, MigrateRepoForm):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,6 +52,11 @@ class Milestone(object):
         'title': 'title'
     }
 
+    __slots__ = (
+        '_closed_at', '_closed_issues', '_description', '_due_on',
+        '_id', '_open_issues', '_state', '_title', 'discriminator'
+    )
+
     def __init__(self, closed_at=None, closed_issues=None, description=None, due_on=None, id=None, open_issues=None, state=None, title=None):  # noqa: E501
         """Milestone - a model defined in Swagger"""  # noqa: E501
 
@@ -290,7 +295,7 @@ class Milestone(object):
         if not isinstance(other, Milestone):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -38,6 +38,8 @@ class NotificationCount(object):
         'new': 'new'
     }
 
+    __slots__ = ('_new', 'discriminator')
+
     def __init__(self, new=None):  # noqa: E501
         """NotificationCount - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +110,7 @@ class NotificationCount(object):
         if not isinstance(other, NotificationCount):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
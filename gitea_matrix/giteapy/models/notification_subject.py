@@ -44,6 +44,11 @@ class NotificationSubject(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_latest_comment_url', '_title', '_type', '_url',
+        'discriminator'
+    )
+
     def __init__(self, latest_comment_url=None, title=None, type=None, url=None):  # noqa: E501
         """NotificationSubject - a model defined in Swagger"""  # noqa: E501
 
@@ -186,7 +191,7 @@ class NotificationSubject(object):
         if not isinstance(other, NotificationSubject):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
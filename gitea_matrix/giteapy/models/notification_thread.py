@@ -50,6 +50,11 @@ class NotificationThread(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_id', '_pinned', '_repository', '_subject', '_unread',
+        '_updated_at', '_url', 'discriminator'
+    )
+
     def __init__(self, id=None, pinned=None, repository=None, subject=None, unread=None, updated_at=None, url=None):  # noqa: E501
         """NotificationThread - a model defined in Swagger"""  # noqa: E501
 
@@ -264,7 +269,7 @@ class NotificationThread(object):
         if not isinstance(other, NotificationThread):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -48,6 +48,11 @@ class OAuth2Application(object):
         'redirect_uris': 'redirect_uris'
     }
 
+    __slots__ = (
+        '_client_id', '_client_secret', '_created', '_id', '_name',
+        '_redirect_uris', 'discriminator'
+    )
+
     def __init__(self, client_id=None, client_secret=None, created=None, id=None, name=None, redirect_uris=None):  # noqa: E501
         """OAuth2Application - a model defined in Swagger"""  # noqa: E501
 
@@ -238,7 +243,7 @@ class OAuth2Application(object):
         if not isinstance(other, OAuth2Application):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,6 +54,12 @@ class Organization(object):
         'website': 'website'
     }
 
+    __slots__ = (
+        '_avatar_url', '_description', '_full_name', '_id', '_location',
+        '_repo_admin_change_team_access', '_username', '_visibility',
+        '_website', 'discriminator'
+    )
+
     def __init__(self, avatar_url=None, description=None, full_name=None, id=None, location=None, repo_admin_change_team_access=None, username=None, visibility=None, website=None):  # noqa: E501
         """Organization - a model defined in Swagger"""  # noqa: E501
 
@@ -316,7 +322,7 @@ class Organization(object):
         if not isinstance(other, Organization):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
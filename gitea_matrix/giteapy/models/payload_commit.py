@@ -56,6 +56,12 @@ class PayloadCommit(object):
         'verification': 'verification'
     }
 
+    __slots__ = (
+        '_added', '_author', '_committer', '_id', '_message',
+        '_modified', '_removed', '_timestamp', '_url', '_verification',
+        'discriminator'
+    )
+
     def __init__(self, added=None, author=None, committer=None, id=None, message=None, modified=None, removed=None, timestamp=None, url=None, verification=None):  # noqa: E501
         """PayloadCommit - a model defined in Swagger"""  # noqa: E501
 
@@ -344,7 +350,7 @@ class PayloadCommit(object):
         if not isinstance(other, PayloadCommit):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,11 @@ class PayloadCommitVerification(object):
         'verified': 'verified'
     }
 
+    __slots__ = (
+        '_payload', '_reason', '_signature', '_signer', '_verified',
+        'discriminator'
+    )
+
     def __init__(self, payload=None, reason=None, signature=None, signer=None, verified=None):  # noqa: E501
         """PayloadCommitVerification - a model defined in Swagger"""  # noqa: E501
 
@@ -212,7 +217,7 @@ class PayloadCommitVerification(object):
         if not isinstance(other, PayloadCommitVerification):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
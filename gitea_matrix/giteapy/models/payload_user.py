@@ -42,6 +42,8 @@ class PayloadUser(object):
         'username': 'username'
     }
 
+    __slots__ = ('_email', '_name', '_username', 'discriminator')
+
     def __init__(self, email=None, name=None, username=None):  # noqa: E501
         """PayloadUser - a model defined in Swagger"""  # noqa: E501
 
@@ -162,7 +164,7 @@ class PayloadUser(object):
         if not isinstance(other, PayloadUser):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
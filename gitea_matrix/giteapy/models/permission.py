@@ -42,6 +42,8 @@ class Permission(object):
         'push': 'push'
     }
 
+    __slots__ = ('_admin', '_pull', '_push', 'discriminator')
+
     def __init__(self, admin=None, pull=None, push=None):  # noqa: E501
         """Permission - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class Permission(object):
         if not isinstance(other, Permission):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
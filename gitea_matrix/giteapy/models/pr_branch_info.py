@@ -46,6 +46,10 @@ class PRBranchInfo(object):
         'sha': 'sha'
     }
 
+    __slots__ = (
+        '_label', '_ref', '_repo', '_repo_id', '_sha', 'discriminator'
+    )
+
     def __init__(self, label=None, ref=None, repo=None, repo_id=None, sha=None):  # noqa: E501
         """PRBranchInfo - a model defined in Swagger"""  # noqa: E501
 
@@ -212,7 +216,7 @@ class PRBranchInfo(object):
         if not isinstance(other, PRBranchInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
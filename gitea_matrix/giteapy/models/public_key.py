@@ -54,6 +54,11 @@ class PublicKey(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_created_at', '_fingerprint', '_id', '_key', '_key_type',
+        '_read_only', '_title', '_url', '_user', 'discriminator'
+    )
+
     def __init__(self, created_at=None, fingerprint=None, id=None, key=None, key_type=None, read_only=None, title=None, url=None, user=None):  # noqa: E501
         """PublicKey - a model defined in Swagger"""  # noqa: E501
 
@@ -316,7 +321,7 @@ class PublicKey(object):
         if not isinstance(other, PublicKey):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
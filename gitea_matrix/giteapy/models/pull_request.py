@@ -90,6 +90,15 @@ class PullRequest(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_assignee', '_assignees', '_base', '_body', '_closed_at',
+        '_comments', '_created_at', '_diff_url', '_due_date', '_head',
+        '_html_url', '_id', '_labels', '_merge_base',
+        '_merge_commit_sha', '_mergeable', '_merged', '_merged_at',
+        '_merged_by', '_milestone', '_number', '_patch_url', '_state',
+        '_title', '_updated_at', '_url', '_user', 'discriminator'
+    )
+
     def __init__(self, assignee=None, assignees=None, base=None, body=None, closed_at=None, comments=None, created_at=None, diff_url=None, due_date=None, head=None, html_url=None, id=None, labels=None, merge_base=None, merge_commit_sha=None, mergeable=None, merged=None, merged_at=None, merged_by=None, milestone=None, number=None, patch_url=None, state=None, title=None, updated_at=None, url=None, user=None):  # noqa: E501
         """PullRequest - a model defined in Swagger"""  # noqa: E501
 
@@ -784,7 +793,7 @@ class PullRequest(object):
         if not isinstance(other, PullRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
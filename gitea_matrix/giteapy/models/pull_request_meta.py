@@ -40,6 +40,8 @@ class PullRequestMeta(object):
         'merged_at': 'merged_at'
     }
 
+    __slots__ = ('_merged', '_merged_at', 'discriminator')
+
     def __init__(self, merged=None, merged_at=None):  # noqa: E501
         """PullRequestMeta - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class PullRequestMeta(object):
         if not isinstance(other, PullRequestMeta):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
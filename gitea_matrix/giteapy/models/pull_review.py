@@ -58,6 +58,12 @@ class PullReview(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_body', '_comments_count', '_commit_id', '_html_url', '_id',
+        '_official', '_pull_request_url', '_stale', '_state',
+        '_submitted_at', '_user', 'discriminator'
+    )
+
     def __init__(self, body=None, comments_count=None, commit_id=None, html_url=None, id=None, official=None, pull_request_url=None, stale=None, state=None, submitted_at=None, user=None):  # noqa: E501
         """PullReview - a model defined in Swagger"""  # noqa: E501
 
@@ -368,7 +374,7 @@ class PullReview(object):
         if not isinstance(other, PullReview):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -64,6 +64,13 @@ class PullReviewComment(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_body', '_commit_id', '_created_at', '_diff_hunk', '_html_url',
+        '_id', '_original_commit_id', '_original_position', '_path',
+        '_position', '_pull_request_review_id', '_pull_request_url',
+        '_updated_at', '_user', 'discriminator'
+    )
+
     def __init__(self, body=None, commit_id=None, created_at=None, diff_hunk=None, html_url=None, id=None, original_commit_id=None, original_position=None, path=None, position=None, pull_request_review_id=None, pull_request_url=None, updated_at=None, user=None):  # noqa: E501
         """PullReviewComment - a model defined in Swagger"""  # noqa: E501
 
@@ -446,7 +453,7 @@ class PullReviewComment(object):
         if not isinstance(other, PullReviewComment):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
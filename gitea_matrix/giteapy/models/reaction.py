@@ -42,6 +42,8 @@ class Reaction(object):
         'user': 'user'
     }
 
+    __slots__ = ('_content', '_created_at', '_user', 'discriminator')
+
     def __init__(self, content=None, created_at=None, user=None):  # noqa: E501
         """Reaction - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class Reaction(object):
         if not isinstance(other, Reaction):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
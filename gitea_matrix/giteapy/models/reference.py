@@ -42,6 +42,8 @@ class Reference(object):
         'url': 'url'
     }
 
+    __slots__ = ('_object', '_ref', '_url', 'discriminator')
+
     def __init__(self, object=None, ref=None, url=None):  # noqa: E501
         """Reference - a model defined in Swagger"""  # noqa: E501
 
@@ -160,7 +162,7 @@ class Reference(object):
         if not isinstance(other, Reference):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -66,6 +66,13 @@ class Release(object):
         'zipball_url': 'zipball_url'
     }
 
+    __slots__ = (
+        '_assets', '_author', '_body', '_created_at', '_draft',
+        '_html_url', '_id', '_name', '_prerelease', '_published_at',
+        '_tag_name', '_tarball_url', '_target_commitish', '_url',
+        '_zipball_url', 'discriminator'
+    )
+
     def __init__(self, assets=None, author=None, body=None, created_at=None, draft=None, html_url=None, id=None, name=None, prerelease=None, published_at=None, tag_name=None, tarball_url=None, target_commitish=None, url=None, zipball_url=None):  # noqa: E501
         """Release - a model defined in Swagger"""  # noqa: E501
 
@@ -472,7 +479,7 @@ class Release(object):
         if not isinstance(other, Release):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,11 @@ class RepoCommit(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_author', '_committer', '_message', '_tree', '_url',
+        'discriminator'
+    )
+
     def __init__(self, author=None, committer=None, message=None, tree=None, url=None):  # noqa: E501
         """RepoCommit - a model defined in Swagger"""  # noqa: E501
 
@@ -212,7 +217,7 @@ class RepoCommit(object):
         if not isinstance(other, RepoCommit):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
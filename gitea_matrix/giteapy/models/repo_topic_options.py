@@ -38,6 +38,8 @@ class RepoTopicOptions(object):
         'topics': 'topics'
     }
 
+    __slots__ = ('_topics', 'discriminator')
+
     def __init__(self, topics=None):  # noqa: E501
         """RepoTopicOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -110,7 +112,7 @@ class RepoTopicOptions(object):
         if not isinstance(other, RepoTopicOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -116,6 +116,21 @@ class Repository(object):
         'website': 'website'
     }
 
+    __slots__ = (
+        '_allow_merge_commits', '_allow_rebase',
+        '_allow_rebase_explicit', '_allow_squash_merge', '_archived',
+        '_avatar_url', '_clone_url', '_created_at', '_default_branch',
+        '_description', '_empty', '_external_tracker', '_external_wiki',
+        '_fork', '_forks_count', '_full_name', '_has_issues',
+        '_has_pull_requests', '_has_wiki', '_html_url', '_id',
+        '_ignore_whitespace_conflicts', '_internal_tracker', '_mirror',
+        '_name', '_open_issues_count', '_open_pr_counter',
+        '_original_url', '_owner', '_parent', '_permissions',
+        '_private', '_release_counter', '_size', '_ssh_url',
+        '_stars_count', '_template', '_updated_at', '_watchers_count',
+        '_website', 'discriminator'
+    )
+
     def __init__(self, allow_merge_commits=None, allow_rebase=None, allow_rebase_explicit=None, allow_squash_merge=None, archived=None, avatar_url=None, clone_url=None, created_at=None, default_branch=None, description=None, empty=None, external_tracker=None, external_wiki=None, fork=None, forks_count=None, full_name=None, has_issues=None, has_pull_requests=None, has_wiki=None, html_url=None, id=None, ignore_whitespace_conflicts=None, internal_tracker=None, mirror=None, name=None, open_issues_count=None, open_pr_counter=None, original_url=None, owner=None, parent=None, permissions=None, private=None, release_counter=None, size=None, ssh_url=None, stars_count=None, template=None, updated_at=None, watchers_count=None, website=None):  # noqa: E501
         """Repository - a model defined in Swagger"""  # noqa: E501
 
@@ -1122,7 +1137,7 @@ class Repository(object):
         if not isinstance(other, Repository):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
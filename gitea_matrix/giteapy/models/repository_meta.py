@@ -44,6 +44,8 @@ class RepositoryMeta(object):
         'owner': 'owner'
     }
 
+    __slots__ = ('_full_name', '_id', '_name', '_owner', 'discriminator')
+
     def __init__(self, full_name=None, id=None, name=None, owner=None):  # noqa: E501
         """RepositoryMeta - a model defined in Swagger"""  # noqa: E501
 
@@ -186,7 +188,7 @@ class RepositoryMeta(object):
         if not isinstance(other, RepositoryMeta):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -38,6 +38,8 @@ class ServerVersion(object):
         'version': 'version'
     }
 
+    __slots__ = ('_version', 'discriminator')
+
     def __init__(self, version=None):  # noqa: E501
         """ServerVersion - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +110,7 @@ class ServerVersion(object):
         if not isinstance(other, ServerVersion):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -36,6 +36,8 @@ class StateType(object):
     attribute_map = {
     }
 
+    __slots__ = ('discriminator',)
+
     def __init__(self):  # noqa: E501
         """StateType - a model defined in Swagger"""  # noqa: E501
         self.discriminator = None
@@ -80,7 +82,7 @@ class StateType(object):
         if not isinstance(other, StateType):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,6 +54,11 @@ class Status(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_context', '_created_at', '_creator', '_description', '_id',
+        '_status', '_target_url', '_updated_at', '_url', 'discriminator'
+    )
+
     def __init__(self, context=None, created_at=None, creator=None, description=None, id=None, status=None, target_url=None, updated_at=None, url=None):  # noqa: E501
         """Status - a model defined in Swagger"""  # noqa: E501
 
@@ -316,7 +321,7 @@ class Status(object):
         if not isinstance(other, Status):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -40,6 +40,8 @@ class StopWatch(object):
         'issue_index': 'issue_index'
     }
 
+    __slots__ = ('_created', '_issue_index', 'discriminator')
+
     def __init__(self, created=None, issue_index=None):  # noqa: E501
         """StopWatch - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class StopWatch(object):
         if not isinstance(other, StopWatch):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -40,6 +40,8 @@ class SubmitPullReviewOptions(object):
         'event': 'event'
     }
 
+    __slots__ = ('_body', '_event', 'discriminator')
+
     def __init__(self, body=None, event=None):  # noqa: E501
         """SubmitPullReviewOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class SubmitPullReviewOptions(object):
         if not isinstance(other, SubmitPullReviewOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
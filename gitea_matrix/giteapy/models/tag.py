@@ -46,6 +46,11 @@ class Tag(object):
         'zipball_url': 'zipball_url'
     }
 
+    __slots__ = (
+        '_commit', '_id', '_name', '_tarball_url', '_zipball_url',
+        'discriminator'
+    )
+
     def __init__(self, commit=None, id=None, name=None, tarball_url=None, zipball_url=None):  # noqa: E501
         """Tag - a model defined in Swagger"""  # noqa: E501
 
@@ -212,7 +217,7 @@ class Tag(object):
         if not isinstance(other, Tag):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
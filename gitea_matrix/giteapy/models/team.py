@@ -52,6 +52,12 @@ class Team(object):
         'units': 'units'
     }
 
+    __slots__ = (
+        '_can_create_org_repo', '_description', '_id',
+        '_includes_all_repositories', '_name', '_organization',
+        '_permission', '_units', 'discriminator'
+    )
+
     def __init__(self, can_create_org_repo=None, description=None, id=None, includes_all_repositories=None, name=None, organization=None, permission=None, units=None):  # noqa: E501
         """Team - a model defined in Swagger"""  # noqa: E501
 
@@ -296,7 +302,7 @@ class Team(object):
         if not isinstance(other, Team):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
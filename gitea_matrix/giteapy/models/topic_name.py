@@ -38,6 +38,8 @@ class TopicName(object):
         'topics': 'topics'
     }
 
+    __slots__ = ('_topics', 'discriminator')
+
     def __init__(self, topics=None):  # noqa: E501
         """TopicName - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +110,7 @@ class TopicName(object):
         if not isinstance(other, TopicName):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,11 @@ class TopicResponse(object):
         'updated': 'updated'
     }
 
+    __slots__ = (
+        '_created', '_id', '_repo_count', '_topic_name', '_updated',
+        'discriminator'
+    )
+
     def __init__(self, created=None, id=None, repo_count=None, topic_name=None, updated=None):  # noqa: E501
         """TopicResponse - a model defined in Swagger"""  # noqa: E501
 
@@ -212,7 +217,7 @@ class TopicResponse(object):
         if not isinstance(other, TopicResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
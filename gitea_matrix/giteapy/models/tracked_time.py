@@ -50,6 +50,11 @@ class TrackedTime(object):
         'user_name': 'user_name'
     }
 
+    __slots__ = (
+        '_created', '_id', '_issue', '_issue_id', '_time', '_user_id',
+        '_user_name', 'discriminator'
+    )
+
     def __init__(self, created=None, id=None, issue=None, issue_id=None, time=None, user_id=None, user_name=None):  # noqa: E501
         """TrackedTime - a model defined in Swagger"""  # noqa: E501
 
@@ -270,7 +275,7 @@ class TrackedTime(object):
         if not isinstance(other, TrackedTime):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
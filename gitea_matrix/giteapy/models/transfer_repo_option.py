@@ -40,6 +40,8 @@ class TransferRepoOption(object):
         'team_ids': 'team_ids'
     }
 
+    __slots__ = ('_new_owner', '_team_ids', 'discriminator')
+
     def __init__(self, new_owner=None, team_ids=None):  # noqa: E501
         """TransferRepoOption - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +139,7 @@ class TransferRepoOption(object):
         if not isinstance(other, TransferRepoOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
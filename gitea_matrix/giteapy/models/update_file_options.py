@@ -54,6 +54,11 @@ class UpdateFileOptions(object):
         'sha': 'sha'
     }
 
+    __slots__ = (
+        '_author', '_branch', '_committer', '_content', '_dates',
+        '_from_path', '_message', '_new_branch', '_sha', 'discriminator'
+    )
+
     def __init__(self, author=None, branch=None, committer=None, content=None, dates=None, from_path=None, message=None, new_branch=None, sha=None):  # noqa: E501
         """UpdateFileOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -330,7 +335,7 @@ class UpdateFileOptions(object):
         if not isinstance(other, UpdateFileOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,6 +54,12 @@ class User(object):
         'login': 'login'
     }
 
+    __slots__ = (
+        '_avatar_url', '_created', '_email', '_full_name', '_id',
+        '_is_admin', '_language', '_last_login', '_login',
+        'discriminator'
+    )
+
     def __init__(self, avatar_url=None, created=None, email=None, full_name=None, id=None, is_admin=None, language=None, last_login=None, login=None):  # noqa: E501
         """User - a model defined in Swagger"""  # noqa: E501
 
@@ -328,7 +334,7 @@ class User(object):
         if not isinstance(other, User):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -40,6 +40,8 @@ class UserHeatmapData(object):
         'timestamp': 'timestamp'
     }
 
+    __slots__ = ('_contributions', '_timestamp', 'discriminator')
+
     def __init__(self, contributions=None, timestamp=None):  # noqa: E501
         """UserHeatmapData - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +136,7 @@ class UserHeatmapData(object):
         if not isinstance(other, UserHeatmapData):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
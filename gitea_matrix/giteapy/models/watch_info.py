@@ -48,6 +48,11 @@ class WatchInfo(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_created_at', '_ignored', '_reason', '_repository_url',
+        '_subscribed', '_url', 'discriminator'
+    )
+
     def __init__(self, created_at=None, ignored=None, reason=None, repository_url=None, subscribed=None, url=None):  # noqa: E501
         """WatchInfo - a model defined in Swagger"""  # noqa: E501
 
@@ -238,7 +243,7 @@ class WatchInfo(object):
         if not isinstance(other, WatchInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -0,0 +1,63 @@
+# coding: utf-8
+
+"""
+    Read-only views over decoded JSON, returned by requests in raw mode
+    instead of models.
+"""
+
+from __future__ import absolute_import
+
+
+def wrap(value):
+    """Wraps JSON objects in a JSONView, also inside lists."""
+    if isinstance(value, dict):
+        return JSONView(value)
+    if isinstance(value, list):
+        return [wrap(item) for item in value]
+    return value
+
+
+class JSONView(object):
+    """Attribute access to a decoded JSON object.
+
+    Attributes are the JSON keys, missing keys read as None like unset
+    model attributes. Nested objects are wrapped when they are accessed,
+    and values are not converted, so dates stay strings.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        object.__setattr__(self, '_data', data)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return wrap(self._data.get(name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("JSONView is read-only")
+
+    def __getitem__(self, key):
+        return wrap(self._data[key])
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __reduce__(self):
+        return JSONView, (self._data,)
+
+    def to_dict(self):
+        """Returns the underlying dict"""
+        return self._data
+
+    def __repr__(self):
+        return "JSONView({!r})".format(self._data)
+
+    def __eq__(self, other):
+        if not isinstance(other, JSONView):
+            return False
+        return self._data == other._data
+
+    def __ne__(self, other):
+        return not self == other
@@ -19,51 +19,38 @@ import logging
 import re
 import ssl
 
+import aiohttp
 import certifi
 # python 2 and python 3 compatibility library
 import six
 from six.moves.urllib.parse import urlencode
 
-try:
-    import urllib3
-except ImportError:
-    raise ImportError('Swagger python client requires urllib3.')
-
 
 logger = logging.getLogger(__name__)
 
 
 class RESTResponse(io.IOBase):
 
-    def __init__(self, resp):
-        self.urllib3_response = resp
+    def __init__(self, resp, data):
+        self.aiohttp_response = resp
         self.status = resp.status
         self.reason = resp.reason
-        self.data = resp.data
+        self.data = data
 
     def getheaders(self):
         """Returns a dictionary of the response headers."""
-        return self.urllib3_response.getheaders()
+        return self.aiohttp_response.headers
 
     def getheader(self, name, default=None):
         """Returns a given response header."""
-        return self.urllib3_response.getheader(name, default)
+        return self.aiohttp_response.headers.get(name, default)
 
 
 class RESTClientObject(object):
 
     def __init__(self, configuration, pools_size=4, maxsize=None):
-        # urllib3.PoolManager will pass all kw parameters to connectionpool
-        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
-        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
         # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
-        # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
-
-        # cert_reqs
-        if configuration.verify_ssl:
-            cert_reqs = ssl.CERT_REQUIRED
-        else:
-            cert_reqs = ssl.CERT_NONE
+        # Custom SSL certificates and client certificates: https://docs.aiohttp.org/en/stable/client_advanced.html#ssl-control-for-tcp-sockets  # noqa: E501
 
         # ca_certs
         if configuration.ssl_ca_cert:
@@ -72,9 +59,13 @@ class RESTClientObject(object):
             # if not set certificate file, use Mozilla's root certificates.
             ca_certs = certifi.where()
 
-        addition_pool_args = {}
-        if configuration.assert_hostname is not None:
-            addition_pool_args['assert_hostname'] = configuration.assert_hostname  # noqa: E501
+        ssl_context = ssl.create_default_context(cafile=ca_certs)
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+        if configuration.assert_hostname is False:
+            ssl_context.check_hostname = False
 
         if maxsize is None:
             if configuration.connection_pool_maxsize is not None:
@@ -82,32 +73,21 @@ class RESTClientObject(object):
             else:
                 maxsize = 4
 
-        # https pool manager
-        if configuration.proxy:
-            self.pool_manager = urllib3.ProxyManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                proxy_url=configuration.proxy,
-                **addition_pool_args
-            )
-        else:
-            self.pool_manager = urllib3.PoolManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                **addition_pool_args
-            )
+        connector = aiohttp.TCPConnector(
+            limit=maxsize,
+            ssl=ssl_context if configuration.verify_ssl else False
+        )
 
-    def request(self, method, url, query_params=None, headers=None,
-                body=None, post_params=None, _preload_content=True,
-                _request_timeout=None):
+        self.proxy = configuration.proxy
+        self.pool_manager = aiohttp.ClientSession(connector=connector)
+
+    async def close(self):
+        """Closes the underlying aiohttp session and its connections."""
+        await self.pool_manager.close()
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None):
         """Perform requests.
 
         :param method: http request method
@@ -118,9 +98,9 @@ class RESTClientObject(object):
         :param post_params: request post parameters,
                             `application/x-www-form-urlencoded`
                             and `multipart/form-data`
-        :param _preload_content: if False, the urllib3.HTTPResponse object will
-                                 be returned without reading/decoding response
-                                 data. Default is True.
+        :param _preload_content: if False, the aiohttp.ClientResponse object
+                                 will be returned without reading/decoding
+                                 response data. Default is True.
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -140,86 +120,75 @@ class RESTClientObject(object):
 
         timeout = None
         if _request_timeout:
-            if isinstance(_request_timeout, (int, ) if six.PY3 else (int, long)):  # noqa: E501,F821
-                timeout = urllib3.Timeout(total=_request_timeout)
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
             elif (isinstance(_request_timeout, tuple) and
                   len(_request_timeout) == 2):
-                timeout = urllib3.Timeout(
-                    connect=_request_timeout[0], read=_request_timeout[1])
+                timeout = aiohttp.ClientTimeout(
+                    connect=_request_timeout[0],
+                    sock_read=_request_timeout[1])
 
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
 
-        try:
-            # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
-            if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
-                if query_params:
-                    url += '?' + urlencode(query_params)
-                if re.search('json', headers['Content-Type'], re.IGNORECASE):
-                    request_body = '{}'
-                    if body is not None:
-                        request_body = json.dumps(body)
-                    r = self.pool_manager.request(
-                        method, url,
-                        body=request_body,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
-                    r = self.pool_manager.request(
-                        method, url,
-                        fields=post_params,
-                        encode_multipart=False,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                elif headers['Content-Type'] == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct
-                    # Content-Type which generated by urllib3 will be
-                    # overwritten.
-                    del headers['Content-Type']
-                    r = self.pool_manager.request(
-                        method, url,
-                        fields=post_params,
-                        encode_multipart=True,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                # Pass a `string` parameter directly in the body to support
-                # other content types than Json when `body` argument is
-                # provided in serialized form
-                elif isinstance(body, str):
-                    request_body = body
-                    r = self.pool_manager.request(
-                        method, url,
-                        body=request_body,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                else:
-                    # Cannot generate the request from given parameters
-                    msg = """Cannot prepare a request message for provided
-                             arguments. Please check that your arguments match
-                             declared content type."""
-                    raise ApiException(status=0, reason=msg)
-            # For `GET`, `HEAD`
+        if query_params:
+            url += '?' + urlencode(query_params)
+
+        args = {
+            "method": method,
+            "url": url,
+            "headers": headers,
+            "proxy": self.proxy,
+        }
+        if timeout is not None:
+            args["timeout"] = timeout
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                request_body = '{}'
+                if body is not None:
+                    request_body = json.dumps(body)
+                args["data"] = request_body
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
+                data = aiohttp.FormData()
+                for k, v in six.iteritems(post_params) if isinstance(post_params, dict) else post_params:  # noqa: E501
+                    data.add_field(k, v)
+                args["data"] = data
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by aiohttp will be
+                # overwritten.
+                del headers['Content-Type']
+                data = aiohttp.FormData()
+                for k, v in six.iteritems(post_params) if isinstance(post_params, dict) else post_params:  # noqa: E501
+                    if isinstance(v, tuple):
+                        data.add_field(k, v[1], filename=v[0],
+                                       content_type=v[2])
+                    else:
+                        data.add_field(k, v)
+                args["data"] = data
+            # Pass a `string` parameter directly in the body to support
+            # other content types than Json when `body` argument is
+            # provided in serialized form
+            elif isinstance(body, str):
+                args["data"] = body
             else:
-                r = self.pool_manager.request(method, url,
-                                              fields=query_params,
-                                              preload_content=_preload_content,
-                                              timeout=timeout,
-                                              headers=headers)
-        except urllib3.exceptions.SSLError as e:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        try:
+            r = await self.pool_manager.request(**args)
+        except aiohttp.ClientSSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
 
         if _preload_content:
-            r = RESTResponse(r)
-
-            # In the python 3, the response.data is bytes.
-            # we need to decode it to string.
-            if six.PY3:
-                r.data = r.data.decode('utf8')
+            data = await r.read()
+            r = RESTResponse(r, data.decode('utf8'))
 
             # log response body
             logger.debug("response body: %s", r.data)
@@ -229,70 +198,70 @@ class RESTClientObject(object):
 
         return r
 
-    def GET(self, url, headers=None, query_params=None, _preload_content=True,
-            _request_timeout=None):
-        return self.request("GET", url,
-                            headers=headers,
-                            _preload_content=_preload_content,
-                            _request_timeout=_request_timeout,
-                            query_params=query_params)
-
-    def HEAD(self, url, headers=None, query_params=None, _preload_content=True,
-             _request_timeout=None):
-        return self.request("HEAD", url,
-                            headers=headers,
-                            _preload_content=_preload_content,
-                            _request_timeout=_request_timeout,
-                            query_params=query_params)
-
-    def OPTIONS(self, url, headers=None, query_params=None, post_params=None,
-                body=None, _preload_content=True, _request_timeout=None):
-        return self.request("OPTIONS", url,
-                            headers=headers,
-                            query_params=query_params,
-                            post_params=post_params,
-                            _preload_content=_preload_content,
-                            _request_timeout=_request_timeout,
-                            body=body)
-
-    def DELETE(self, url, headers=None, query_params=None, body=None,
-               _preload_content=True, _request_timeout=None):
-        return self.request("DELETE", url,
-                            headers=headers,
-                            query_params=query_params,
-                            _preload_content=_preload_content,
-                            _request_timeout=_request_timeout,
-                            body=body)
-
-    def POST(self, url, headers=None, query_params=None, post_params=None,
-             body=None, _preload_content=True, _request_timeout=None):
-        return self.request("POST", url,
-                            headers=headers,
-                            query_params=query_params,
-                            post_params=post_params,
-                            _preload_content=_preload_content,
-                            _request_timeout=_request_timeout,
-                            body=body)
-
-    def PUT(self, url, headers=None, query_params=None, post_params=None,
-            body=None, _preload_content=True, _request_timeout=None):
-        return self.request("PUT", url,
-                            headers=headers,
-                            query_params=query_params,
-                            post_params=post_params,
-                            _preload_content=_preload_content,
-                            _request_timeout=_request_timeout,
-                            body=body)
-
-    def PATCH(self, url, headers=None, query_params=None, post_params=None,
-              body=None, _preload_content=True, _request_timeout=None):
-        return self.request("PATCH", url,
-                            headers=headers,
-                            query_params=query_params,
-                            post_params=post_params,
-                            _preload_content=_preload_content,
-                            _request_timeout=_request_timeout,
-                            body=body)
+    async def GET(self, url, headers=None, query_params=None, _preload_content=True,
+                  _request_timeout=None):
+        return (await self.request("GET", url,
+                                   headers=headers,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   query_params=query_params))
+
+    async def HEAD(self, url, headers=None, query_params=None, _preload_content=True,
+                   _request_timeout=None):
+        return (await self.request("HEAD", url,
+                                   headers=headers,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   query_params=query_params))
+
+    async def OPTIONS(self, url, headers=None, query_params=None, post_params=None,
+                      body=None, _preload_content=True, _request_timeout=None):
+        return (await self.request("OPTIONS", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def DELETE(self, url, headers=None, query_params=None, body=None,
+                     _preload_content=True, _request_timeout=None):
+        return (await self.request("DELETE", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def POST(self, url, headers=None, query_params=None, post_params=None,
+                   body=None, _preload_content=True, _request_timeout=None):
+        return (await self.request("POST", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def PUT(self, url, headers=None, query_params=None, post_params=None,
+                  body=None, _preload_content=True, _request_timeout=None):
+        return (await self.request("PUT", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def PATCH(self, url, headers=None, query_params=None, post_params=None,
+                    body=None, _preload_content=True, _request_timeout=None):
+        return (await self.request("PATCH", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
 
 
 class ApiException(Exception):
@@ -0,0 +1,191 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from collections import OrderedDict
+import asyncio
+import logging
+import time
+
+from .db import Database, HookInfo
+
+# Returns an awaitable that completes once the messages of the delivery were sent,
+# or None if nothing is sent.
+HookHandler = Callable[[HookInfo], Awaitable[Optional[Awaitable[Any]]]]
+
+
+class HookQueue:
+    """
+    Bounded queue of accepted webhook deliveries, drained by a fixed number
+    of workers.
+
+    If a database is given, every accepted delivery is stored until it has been
+    processed and its messages were sent, so deliveries that were already
+    answered with 202 survive a restart and are queued again by start().
+    """
+    queue: 'asyncio.Queue[Tuple[Optional[int], HookInfo]]'
+    workers: List[asyncio.Task]
+    removals: Set[asyncio.Task]
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, handler: HookHandler,
+                 log: logging.Logger, maxsize: int = 1000, worker_count: int = 4,
+                 db: Optional[Database] = None) -> None:
+        self.loop = loop
+        self.handler = handler
+        self.log = log
+        self.worker_count = worker_count
+        self.db = db
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.workers = []
+        self.removals = set()
+        self._restore_task = None
+
+    async def start(self) -> None:
+        self.workers = [self.loop.create_task(self._worker())
+                        for _ in range(self.worker_count)]
+        if self.db:
+            # Queries run in order, so deliveries submitted meanwhile are not included.
+            pending = await self.db.get_deliveries()
+            if pending:
+                self.log.info(f"Requeueing {len(pending)} stored webhook deliveries")
+                self._restore_task = self.loop.create_task(self._restore(pending))
+
+    async def stop(self, timeout: float = 1) -> None:
+        if self._restore_task:
+            self._restore_task.cancel()
+        if not self.queue.empty():
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                self.log.warning(f"Stopping with {self.queue.qsize()} webhook deliveries queued")
+        for worker in self.workers:
+            worker.cancel()
+        self.workers = []
+
+    async def close(self) -> None:
+        """
+        Wait for the stored deliveries whose messages are still being sent, call
+        after the sender was stopped.
+        """
+        if self.removals:
+            await asyncio.wait(list(self.removals))
+
+    async def submit(self, info: HookInfo) -> bool:
+        """Queue a delivery, returns False if the queue is full."""
+        if self.queue.full():
+            return False
+        seq = await self.db.add_delivery(info) if self.db else None
+        try:
+            self.queue.put_nowait((seq, info))
+        except asyncio.QueueFull:
+            # Other deliveries filled the queue while this one was stored.
+            if seq is not None:
+                await self.db.rm_delivery(seq)
+            return False
+        return True
+
+    async def _restore(self, pending: List[Tuple[int, HookInfo]]) -> None:
+        for item in pending:
+            await self.queue.put(item)
+
+    async def _worker(self) -> None:
+        while True:
+            seq, info = await self.queue.get()
+            sent = None
+            try:
+                sent = await self.handler(info)
+            except asyncio.CancelledError:
+                # Keep the stored delivery, it is requeued on the next start.
+                raise
+            except Exception:
+                self.log.error("Failed to handle Gitea event", exc_info=True)
+            if seq is not None:
+                if sent is None:
+                    await self._remove(seq)
+                else:
+                    task = self.loop.create_task(self._remove_when_sent(seq, sent))
+                    self.removals.add(task)
+                    task.add_done_callback(self.removals.discard)
+            self.queue.task_done()
+
+    async def _remove_when_sent(self, seq: int, sent: Awaitable[Any]) -> None:
+        try:
+            await sent
+        except asyncio.CancelledError:
+            # The messages were dropped on shutdown, requeue the delivery on the next start.
+            return
+        except Exception:
+            self.log.error("Failed to send Gitea event", exc_info=True)
+        await self._remove(seq)
+
+    async def _remove(self, seq: int) -> None:
+        try:
+            await self.db.rm_delivery(seq)
+        except Exception:
+            self.log.error("Failed to remove stored webhook delivery", exc_info=True)
+
+
+class DeliveryCache:
+    """
+    Remembers the X-Gitea-Delivery IDs of accepted deliveries for ttl seconds,
+    keeping at most maxsize IDs in memory.
+
+    If a database is given, the IDs are also stored there, so duplicates are
+    recognized after a restart or once they were evicted from memory.
+    """
+    seen: Dict[str, float]
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 86400,
+                 db: Optional[Database] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.db = db
+        self.seen = OrderedDict()
+        self._last_prune = 0.0
+
+    async def claim(self, delivery: str) -> bool:
+        """
+        Mark the delivery as seen, returns False if it already was. The ID is
+        marked in memory before the database is queried, so a duplicate that
+        arrives meanwhile is recognized.
+        """
+        now = time.time()
+        self._expire(now)
+        if delivery in self.seen:
+            return False
+        self.seen[delivery] = now
+        if self.db and await self.db.has_seen_delivery(delivery, now - self.ttl):
+            return False
+        return True
+
+    def release(self, delivery: str) -> None:
+        """Forget a claimed delivery that was not accepted, so Gitea can retry it."""
+        self.seen.pop(delivery, None)
+
+    async def store(self, delivery: str) -> None:
+        """Store an accepted delivery in the database."""
+        now = time.time()
+        if self.db:
+            await self.db.add_seen_delivery(delivery, now)
+            if now - self._last_prune > self.ttl / 10:
+                self._last_prune = now
+                await self.db.prune_seen_deliveries(now - self.ttl)
+
+    def _expire(self, now: float) -> None:
+        deadline = now - self.ttl
+        while self.seen:
+            delivery, seen_at = next(iter(self.seen.items()))
+            if seen_at >= deadline and len(self.seen) <= self.maxsize:
+                break
+            del self.seen[delivery]
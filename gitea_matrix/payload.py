@@ -0,0 +1,39 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from typing import Any, Callable
+import importlib
+import json
+
+JSONLoads = Callable[[bytes], Any]
+
+# Tried in this order by the "auto" backend, all of them accept bytes.
+BACKENDS = ("orjson", "ujson", "json")
+
+
+def get_loads(backend: str = "auto") -> JSONLoads:
+    """
+    Return the loads function of the given JSON module. "auto" picks the
+    fastest one that is installed, falling back to the standard library.
+    """
+    if backend == "json":
+        return json.loads
+    names = BACKENDS if backend == "auto" else (backend,)
+    for name in names:
+        try:
+            return importlib.import_module(name).loads
+        except ImportError:
+            if backend != "auto":
+                raise
+    return json.loads
@@ -0,0 +1,128 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple
+from collections import deque
+import asyncio
+import logging
+
+from mautrix.errors import MLimitExceeded
+from mautrix.types import EventID, RoomID
+
+SendFunc = Callable[[], Awaitable[EventID]]
+QueuedMessage = Tuple[SendFunc, 'asyncio.Future[Optional[EventID]]']
+
+
+class TokenBucket:
+    """Allows rate sends per second on average, with bursts of up to burst sends."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, rate: float, burst: int) -> None:
+        self.loop = loop
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = loop.time()
+
+    async def acquire(self) -> None:
+        while True:
+            now = self.loop.time()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class RoomSender:
+    """
+    Sends messages to Matrix rooms in order, through one FIFO queue per room.
+
+    All rooms share a token bucket, and a room whose sends are rate limited by
+    the homeserver retries the message with exponential backoff. mautrix does
+    not expose the retry_after_ms of the error, so the backoff cannot use it.
+    """
+    queues: Dict[RoomID, Deque[QueuedMessage]]
+    workers: Dict[RoomID, asyncio.Task]
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, log: logging.Logger,
+                 rate: float = 5, burst: int = 10, max_retries: int = 5,
+                 queue_size: int = 100) -> None:
+        self.loop = loop
+        self.log = log
+        self.bucket = TokenBucket(loop, rate, burst)
+        self.max_retries = max_retries
+        self.queue_size = queue_size
+        self.queues = {}
+        self.workers = {}
+
+    def send(self, room_id: RoomID, func: SendFunc) -> 'asyncio.Future[Optional[EventID]]':
+        """
+        Queue a send for the room. The returned future resolves to the event ID,
+        or to None if the message could not be sent.
+        """
+        future = self.loop.create_future()
+        queue = self.queues.setdefault(room_id, deque())
+        if len(queue) > 1 and len(queue) >= self.queue_size:
+            # The first message may be in flight, drop the oldest waiting one.
+            _, dropped = queue[1]
+            del queue[1]
+            dropped.set_result(None)
+            self.log.warning(f"Outgoing queue for {room_id} is full, dropped the oldest message")
+        queue.append((func, future))
+        if room_id not in self.workers:
+            self.workers[room_id] = self.loop.create_task(self._worker(room_id))
+        return future
+
+    async def stop(self, timeout: float = 1) -> None:
+        """Send the queued messages for up to timeout seconds, then cancel the rest."""
+        if self.workers:
+            await asyncio.wait(list(self.workers.values()), timeout=timeout)
+        for worker in self.workers.values():
+            worker.cancel()
+        for queue in self.queues.values():
+            for _, future in queue:
+                future.cancel()
+        self.workers = {}
+        self.queues = {}
+
+    async def _worker(self, room_id: RoomID) -> None:
+        queue = self.queues[room_id]
+        try:
+            while queue:
+                func, future = queue[0]
+                event_id = await self._send(room_id, func)
+                queue.popleft()
+                if not future.done():
+                    future.set_result(event_id)
+        finally:
+            self.workers.pop(room_id, None)
+            if not queue:
+                self.queues.pop(room_id, None)
+
+    async def _send(self, room_id: RoomID, func: SendFunc) -> Optional[EventID]:
+        delay = 1.0
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            try:
+                return await func()
+            except MLimitExceeded:
+                self.log.debug(f"Rate limited while sending to {room_id}, retrying in {delay}s")
+                await asyncio.sleep(delay)
+                delay *= 2
+            except Exception:
+                self.log.error(f"Failed to send message to {room_id}", exc_info=True)
+                return None
+        self.log.error(f"Giving up sending message to {room_id} after {self.max_retries} retries")
+        return None
@@ -0,0 +1,157 @@
+# maugitea - A Gitea client and webhook receiver for maubot
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from typing import Dict, List, Optional
+from collections import OrderedDict
+
+from mautrix.types import UserID
+
+from .db import AliasInfo, AuthInfo, Database
+
+
+class UserData:
+    """The aliases and tokens of one user, each loaded on first use."""
+    server_aliases: Optional[Dict[str, str]]
+    repos_aliases: Optional[Dict[str, str]]
+    logins: Optional[Dict[str, AuthInfo]]
+
+    def __init__(self) -> None:
+        self.server_aliases = None
+        self.repos_aliases = None
+        self.logins = None
+
+
+class UserCache:
+    """
+    Write-through cache of the server aliases, repository aliases and tokens
+    of the maxsize most recently active users. Tokens are kept decrypted, so
+    they are only decrypted when a user's data is loaded.
+
+    All changes go through the cache, which writes them to the database and
+    then updates the loaded data, so it never has to be invalidated.
+    """
+    users: 'OrderedDict[UserID, UserData]'
+
+    def __init__(self, db: Database, maxsize: int = 1000) -> None:
+        self.db = db
+        self.maxsize = maxsize
+        self.users = OrderedDict()
+
+    def _user(self, user_id: UserID) -> UserData:
+        try:
+            self.users.move_to_end(user_id)
+            return self.users[user_id]
+        except KeyError:
+            user = self.users[user_id] = UserData()
+            while len(self.users) > self.maxsize:
+                self.users.popitem(last=False)
+            return user
+
+    # region server aliases
+
+    async def _server_aliases(self, user_id: UserID) -> Dict[str, str]:
+        user = self._user(user_id)
+        if user.server_aliases is None:
+            user.server_aliases = {info.alias: info.server
+                                   for info in await self.db.get_server_aliases(user_id)}
+        return user.server_aliases
+
+    async def get_server_aliases(self, user_id: UserID) -> List[AliasInfo]:
+        return [AliasInfo(server, alias)
+                for alias, server in (await self._server_aliases(user_id)).items()]
+
+    async def get_server_alias(self, user_id: UserID, alias: str) -> Optional[str]:
+        return (await self._server_aliases(user_id)).get(alias)
+
+    async def add_server_alias(self, user_id: UserID, url: str, alias: str) -> bool:
+        if not await self.db.add_server_alias(user_id, url, alias):
+            return False
+        aliases = self._user(user_id).server_aliases
+        if aliases is not None:
+            aliases[alias] = url
+        return True
+
+    async def rm_server_alias(self, user_id: UserID, alias: str) -> None:
+        await self.db.rm_server_alias(user_id, alias)
+        aliases = self._user(user_id).server_aliases
+        if aliases is not None:
+            aliases.pop(alias, None)
+
+    # endregion
+
+    # region repository aliases
+
+    async def _repos_aliases(self, user_id: UserID) -> Dict[str, str]:
+        user = self._user(user_id)
+        if user.repos_aliases is None:
+            user.repos_aliases = {info.alias: info.server
+                                  for info in await self.db.get_repos_aliases(user_id)}
+        return user.repos_aliases
+
+    async def get_repos_aliases(self, user_id: UserID) -> List[AliasInfo]:
+        return [AliasInfo(repos, alias)
+                for alias, repos in (await self._repos_aliases(user_id)).items()]
+
+    async def get_repos_alias(self, user_id: UserID, alias: str) -> Optional[str]:
+        return (await self._repos_aliases(user_id)).get(alias)
+
+    async def add_repos_alias(self, user_id: UserID, repos: str, alias: str) -> bool:
+        if not await self.db.add_repos_alias(user_id, repos, alias):
+            return False
+        aliases = self._user(user_id).repos_aliases
+        if aliases is not None:
+            aliases[alias] = repos
+        return True
+
+    async def rm_repos_alias(self, user_id: UserID, alias: str) -> None:
+        await self.db.rm_repos_alias(user_id, alias)
+        aliases = self._user(user_id).repos_aliases
+        if aliases is not None:
+            aliases.pop(alias, None)
+
+    # endregion
+
+    # region tokens
+
+    async def _logins(self, user_id: UserID) -> Dict[str, AuthInfo]:
+        user = self._user(user_id)
+        if user.logins is None:
+            user.logins = {info.server: info for info in await self.db.get_logins(user_id)}
+        return user.logins
+
+    async def get_servers(self, user_id: UserID) -> List[str]:
+        return list(await self._logins(user_id))
+
+    async def get_login(self, user_id: UserID, url: str) -> Optional[AuthInfo]:
+        return (await self._logins(user_id)).get(url)
+
+    async def add_login(self, user_id: UserID, info: AuthInfo) -> None:
+        await self.db.add_login(user_id, info)
+        logins = self._user(user_id).logins
+        if logins is not None:
+            logins[info.server] = info
+
+    async def rm_login(self, user_id: UserID, url: str) -> None:
+        await self.db.rm_login(user_id, url)
+        logins = self._user(user_id).logins
+        if logins is not None:
+            logins.pop(url, None)
+
+    # endregion
+
+    async def resolve_server_alias(self, user_id: UserID, url: str) -> str:
+        return await self.get_server_alias(user_id, url) or url
+
+    async def resolve_repos_alias(self, user_id: UserID, repo: str) -> str:
+        return await self.get_repos_alias(user_id, repo) or repo
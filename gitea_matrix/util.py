@@ -12,20 +12,27 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from typing import Any, Callable, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import hashlib
+import hmac
+import inspect
 
-from . import giteapy as giteapy
-from .giteapy import Configuration as Gtc
+from aiohttp.web import Request
+
+from .giteapy import ApiClient
 from .giteapy.rest import ApiException
 
 from maubot import MessageEvent
+from maubot.matrix import parse_formatted
 from maubot.handlers.command import Argument
+from mautrix.types import EventID, MessageEventContent
 
 from .db import AuthInfo
 
 from pprint import pprint
 
 class UrlOrAliasArgument(Argument):
+    """A server URL or alias, resolved by UserCache.resolve_server_alias()."""
     def __init__(self, name: str, label: str = None,
                  *, required: bool = False):
         super().__init__(name, label=label, required=required, pass_raw=True)
@@ -33,14 +40,10 @@ class UrlOrAliasArgument(Argument):
     def match(self, val: str, evt: MessageEvent, instance: 'GiteaBot', **kwargs
               ) -> Tuple[str, Any]:
         vals = val.split(" ")
-
-        serverurl = instance.db.get_server_alias(evt.sender, vals[0])
-
-        if serverurl:
-            return " ".join(vals[1:]), serverurl
         return " ".join(vals[1:]), vals[0]
 
 class ReposOrAliasArgument(Argument):
+    """A repository or alias, resolved by with_gitea_session."""
     def __init__(self, name: str, label: str = None,
                  *, required: bool = False):
         super().__init__(name, label=label, required=required, pass_raw=True)
@@ -48,24 +51,23 @@ class ReposOrAliasArgument(Argument):
     def match(self, val: str, evt: MessageEvent, instance: 'GiteaBot', **kwargs
               ) -> Tuple[str, Any]:
         vals = val.split(" ")
-
-        repos = instance.db.get_repos_alias(evt.sender, vals[0])
-
-        if repos:
-            return " ".join(vals[1:]), repos
         return " ".join(vals[1:]), vals[0]
 
-Decoratable = Callable[['GiteaBot', MessageEvent, Gtc, Any], Any]
+Decoratable = Callable[['GiteaBot', MessageEvent, ApiClient, Any], Any]
 Decorator = Callable[['GiteaBot', MessageEvent, AuthInfo, Any], Any]
 
 def with_gitea_session(func: Decoratable) -> Decorator:
     async def wrapper(self, evt: MessageEvent, url: str, **kwargs) -> Any:
         try:
-            aInfo = self.db.get_login(evt.sender, url)
-            gtc = giteapy.Configuration()
-            gtc.host = aInfo.server
-            gtc.api_key['access_token'] = aInfo.api_token
-            return await func(self, evt, gtc=gtc, **kwargs)
+            url = await self.users.resolve_server_alias(evt.sender, url)
+            if "repo" in kwargs:
+                kwargs["repo"] = await self.users.resolve_repos_alias(evt.sender, kwargs["repo"])
+            aInfo = await self.users.get_login(evt.sender, url)
+            if aInfo is None:
+                await evt.reply(f"You are not logged in to {url}.")
+                return
+            async with self.clients.client(aInfo.server, aInfo.api_token) as api_client:
+                return await func(self, evt, api_client=api_client, **kwargs)
         except ApiException as e:
             await evt.reply("Api Error.\n\n{0}".format(e))
         except Exception as e:
@@ -74,6 +76,51 @@ def with_gitea_session(func: Decoratable) -> Decorator:
 
     return wrapper
 
+async def read_body(request: Request, max_size: int) -> Optional[bytes]:
+    """Read the whole request body, or return None if it exceeds max_size bytes."""
+    if request.content_length is not None and request.content_length > max_size:
+        return None
+    body = bytearray()
+    async for chunk in request.content.iter_any():
+        body += chunk
+        if len(body) > max_size:
+            return None
+    return bytes(body)
+
+def verify_signature(body: bytes, signature: str, secrets: Iterable[bytes]) -> bool:
+    """Check a X-Gitea-Signature header, the hex HMAC-SHA256 of the body, against any of the secrets."""
+    signature = signature.strip().lower()
+    for secret in secrets:
+        digest = hmac.new(secret, body, hashlib.sha256).hexdigest()
+        if hmac.compare_digest(digest, signature):
+            return True
+    return False
+
+def thread_content(content: MessageEventContent, root: EventID) -> Dict[str, Any]:
+    """
+    Serialize the content as a message in the thread of root. Clients without
+    thread support show it as a reply to the root.
+    """
+    data = content.serialize()
+    data["m.relates_to"] = {
+        "rel_type": "m.thread",
+        "event_id": root,
+        "is_falling_back": True,
+        "m.in_reply_to": {"event_id": root},
+    }
+    return data
+
+async def render_markdown(message: str, allow_html: bool = False) -> Tuple[str, str]:
+    """
+    Render markdown to plain text and HTML. parse_formatted() is a coroutine
+    since maubot 0.3, so await its result where needed.
+    """
+    result = parse_formatted(message, allow_html=allow_html)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
 def sigil_int(val: str) -> int:
     if len(val) == 0:
         raise ValueError('No issue ID given')
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+
+from gitea_matrix.hookqueue import DeliveryCache, HookQueue
+
+
+class SlowDatabase:
+    """Answers the delivery queries after a delay, like a database in another thread."""
+
+    def __init__(self) -> None:
+        self.stored = set()
+
+    async def has_seen_delivery(self, delivery: str, since: float) -> bool:
+        await asyncio.sleep(0.01)
+        return delivery in self.stored
+
+    async def add_seen_delivery(self, delivery: str, seen_at: float) -> None:
+        await asyncio.sleep(0.01)
+        self.stored.add(delivery)
+
+    async def prune_seen_deliveries(self, before: float) -> None:
+        pass
+
+
+class DeliveryDatabase:
+    def __init__(self) -> None:
+        self.stored = {}
+
+    async def add_delivery(self, info) -> int:
+        seq = len(self.stored) + 1
+        self.stored[seq] = info
+        return seq
+
+    async def rm_delivery(self, seq: int) -> None:
+        del self.stored[seq]
+
+    async def get_deliveries(self):
+        return list(self.stored.items())
+
+
+def run_queue(outcome):
+    """Process one delivery whose message future ends with outcome, return the stored rows."""
+    async def run():
+        loop = asyncio.get_running_loop()
+        sent = loop.create_future()
+
+        async def handler(info):
+            return sent
+
+        db = DeliveryDatabase()
+        hooks = HookQueue(loop, handler, logging.getLogger("test"), db=db)
+        await hooks.start()
+        assert await hooks.submit("info")
+        await hooks.stop()
+        assert db.stored
+        outcome(sent)
+        await hooks.close()
+        return db.stored
+
+    return asyncio.run(run())
+
+
+def test_delivery_is_removed_once_sent():
+    assert run_queue(lambda sent: sent.set_result(None)) == {}
+
+
+def test_delivery_is_kept_if_sending_was_cancelled():
+    assert run_queue(lambda sent: sent.cancel()) == {1: "info"}
+
+
+def test_concurrent_duplicate_is_rejected():
+    async def run():
+        cache = DeliveryCache(db=SlowDatabase())
+        return await asyncio.gather(cache.claim("abc"), cache.claim("abc"))
+
+    assert sorted(asyncio.run(run())) == [False, True]
+
+
+def test_released_delivery_can_be_claimed_again():
+    async def run():
+        cache = DeliveryCache()
+        assert await cache.claim("abc")
+        cache.release("abc")
+        return await cache.claim("abc")
+
+    assert asyncio.run(run())
+
+
+def test_stored_delivery_is_seen_after_restart():
+    async def run():
+        db = SlowDatabase()
+        cache = DeliveryCache(db=db)
+        assert await cache.claim("abc")
+        await cache.store("abc")
+        return await DeliveryCache(db=db).claim("abc")
+
+    assert not asyncio.run(run())